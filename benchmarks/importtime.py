@@ -0,0 +1,125 @@
+"""
+Import-time guard for the script entry points.
+
+Each entry point is imported in a fresh interpreter under `python -X importtime`
+(best of --runs). It fails if:
+
+* a heavy library that should only load on demand shows up in the import
+  tree (matplotlib/mplfinance/seaborn for tut08; the grading core, openpyxl
+  or xlsxwriter for the Streamlit apps before a file is uploaded), or
+* with --baseline, an import got slower than tolerance x the saved time.
+
+Entry points whose own dependencies are not installed (e.g. streamlit) are
+reported as skipped.
+
+Usage:
+    python benchmarks/importtime.py [--runs 5] [--save baseline.json]
+    python benchmarks/importtime.py --baseline baseline.json [--tolerance 1.5]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# name -> (directory it runs from, module to import, top-level packages it must not load)
+ENTRY_POINTS = {
+    'tut08': ('tut08', 'tut08', ('matplotlib', 'mplfinance', 'seaborn')),
+    'tut10': ('tut10', 'tut10', ('grading', 'openpyxl', 'xlsxwriter')),
+    'tut11': ('tut11', 'tut11', ('grading', 'openpyxl', 'xlsxwriter')),
+    'grading.export': ('.', 'grading.export', ('xlsxwriter', 'openpyxl')),
+}
+
+
+def import_profile(directory, module):
+    """
+    Imports module in a fresh interpreter with -X importtime.
+
+    Returns:
+        dict: imported module name -> cumulative microseconds.
+
+    Raises:
+        ImportError: If the import fails (message is the child's last error line).
+    """
+    cwd = os.path.join(ROOT, directory)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [cwd, ROOT, os.environ.get('PYTHONPATH')])))
+    proc = subprocess.run([sys.executable, '-X', 'importtime', '-c', f"import {module}"],
+                          cwd=cwd, env=env, capture_output=True, text=True)
+    profile = {}
+    errors = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith('import time:'):
+            errors.append(line)
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # the column header
+        profile[fields[2].strip()] = int(fields[1])
+    if proc.returncode != 0:
+        raise ImportError(errors[-1] if errors else f"importing {module} failed")
+    return profile
+
+
+def measure(name, runs=5):
+    """
+    Returns:
+        dict: ms (best cumulative import time of the entry module), modules
+        (number imported) and forbidden (heavy packages that were loaded).
+    """
+    directory, module, forbidden = ENTRY_POINTS[name]
+    best = None
+    for _ in range(runs):
+        profile = import_profile(directory, module)
+        if best is None or profile[module] < best[module]:
+            best = profile
+    loaded = {m.split('.')[0] for m in best}
+    return {
+        'ms': best[module] / 1000,
+        'modules': len(best),
+        'forbidden': sorted(loaded.intersection(forbidden)),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Guard the import time of the script entry points.")
+    parser.add_argument('names', nargs='*', default=list(ENTRY_POINTS), help="Entry points to check")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--baseline', help="JSON of name -> ms to compare against")
+    parser.add_argument('--tolerance', type=float, default=1.5, help="Allowed slowdown factor over the baseline")
+    parser.add_argument('--save', help="Write the measured times as a new baseline")
+    args = parser.parse_args()
+
+    baseline = {}
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    failures = []
+    measured = {}
+    for name in args.names:
+        try:
+            result = measure(name, args.runs)
+        except ImportError as e:
+            print(f"{name:<16} skipped ({e})")
+            continue
+        measured[name] = round(result['ms'], 1)
+        line = f"{name:<16} {result['ms']:9.1f} ms  {result['modules']:5d} modules"
+        if result['forbidden']:
+            failures.append(name)
+            line += f"  FAIL: loads {', '.join(result['forbidden'])} at import"
+        if name in baseline and result['ms'] > baseline[name] * args.tolerance:
+            failures.append(name)
+            line += f"  FAIL: {result['ms'] / baseline[name]:.2f}x the baseline {baseline[name]:.1f} ms"
+        print(line)
+
+    if args.save:
+        with open(args.save, 'w') as f:
+            json.dump(measured, f, indent=2)
+    if failures:
+        sys.exit(f"Import-time regression in: {', '.join(sorted(set(failures)))}")
+
+
+if __name__ == "__main__":
+    main()
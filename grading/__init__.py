@@ -0,0 +1,15 @@
+"""Grading core shared by the tut10 / tut11 Streamlit apps and the batch CLI."""
+from .core import (
+    GRADES,
+    IAPC_RECO,
+    SCALE_RANGES,
+    TOTAL_COLUMN,
+    assign_grades,
+    grade_quota,
+    grade_statistics,
+    parse_workbook,
+    process_workbook,
+    rescale,
+    score,
+    summarize,
+)
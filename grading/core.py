@@ -0,0 +1,135 @@
+"""
+Grading pipeline shared by every front end: parse -> score -> grade -> rescale -> summarize.
+
+Only pandas and numpy are imported, so this can be used from scripts and worker
+processes without loading Streamlit.
+"""
+import numpy as np
+import pandas as pd
+
+GRADES = ['AA', 'AB', 'BB', 'BC', 'CC', 'CD', 'DD', 'F', 'I', 'PP', 'NP']
+
+# Old IAPC recommendation: percentage of the class receiving each grade
+IAPC_RECO = {'AA': 5, 'AB': 15, 'BB': 25, 'BC': 30, 'CC': 15, 'CD': 5, 'DD': 5,
+             'F': 0, 'I': 0, 'PP': 0, 'NP': 0}
+
+# Range (a, b) each grade's totals are linearly rescaled into
+SCALE_RANGES = {'AA': (91, 100), 'AB': (81, 90), 'BB': (71, 80), 'BC': (61, 70),
+                'CC': (51, 60), 'CD': (41, 50), 'DD': (31, 40), 'F': (0, 30)}
+
+TOTAL_COLUMN = 'Total Scaled/100'
+
+
+def parse_workbook(source, sheet_name=0):
+    """
+    Reads a course workbook laid out as: header row, Max Marks row, Weightage row,
+    then one row per student with Roll and Name in the first two columns.
+
+    Returns:
+        tuple: (students DataFrame, max marks Series, weightage Series). The two
+        Series are indexed by the marks columns that have both a max and a weight.
+    """
+    raw = pd.read_excel(source, sheet_name=sheet_name, header=0)
+    max_marks = pd.to_numeric(raw.iloc[0, 2:], errors='coerce')
+    weightage = pd.to_numeric(raw.iloc[1, 2:], errors='coerce')
+    components = max_marks.index[max_marks.notna() & weightage.notna()]
+
+    students = raw.iloc[2:]
+    students = students[students.iloc[:, 0].notna()].reset_index(drop=True)
+    return students, max_marks[components], weightage[components]
+
+
+def score(students, max_marks, weightage):
+    """Weighted total out of 100 for every student. Missing or non-numeric marks count as 0."""
+    marks = students[max_marks.index].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=float)
+    scaled = marks / max_marks.to_numpy(dtype=float) * weightage.to_numpy(dtype=float)
+    return pd.Series(np.nansum(scaled, axis=1), index=students.index, name=TOTAL_COLUMN)
+
+
+def grade_quota(total_students, reco=IAPC_RECO):
+    """Number of students per grade: the recommended percentage of the class, rounded."""
+    return {grade: int(np.round(percentage / 100 * total_students)) for grade, percentage in reco.items()}
+
+
+def assign_grades(students, totals, reco=IAPC_RECO):
+    """
+    Sorts students by total (highest first, ties keep input order) and hands out
+    grades in quota order. Students left over by rounding get the lowest grade with
+    a non-zero quota.
+
+    Returns:
+        pd.DataFrame: The students with TOTAL_COLUMN and Grade columns, best first.
+    """
+    totals = np.asarray(totals, dtype=float)
+    order = np.argsort(-totals, kind='stable')
+    graded = students.iloc[order].reset_index(drop=True)
+    graded[TOTAL_COLUMN] = totals[order]
+
+    quota = grade_quota(len(graded), reco)
+    labels = np.repeat(np.array(list(quota), dtype=object), list(quota.values()))
+    if len(labels) < len(graded):
+        lowest = [grade for grade, percentage in reco.items() if percentage > 0][-1]
+        labels = np.concatenate([labels, np.full(len(graded) - len(labels), lowest, dtype=object)])
+    graded['Grade'] = labels[:len(graded)]
+    return graded
+
+
+def grade_statistics(graded):
+    """Per-grade scaling range (a, b), min/max of the totals and student count."""
+    stats = pd.DataFrame({'Grade': GRADES})
+    stats['a'] = stats['Grade'].map(lambda g: SCALE_RANGES.get(g, (np.nan, np.nan))[0])
+    stats['b'] = stats['Grade'].map(lambda g: SCALE_RANGES.get(g, (np.nan, np.nan))[1])
+
+    agg = graded.groupby('Grade')[TOTAL_COLUMN].agg(['min', 'max', 'count'])
+    stats['min (x)'] = stats['Grade'].map(agg['min'])
+    stats['max (x)'] = stats['Grade'].map(agg['max'])
+    stats['Count'] = stats['Grade'].map(agg['count']).fillna(0).astype(int)
+    return stats
+
+
+def rescale(graded, stats):
+    """
+    Adds a Scaled column mapping each total linearly from its grade's [min, max]
+    onto [a, b]. A grade whose students all have the same total maps to b.
+    """
+    by_grade = stats.set_index('Grade')
+    grade = graded['Grade']
+    a = grade.map(by_grade['a']).to_numpy(dtype=float)
+    b = grade.map(by_grade['b']).to_numpy(dtype=float)
+    low = grade.map(by_grade['min (x)']).to_numpy(dtype=float)
+    high = grade.map(by_grade['max (x)']).to_numpy(dtype=float)
+    x = graded[TOTAL_COLUMN].to_numpy(dtype=float)
+
+    span = high - low
+    with np.errstate(divide='ignore', invalid='ignore'):
+        graded['Scaled'] = np.where(span > 0, a + (b - a) * (x - low) / span, b)
+    return graded
+
+
+def summarize(graded, reco=IAPC_RECO):
+    """Recommended vs. assigned count for every grade, with a Total row."""
+    total_students = len(graded)
+    counts = graded['Grade'].value_counts()
+
+    summary = pd.DataFrame({'Grade': GRADES})
+    summary['IAPC Reco'] = summary['Grade'].map(reco).fillna(0)
+    summary['Counts'] = summary['IAPC Reco'] / 100 * total_students
+    summary['Round'] = np.round(summary['Counts']).astype(int)
+    summary['Count Verified'] = summary['Grade'].map(counts).fillna(0).astype(int)
+    summary['Difference'] = summary['Count Verified'] - summary['Round']
+    summary.loc[len(summary)] = ['Total'] + summary.iloc[:, 1:].sum().tolist()
+    return summary
+
+
+def process_workbook(source, sheet_name=0, reco=IAPC_RECO):
+    """
+    Runs the full pipeline on one workbook.
+
+    Returns:
+        tuple: (graded students, grade statistics, grade summary) DataFrames.
+    """
+    students, max_marks, weightage = parse_workbook(source, sheet_name)
+    graded = assign_grades(students, score(students, max_marks, weightage), reco)
+    stats = grade_statistics(graded)
+    graded = rescale(graded, stats)
+    return graded, stats, summarize(graded, reco)
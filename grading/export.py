@@ -0,0 +1,167 @@
+"""
+Export helpers for graded course data.
+
+The graded students and the grade summary are written as separate sheets,
+row by row, with a constant-memory writer: xlsxwriter in constant_memory mode
+when it is installed, otherwise openpyxl's write-only workbook. Very large
+classes can be exported as CSV or Parquet instead (one file per sheet, zipped).
+Parquet needs pyarrow or fastparquet; available_formats() lists it only when
+one of them is installed.
+"""
+import importlib.util
+import io
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+
+EXPORT_FORMATS = {
+    'xlsx': ('output.xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'),
+    'csv': ('output_csv.zip', 'application/zip'),
+    'parquet': ('output_parquet.zip', 'application/zip'),
+}
+
+
+def available_formats():
+    """The EXPORT_FORMATS usable here: parquet only with a Parquet engine installed."""
+    has_engine = any(importlib.util.find_spec(name) for name in ('pyarrow', 'fastparquet'))
+    return [fmt for fmt in EXPORT_FORMATS if fmt != 'parquet' or has_engine]
+
+
+def _xlsxwriter():
+    # Imported on first export rather than with the module; None selects openpyxl write-only mode
+    try:
+        import xlsxwriter
+    except ImportError:
+        return None
+    return xlsxwriter
+
+
+def grade_sheets(df_with_grades, summary_df, stats_df=None):
+    """
+    Returns the sheets of a graded course as (name, DataFrame, row order) tuples.
+    The roll-sorted sheet reuses the graded DataFrame with a row order instead of
+    a sorted copy.
+    """
+    roll_order = np.argsort(df_with_grades['Roll'].astype(str).to_numpy(), kind='stable')
+    sheets = [
+        ('Grade_Sorted', df_with_grades, None),
+        ('Roll_Sorted', df_with_grades, roll_order),
+        ('Summary', summary_df, None),
+    ]
+    if stats_df is not None:
+        sheets.append(('Grade_Statistics', stats_df, None))
+    return sheets
+
+
+def _column_values(df):
+    # One object array per column, with missing values as None so both writers accept them
+    columns = []
+    for col in df.columns:
+        # A copy: pandas may hand back a read-only view of an object column
+        values = np.array(df[col].to_numpy(dtype=object), copy=True)
+        values[pd.isna(values)] = None
+        columns.append(values)
+    return columns
+
+
+def iter_rows(df, order=None, columns=None):
+    """Yields the rows of df as lists, in the given row order, without copying the frame."""
+    if columns is None:
+        columns = _column_values(df)
+    rows = range(len(df)) if order is None else order
+    for i in rows:
+        yield [values[i] for values in columns]
+
+
+def write_excel(sheets, target=None):
+    """
+    Streams sheets into an xlsx workbook.
+
+    Args:
+        sheets (list): (sheet name, DataFrame, row order or None) tuples.
+        target: Output path or binary buffer. Defaults to a new in-memory buffer.
+
+    Returns:
+        bytes: The workbook contents when no target is given, otherwise None.
+    """
+    buffer = io.BytesIO() if target is None else target
+    cache = {}
+
+    def rows_of(df, order):
+        if id(df) not in cache:
+            cache[id(df)] = _column_values(df)
+        yield [str(col) for col in df.columns]
+        yield from iter_rows(df, order, cache[id(df)])
+
+    xlsxwriter = _xlsxwriter()
+    if xlsxwriter is not None:
+        workbook = xlsxwriter.Workbook(buffer, {'constant_memory': True})
+        for name, df, order in sheets:
+            worksheet = workbook.add_worksheet(name)
+            for r, row in enumerate(rows_of(df, order)):
+                worksheet.write_row(r, 0, row)
+        workbook.close()
+    else:
+        from openpyxl import Workbook
+        workbook = Workbook(write_only=True)
+        for name, df, order in sheets:
+            worksheet = workbook.create_sheet(title=name)
+            for row in rows_of(df, order):
+                worksheet.append(row)
+        workbook.save(buffer)
+
+    if target is None:
+        return buffer.getvalue()
+
+
+def _sheet_frame(df, order):
+    return df if order is None else df.iloc[order]
+
+
+def write_csv_zip(sheets):
+    """Writes every sheet as a CSV file inside an in-memory zip archive."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for name, df, order in sheets:
+            with archive.open(f"{name}.csv", 'w') as f:
+                text = io.TextIOWrapper(f, encoding='utf-8', newline='')
+                _sheet_frame(df, order).to_csv(text, index=False)
+                text.flush()
+                text.detach()
+    return buffer.getvalue()
+
+
+def write_parquet_zip(sheets):
+    """Writes every sheet as a Parquet file inside an in-memory zip archive (needs pyarrow)."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', compression=zipfile.ZIP_STORED) as archive:
+        for name, df, order in sheets:
+            frame = _sheet_frame(df, order)
+            # Parquet columns must have one type; mixed object columns (e.g. the summary's Total row) become strings
+            frame = frame.astype({col: str for col in frame.columns if frame[col].dtype == object})
+            frame.columns = [str(col) for col in frame.columns]
+            with archive.open(f"{name}.parquet", 'w') as f:
+                frame.to_parquet(f, index=False)
+    return buffer.getvalue()
+
+
+def export_results(df_with_grades, summary_df, fmt='xlsx', stats_df=None):
+    """
+    Exports a graded course in the requested format.
+
+    Returns:
+        tuple: (file bytes, file name, MIME type)
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unknown export format '{fmt}'. Choose one of {list(EXPORT_FORMATS)}.")
+    sheets = grade_sheets(df_with_grades, summary_df, stats_df)
+    if fmt == 'xlsx':
+        data = write_excel(sheets)
+    elif fmt == 'csv':
+        data = write_csv_zip(sheets)
+    else:
+        data = write_parquet_zip(sheets)
+    file_name, mime = EXPORT_FORMATS[fmt]
+    return data, file_name, mime
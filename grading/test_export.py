@@ -0,0 +1,31 @@
+import io
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from grading.export import export_results, write_excel
+
+
+def test_write_excel_with_object_columns():
+    df = pd.DataFrame({
+        'Roll': ['2201CB05', '2201CB01', None],
+        'Mixed': [1, 'Total', None],
+        'Score': [10.5, None, 3.0],
+    })
+    data = write_excel([('Sheet', df, None), ('Sorted', df, [1, 0, 2])])
+    rows = list(load_workbook(io.BytesIO(data)).worksheets[0].values)
+    assert rows == [('Roll', 'Mixed', 'Score'), ('2201CB05', 1, 10.5), ('2201CB01', 'Total', None),
+                    (None, None, 3)]
+    # The frame itself is left untouched
+    assert df['Mixed'].tolist() == [1, 'Total', None]
+
+
+def test_export_results_xlsx_sheets():
+    graded = pd.DataFrame({'Roll': ['B', 'A'], 'Total': [90.0, 80.0], 'Grade': ['AA', 'AB']})
+    summary = pd.DataFrame({'Grade': ['AA', 'AB', 'Total'], 'Count': [1, 1, 2]})
+    data, file_name, _ = export_results(graded, summary, 'xlsx')
+    workbook = load_workbook(io.BytesIO(data))
+    assert file_name == 'output.xlsx'
+    assert workbook.sheetnames == ['Grade_Sorted', 'Roll_Sorted', 'Summary']
+    assert [row[0] for row in workbook['Roll_Sorted'].values] == ['Roll', 'A', 'B']
+    assert list(workbook['Summary'].values)[-1] == ('Total', 2)
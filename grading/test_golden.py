@@ -0,0 +1,95 @@
+"""
+Golden-output regression tests for the grading core, against the reference
+workbooks in tut10/:
+    Input-1 Lab 10.xlsx, Output-1.xlsx -> Output-1.xlsx (Sheet1_Grade_Sorted)   totals and grades
+    Final Input Output.xlsx and copies (Op1)                                    grades, statistics and rescaled marks
+"""
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from grading.core import (GRADES, IAPC_RECO, SCALE_RANGES, TOTAL_COLUMN, assign_grades, grade_quota,
+                          grade_statistics, process_workbook, rescale)
+
+TUT10_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'tut10')
+SAMPLES = sorted(name for name in os.listdir(TUT10_DIR) if name.endswith('.xlsx'))
+OP1_SAMPLES = ['Final Input Output.xlsx', 'Input Output.xlsx', 'Input Output - Copy.xlsx']
+TOLERANCE = 1e-6
+
+
+def sample(name):
+    return os.path.join(TUT10_DIR, name)
+
+
+def read_output1():
+    expected = pd.read_excel(sample('Output-1.xlsx'), sheet_name='Sheet1_Grade_Sorted', header=None)
+    expected = expected.iloc[3:, [0, 6, 7]]
+    expected.columns = ['Roll', 'Expected Total', 'Expected Grade']
+    return expected[expected['Roll'].notna()].reset_index(drop=True)
+
+
+def read_op1(name):
+    sheet = pd.read_excel(sample(name), sheet_name='Op1', header=None)
+    header_row = sheet.index[sheet[0].astype(str).str.startswith('Roll')][0]
+    students = sheet.iloc[header_row + 1:, :5]
+    students.columns = ['Roll', 'Name', TOTAL_COLUMN, 'Expected Grade', 'Expected Scaled']
+    students = students[students['Roll'].notna()].reset_index(drop=True)
+    students[TOTAL_COLUMN] = students[TOTAL_COLUMN].astype(float)
+
+    expected_stats = sheet.iloc[2:13, [0, 3, 4, 6]]
+    expected_stats.columns = ['Grade', 'min (x)', 'max (x)', 'Count']
+    return students, expected_stats.reset_index(drop=True)
+
+
+@pytest.mark.parametrize('name', ['Input-1 Lab 10.xlsx', 'Output-1.xlsx'])
+def test_lab10_totals_and_grades(name):
+    graded, _, summary = process_workbook(sample(name))
+    expected = read_output1()
+
+    assert sorted(graded['Roll']) == sorted(expected['Roll'])
+    merged = graded.merge(expected, on='Roll')
+    np.testing.assert_allclose(merged[TOTAL_COLUMN].astype(float), merged['Expected Total'].astype(float),
+                               atol=TOLERANCE)
+    assert merged['Grade'].tolist() == merged['Expected Grade'].tolist()
+    assert summary['Difference'].iloc[:-1].eq(0).all()
+
+
+@pytest.mark.parametrize('name', OP1_SAMPLES)
+def test_op1_grades_statistics_and_rescale(name):
+    students, expected_stats = read_op1(name)
+    # Op1 was graded on the instructor's distribution, not IAPC: hand assign_grades those shares
+    counts = students['Expected Grade'].value_counts()
+    reco = {grade: counts.get(grade, 0) / len(students) * 100 for grade in GRADES}
+
+    graded = assign_grades(students, students[TOTAL_COLUMN], reco)
+    assert graded['Grade'].tolist() == graded['Expected Grade'].tolist()
+
+    stats = grade_statistics(graded)
+    scaled = rescale(graded, stats)
+    np.testing.assert_allclose(scaled['Scaled'], scaled['Expected Scaled'].astype(float), atol=TOLERANCE)
+
+    assert stats['Grade'].tolist() == expected_stats['Grade'].tolist()
+    for col in ['min (x)', 'max (x)', 'Count']:
+        np.testing.assert_allclose(stats[col].astype(float), expected_stats[col].astype(float),
+                                   atol=TOLERANCE, err_msg=col)
+
+
+@pytest.mark.parametrize('name', SAMPLES)
+def test_process_workbook_invariants(name):
+    graded, stats, summary = process_workbook(sample(name))
+    totals = graded[TOTAL_COLUMN].to_numpy(dtype=float)
+    assert (np.diff(totals) <= 0).all()
+
+    # Grades follow the IAPC quota in order, the rounding leftovers going to the lowest grade
+    quota = grade_quota(len(graded), IAPC_RECO)
+    expected = np.repeat(list(quota), list(quota.values()))[:len(graded)].tolist()
+    expected += [expected[-1]] * (len(graded) - len(expected))
+    assert graded['Grade'].tolist() == expected
+
+    assert stats['Count'].sum() == len(graded)
+    assert summary['Count Verified'].iloc[-1] == len(graded)
+    for grade, (a, b) in SCALE_RANGES.items():
+        scaled = graded.loc[graded['Grade'] == grade, 'Scaled']
+        assert scaled.between(a - TOLERANCE, b + TOLERANCE).all(), grade
@@ -0,0 +1,107 @@
+"""
+Compact in-memory exam allocation.
+
+The allocators in proj1.py used to join every room's roll numbers into a
+'; '-separated 'Roll_list' string. The attendance stage then read the Excel file
+back and split and stripped every roll again. An AllocationResult keeps the
+allocation in columns:
+
+* rolls: one array of every allocated roll number, row after row,
+* offsets: row i owns rolls[offsets[i]:offsets[i + 1]],
+* Date, Day, Time, course_code and Room as categoricals (an int32 code per
+  row plus each distinct value stored once).
+
+The Excel writer, the attendance-sheet builder and the seat index all read it
+directly. The joined Roll_list strings are only built by to_frame(), at export.
+"""
+import numpy as np
+
+COLUMNS = ('Date', 'Day', 'Time', 'course_code', 'Room')
+
+
+class AllocationBuilder:
+    """Collects allocation rows; build() freezes them into an AllocationResult."""
+
+    def __init__(self):
+        self._rolls = []
+        self._ends = []
+        self._codes = {column: [] for column in COLUMNS}
+        self._categories = {column: {} for column in COLUMNS}
+
+    def add(self, date, day, time, course_code, room, rolls):
+        """
+        Adds one (slot, course, room) row; rows without students are skipped.
+        Roll numbers are stripped of surrounding whitespace, as the attendance
+        sheets always did, so ' 2201CB05' and '2201CB05' are the same student.
+        """
+        if not len(rolls):
+            return
+        for column, value in zip(COLUMNS, (date, day, time, course_code, room)):
+            categories = self._categories[column]
+            self._codes[column].append(categories.setdefault(value, len(categories)))
+        self._rolls.extend(str(roll).strip() for roll in rolls)
+        self._ends.append(len(self._rolls))
+
+    def build(self):
+        return AllocationResult(
+            np.array(self._rolls, dtype=str),
+            np.array([0] + self._ends, dtype=np.int64),
+            {column: np.array(codes, dtype=np.int32) for column, codes in self._codes.items()},
+            {column: list(categories) for column, categories in self._categories.items()},
+        )
+
+
+class AllocationResult:
+    """
+    Allocation rows in columnar form.
+
+    Example:
+        allocation.rolls_of(0)          # array(['1401MC57', ...])
+        allocation.value('Room', 0)     # 101
+        allocation.to_frame()           # the exam_allocation.xlsx DataFrame
+    """
+
+    def __init__(self, rolls, offsets, codes, categories):
+        self.rolls = rolls
+        self.offsets = offsets
+        self.codes = codes
+        self.categories = categories
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    @property
+    def n_students(self):
+        """Number of allocated seats (a student sitting several exams counts once per exam)."""
+        return len(self.rolls)
+
+    def counts(self):
+        """Students per row."""
+        return np.diff(self.offsets)
+
+    def column(self, name):
+        """Decoded values of a categorical column, one per row."""
+        return np.array(self.categories[name], dtype=object)[self.codes[name]]
+
+    def value(self, name, i):
+        return self.categories[name][self.codes[name][i]]
+
+    def rolls_of(self, i):
+        return self.rolls[self.offsets[i]:self.offsets[i + 1]]
+
+    def rows(self):
+        """Yields (date, day, time, course_code, room, rolls) per row."""
+        columns = [self.column(name) for name in COLUMNS]
+        for i, values in enumerate(zip(*columns)):
+            yield values + (self.rolls_of(i),)
+
+    def to_frame(self):
+        """The exam_allocation.xlsx layout; this is the only place Roll_list strings are joined."""
+        import pandas as pd
+        frame = pd.DataFrame({name: self.column(name) for name in COLUMNS})
+        frame['Allocated_students_count'] = self.counts()
+        frame['Roll_list'] = ['; '.join(self.rolls_of(i)) for i in range(len(self))]
+        return frame
+
+    def to_excel(self, path):
+        self.to_frame().to_excel(path, index=False)
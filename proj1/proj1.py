@@ -3,6 +3,9 @@ import pandas as pd
 from datetime import datetime
 from openpyxl import Workbook
 
+from allocation import AllocationBuilder
+from seat_index import build_index, index_path_for
+
 course_dict = {}
 def process_student_data(file_path):
     
@@ -110,6 +113,16 @@ def get_density_type():
 
     
     return 'dense' if density_input == '1' else 'sparse'
+def save_allocation(allocation, output_file):
+    """
+    Saves an AllocationResult to Excel and rebuilds its seat lookup index, so
+    the index never lags behind a rerun allocation.
+    """
+    allocation.to_excel(output_file)
+    print(f"Excel file '{output_file}' created successfully.")
+    index_path = index_path_for(output_file)
+    n_seats = build_index(allocation, index_path, source=output_file)
+    print(f"Seat index '{index_path}' rebuilt ({n_seats} seats).")
 def allocate_students_to_rooms(course_dict, exam_timetable, room_data, output_file='exam_allocation.xlsx'):
 
     def get_day_from_date(date_str):
@@ -121,7 +134,7 @@ def allocate_students_to_rooms(course_dict, exam_timetable, room_data, output_fi
         return date_obj.strftime('%A')
 
     
-    data = []
+    allocation = AllocationBuilder()
     dfx = room_data.copy(deep=True)
 
     
@@ -155,29 +168,16 @@ def allocate_students_to_rooms(course_dict, exam_timetable, room_data, output_fi
                 dfx.at[i, 'Remaining Capacity'] = remaining_capacity
 
                 # If we have allocated students to this room, store the result
-                if allocated_students:
-                    data.append({
-                        'Date': date_part,
-                        'Day': day_part,
-                        'Time': time_part,
-                        'course_code': course,
-                        'Room': room_no,
-                        'Allocated_students_count': len(allocated_students),
-                        'Roll_list': '; '.join(allocated_students)
-                    })
+                allocation.add(date_part, day_part, time_part, course, room_no, allocated_students)
 
                 # Break out of the loop if all students for the course are allocated
                 if not students:
                     break
 
-    # Create a DataFrame from the collected data
-    allocation_df = pd.DataFrame(data)
-
-    # Save to Excel file
-    allocation_df.to_excel(output_file, index=False)
-
-    print(f"Excel file '{output_file}' created successfully.")
-    return allocation_df
+    # Freeze the collected rows; Roll_list strings are only joined for the Excel file
+    allocation = allocation.build()
+    save_allocation(allocation, output_file)
+    return allocation
 def allocate_students_sparse(course_dict, exam_timetable, room_data, output_file='exam_allocation.xlsx'):
     """
     Allocates students to rooms for exams in a sparse allocation style and generates an Excel file.
@@ -189,7 +189,7 @@ def allocate_students_sparse(course_dict, exam_timetable, room_data, output_file
         output_file (str): The name of the output Excel file. Defaults to 'exam_allocation.xlsx'.
 
     Returns:
-        pd.DataFrame: A DataFrame containing the allocation details.
+        AllocationResult: The allocation details (AllocationResult.to_frame() gives the Excel layout).
     """
     # Function to get the weekday name from the date
     def get_day_from_date(date_str):
@@ -204,8 +204,8 @@ def allocate_students_sparse(course_dict, exam_timetable, room_data, output_file
         else:
             return int(room_no_str[0])  # First character as floor number
 
-    # Initialize a list to hold the data for the DataFrame
-    data = []
+    # Collects the allocation rows
+    allocation = AllocationBuilder()
 
     # Add 'Floor' column to room_data
     room_data['Floor'] = room_data['Room No.'].apply(get_floor)
@@ -255,16 +255,8 @@ def allocate_students_sparse(course_dict, exam_timetable, room_data, output_file
                         dfx.at[current_pointer, current_rem_cap] -= 1  # Decrease remaining capacity
 
                     # If we allocated students, store the result
-                    if allocated_students:
-                        data.append({
-                            'Date': date_part,
-                            'Day': day_part,
-                            'Time': time_part,
-                            'course_code': course,
-                            'Room': dfx.at[current_pointer, 'Room No.'],
-                            'Allocated_students_count': len(allocated_students),
-                            'Roll_list': '; '.join(allocated_students)
-                        })
+                    allocation.add(date_part, day_part, time_part, course,
+                                   dfx.at[current_pointer, 'Room No.'], allocated_students)
 
                 # After attempting to allocate, check if we need to increment the pointer
                 if current_pointer == i and dfx.at[i, 'rem cap 1'] == 0:
@@ -275,14 +267,40 @@ def allocate_students_sparse(course_dict, exam_timetable, room_data, output_file
                     j += 1  # Move to the next room for rem cap 2
                     current_pointer = j
 
-    # Create a DataFrame from the collected data
-    allocation_df = pd.DataFrame(data)
-
-    # Save to Excel file
-    allocation_df.to_excel(output_file, index=False)
+    # Freeze the collected rows; Roll_list strings are only joined for the Excel file
+    allocation = allocation.build()
+    save_allocation(allocation, output_file)
+    return allocation
+def add_attendance_sheet(workbook, sheet_name, roll_numbers, student_dict):
+    """Adds a Roll_No / Name / Signature sheet for one room's roll numbers."""
+    sheet = workbook.create_sheet(title=sheet_name)
+    sheet.append(['Roll_No', 'Name', 'Signature'])
+    for roll in roll_numbers:
+        sheet.append([roll, student_dict.get(roll, "Unknown"), ''])  # Signature left blank
+def build_attendance_workbook(allocation, student_dict, output_file="Attendance_Sheets.xlsx"):
+    """
+    Writes one attendance sheet per allocation row, named
+    <dd_mm_yyyy>_<course>_<room>_<session>.
 
-    print(f"Excel file '{output_file}' created successfully.")
-    return allocation_df
+    Args:
+        allocation (AllocationResult): The allocation returned by the allocators.
+        student_dict (dict): Roll number -> student name.
+        output_file (str): Path of the workbook to write.
+    """
+    workbook = Workbook()
+    workbook.remove(workbook.active)  # Remove the default sheet created by Workbook()
+
+    # Dates and sessions are categoricals, so each distinct value is formatted once
+    dates = [pd.to_datetime(d).strftime("%d_%m_%Y") for d in allocation.categories['Date']]
+    times = [str(t).lower() for t in allocation.categories['Time']]
+    courses, rooms = allocation.categories['course_code'], allocation.categories['Room']
+    codes = allocation.codes
+    for i in range(len(allocation)):
+        sheet_name = (f"{dates[codes['Date'][i]]}_{courses[codes['course_code'][i]]}_"
+                      f"{rooms[codes['Room'][i]]}_{times[codes['Time'][i]]}")
+        add_attendance_sheet(workbook, sheet_name, allocation.rolls_of(i).tolist(), student_dict)
+
+    workbook.save(output_file)
 if __name__ == '__main__':
    file_path = '/content/ip_1.xlsx'  # Replace with the actual file path
    students_data = process_student_data(file_path)
@@ -306,57 +324,15 @@ if __name__ == '__main__':
    if density_type == 'dense':
     # Call the function for dense allocation
     room_data=updated_df
-    allocation_df = allocate_students_to_rooms(course_dict, exam_timetable, room_data)
+    allocation = allocate_students_to_rooms(course_dict, exam_timetable, room_data)
    elif density_type == 'sparse':
     # Call the function for sparse allocation
-     allocation_df = allocate_students_sparse(course_dict, exam_timetable, room_data)
+     allocation = allocate_students_sparse(course_dict, exam_timetable, updated_df)
    else:
      print("Invalid density type. Please set it to 'dense' or 'sparse'.")
-   attendance_df = pd.read_excel("/content/exam_allocation.xlsx")
-
 # Load the student data file (e.g., "student_data.csv") and convert it to a dictionary
    students_df = pd.read_excel("/content/ip_4.xlsx")
    student_dict = pd.Series(students_df.Name.values, index=students_df.Roll).to_dict()
 
-
-# Create a single workbook to contain all sheets
-   workbook = Workbook()
-   workbook.remove(workbook.active)  # Remove the default sheet created by Workbook()
-
-# Define a function to add a new sheet with attendance data
-   def add_attendance_sheet(workbook, sheet_name, roll_numbers):
-    # Add a new sheet to the workbook
-     sheet = workbook.create_sheet(title=sheet_name)
-
-    # Set the headers
-     sheet['A1'] = 'Roll_No'
-     sheet['B1'] = 'Name'
-     sheet['C1'] = 'Signature'
-
-    # Populate the sheet with roll numbers and corresponding names
-     for idx, roll in enumerate(roll_numbers, start=2):  # Start from row 2
-        sheet[f'A{idx}'] = roll.strip()
-        sheet[f'B{idx}'] = student_dict.get(roll.strip(), "Unknown")  # Map roll to name
-        sheet[f'C{idx}'] = ''  # Leave Signature blank
-
-
-# Process each row in the attendance DataFrame
-   for index, row in attendance_df.iterrows():
-    # Extract information from the current row
-     date = pd.to_datetime(row['Date']).strftime("%d_%m_%Y")
-     course_code = row['course_code']
-     room_no = row['Room']
-     time_slot = row['Time'].lower()  # Ensure "morning" or "evening"
-
-    # Create a unique sheet name using extracted information
-     sheet_name = f"{date}_{course_code}_{room_no}_{time_slot}"
- 
-    # Get the roll list for the current row and split by comma if necessary
-     roll_numbers = row['Roll_list'].split(';')
-
-    # Add a sheet for this row's attendance data
-     add_attendance_sheet(workbook, sheet_name, roll_numbers)
-
-
-# Save the workbook with a descriptive name
-   workbook.save("Attendance_Sheets.xlsx")
\ No newline at end of file
+# The attendance sheets are built straight from the in-memory allocation, not from the Excel file
+   build_attendance_workbook(allocation, student_dict, "Attendance_Sheets.xlsx")
@@ -0,0 +1,349 @@
+"""
+Seat lookup index over the exam allocation.
+
+proj1.py writes exam_allocation.xlsx with one row per (slot, course, room) and
+the roll numbers joined into a 'Roll_list' string. This module flattens it into
+a SQLite table with one row per (roll, date, session, course, room) and an index
+on roll, so finding a student's seats is a single B-tree lookup that takes
+microseconds, not an Excel search.
+
+* build_index() writes the index atomically (a uniquely named temp file, then
+  rename), so concurrent builds never share a temp file. proj1.py's
+  save_allocation() calls it every time it writes the allocation.
+* ensure_index() rebuilds only if the allocation file changed since the index
+  was built. Its mtime is recorded in the index.
+* SeatIndex answers lookups. It reopens the index when a rebuild replaces the
+  file. With a source file it also rebuilds the index itself when the
+  allocation changed and no one else rebuilt it: only once the file has been
+  left alone for SETTLE_SECONDS (proj1.py rebuilds right after writing, so a
+  running server normally just reconnects). A rebuild that fails, e.g. on a
+  half-written file, keeps the old index and is retried later. A missing source is reported once, at startup: an
+  existing index is then served as it is (with a warning), and with no index
+  at all SeatIndex raises FileNotFoundError.
+* serve() exposes SeatIndex over local HTTP: GET /seat/<roll> returns JSON.
+
+Usage:
+    python seat_index.py build exam_allocation.xlsx
+    python seat_index.py lookup 1401MC57 [--source exam_allocation.xlsx]
+    python seat_index.py serve --source exam_allocation.xlsx [--port 8000]
+    python seat_index.py bench [--lookups 100000]
+"""
+import argparse
+import json
+import logging
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote
+
+from allocation import AllocationResult
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SOURCE = 'exam_allocation.xlsx'
+SETTLE_SECONDS = 2.0
+RETRY_SECONDS = 1.0
+FIELDS = ('date', 'day', 'time', 'course_code', 'room')
+SCHEMA = """
+CREATE TABLE seats (roll TEXT NOT NULL, date TEXT, day TEXT, time TEXT, course_code TEXT, room TEXT);
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+"""
+
+
+def index_path_for(allocation_file):
+    """exam_allocation.xlsx -> exam_allocation_seats.sqlite"""
+    return f"{os.path.splitext(allocation_file)[0]}_seats.sqlite"
+
+
+def normalize_roll(roll):
+    return str(roll).strip().upper()
+
+
+def _allocation_rows(allocation):
+    # (date, day, time, course_code, room, rolls) per row
+    if isinstance(allocation, AllocationResult):
+        return allocation.rows()
+    if isinstance(allocation, (str, os.PathLike)):
+        import pandas as pd
+        allocation = pd.read_excel(allocation)
+    if len(allocation) == 0:
+        return iter(())
+    columns = [allocation[c].tolist() for c in ('Date', 'Day', 'Time', 'course_code', 'Room')]
+    roll_lists = (str(roll_list).split(';') for roll_list in allocation['Roll_list'].tolist())
+    return zip(*columns, roll_lists)
+
+
+def iter_seats(allocation):
+    """
+    Yields (roll, date, day, time, course_code, room) for every allocated
+    student, from an AllocationResult, an allocation DataFrame or the path of
+    its Excel file.
+    """
+    for date, day, time_slot, course, room, rolls in _allocation_rows(allocation):
+        # Dates are 'YYYY-MM-DD HH:MM:SS' strings or Timestamps; keep the day only
+        seat = (str(date).split()[0], str(day), str(time_slot), str(course), str(room))
+        for roll in rolls:
+            roll = normalize_roll(roll)
+            if roll:
+                yield (roll,) + seat
+
+
+def build_index(allocation, index_path, source=None):
+    """
+    Builds the seat index from an AllocationResult, DataFrame or Excel file and
+    atomically replaces index_path. source (default: allocation, if it is a
+    path) is the allocation file whose mtime ensure_index() compares against.
+
+    Returns:
+        int: The number of seats indexed.
+    """
+    if source is None and isinstance(allocation, (str, os.PathLike)):
+        source = allocation
+    # Sorted by roll, a student's rows sit together in the table
+    rows = sorted(iter_seats(allocation))
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(index_path)),
+                                    prefix=f"{os.path.basename(index_path)}.", suffix='.tmp')
+    os.close(fd)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany("INSERT INTO seats VALUES (?, ?, ?, ?, ?, ?)", rows)
+        conn.execute("CREATE INDEX seats_roll ON seats (roll)")
+        meta = {
+            'built_at': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'seats': str(len(rows)),
+            'students': str(len({row[0] for row in rows})),
+            'source': os.path.abspath(source) if source else '',
+            'source_mtime_ns': str(os.stat(source).st_mtime_ns) if source else '',
+        }
+        conn.executemany("INSERT INTO meta VALUES (?, ?)", meta.items())
+        conn.commit()
+        conn.close()
+        os.replace(tmp_path, index_path)
+    except BaseException:
+        conn.close()
+        os.remove(tmp_path)
+        raise
+    return len(rows)
+
+
+def read_meta(index_path):
+    conn = sqlite3.connect(f"file:{index_path}?mode=ro", uri=True)
+    try:
+        return dict(conn.execute("SELECT key, value FROM meta"))
+    finally:
+        conn.close()
+
+
+def ensure_index(source, index_path=None):
+    """
+    Rebuilds the index from the allocation file if the index is missing or
+    older than the file. Without the allocation file an existing index is kept.
+
+    Returns:
+        tuple: (index_path, rebuilt)
+
+    Raises:
+        FileNotFoundError: If neither the allocation file nor the index exists.
+    """
+    index_path = index_path or index_path_for(source)
+    if not os.path.exists(source):
+        if os.path.exists(index_path):
+            return index_path, False
+        raise FileNotFoundError(f"Allocation file {source} not found and no index at {index_path}; "
+                                "run proj1.py or seat_index.py build first")
+    if os.path.exists(index_path):
+        try:
+            if read_meta(index_path).get('source_mtime_ns') == str(os.stat(source).st_mtime_ns):
+                return index_path, False
+        except sqlite3.DatabaseError:
+            pass  # unreadable index, rebuild it
+    build_index(source, index_path)
+    return index_path, True
+
+
+class SeatIndex:
+    """
+    Read-only lookups, safe to share between threads (each thread has its own
+    connection).
+
+    Example:
+        seats = SeatIndex('exam_allocation_seats.sqlite')
+        seats.lookup('1401mc57')
+        # [{'date': '2016-05-02', 'day': 'Monday', 'time': 'morning', 'course_code': 'CS244', 'room': '101'}, ...]
+    """
+
+    def __init__(self, index_path=None, source=None):
+        if index_path is None and source is None:
+            source = DEFAULT_SOURCE
+        self.source = source
+        self.index_path = index_path or index_path_for(source)
+        self._local = threading.local()
+        self._rebuild_lock = threading.Lock()
+        self._source_mtime = None
+        self._retry_at = 0.0
+        if source is not None:
+            if not os.path.exists(source) or not os.path.exists(self.index_path):
+                # Nothing to serve yet: errors surface here, once, not on every lookup
+                ensure_index(source, self.index_path)
+            if not os.path.exists(source):
+                logger.warning("Allocation file %s not found; serving the existing index %s as it is",
+                               source, self.index_path)
+            self._check_source()
+        elif not os.path.exists(self.index_path):
+            raise FileNotFoundError(f"Seat index {self.index_path} not found; run seat_index.py build first")
+
+    def _check_source(self):
+        # One stat per lookup; the rebuild itself only runs when the allocation was rewritten.
+        # A missing source (removed, or mid-rewrite) keeps the current index
+        try:
+            mtime = os.stat(self.source).st_mtime_ns
+        except FileNotFoundError:
+            return
+        if mtime == self._source_mtime or time.monotonic() < self._retry_at:
+            return
+        with self._rebuild_lock:
+            if mtime == self._source_mtime:
+                return
+            try:
+                if read_meta(self.index_path).get('source_mtime_ns') != str(mtime):
+                    if time.time() - mtime / 1e9 < SETTLE_SECONDS:
+                        return  # still being written, or about to be indexed by proj1.py
+                    ensure_index(self.source, self.index_path)
+            except Exception as e:
+                # _source_mtime is left as it was, so a later lookup tries again
+                logger.warning("Could not rebuild the seat index from %s (%s); serving the previous index",
+                               self.source, e)
+                self._retry_at = time.monotonic() + RETRY_SECONDS
+                return
+            self._source_mtime = mtime
+
+    def _connection(self):
+        # A rebuild replaces the file, so a changed inode or mtime means reconnect
+        st = os.stat(self.index_path)
+        version = (st.st_ino, st.st_mtime_ns)
+        local = self._local
+        if getattr(local, 'version', None) != version:
+            if getattr(local, 'conn', None) is not None:
+                local.conn.close()
+            local.conn = sqlite3.connect(f"file:{self.index_path}?mode=ro", uri=True, check_same_thread=False)
+            local.version = version
+        return local.conn
+
+    def lookup(self, roll):
+        """Every seat of a roll number, by date and session; [] if it has none."""
+        if self.source is not None:
+            self._check_source()
+        rows = self._connection().execute(
+            "SELECT date, day, time, course_code, room FROM seats WHERE roll = ? ORDER BY date, time != 'morning'",
+            (normalize_roll(roll),))
+        return [dict(zip(FIELDS, row)) for row in rows]
+
+    def meta(self):
+        return read_meta(self.index_path)
+
+
+def serve(seats, host='127.0.0.1', port=8000):
+    """
+    Serves GET /seat/<roll> (JSON list of seats, 404 if none) and GET /health
+    until interrupted.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status, payload):
+            body = json.dumps(payload).encode()
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            path = self.path.split('?', 1)[0].rstrip('/')
+            if path == '/health':
+                self._send(200, seats.meta())
+            elif path.startswith('/seat/'):
+                roll = normalize_roll(unquote(path[len('/seat/'):]))
+                try:
+                    found = seats.lookup(roll)
+                except Exception as e:
+                    self._send(503, {'roll': roll, 'error': f"{type(e).__name__}: {e}"})
+                    return
+                self._send(200 if found else 404, {'roll': roll, 'seats': found})
+            else:
+                self._send(404, {'error': "use /seat/<roll> or /health"})
+
+        def log_message(self, format, *args):
+            pass  # one line per lookup would swamp the console on exam day
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    print(f"Serving seat lookups on http://{host}:{server.server_port}/seat/<roll>")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+def benchmark(seats, n_lookups=100000, seed=0):
+    """Mean microseconds per lookup of random indexed rolls."""
+    rolls = [row[0] for row in sqlite3.connect(f"file:{seats.index_path}?mode=ro", uri=True).execute(
+        "SELECT DISTINCT roll FROM seats")]
+    if not rolls:
+        return None
+    rng = random.Random(seed)
+    sample = [rng.choice(rolls) for _ in range(n_lookups)]
+    start = time.perf_counter()
+    for roll in sample:
+        seats.lookup(roll)
+    return (time.perf_counter() - start) / n_lookups * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Roll number -> exam seat lookups.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help="Build the index from an allocation file")
+    build.add_argument('source', nargs='?', default=DEFAULT_SOURCE)
+    for name, help_text in (('lookup', "Seats of roll numbers"), ('serve', "Local HTTP lookup service"),
+                            ('bench', "Time lookups")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument('--source', help="Allocation file to watch (rebuilds the index when it changes)")
+        cmd.add_argument('--index', help="Index file (default: next to the allocation file)")
+    sub.choices['lookup'].add_argument('rolls', nargs='+')
+    sub.choices['serve'].add_argument('--host', default='127.0.0.1')
+    sub.choices['serve'].add_argument('--port', type=int, default=8000)
+    sub.choices['bench'].add_argument('--lookups', type=int, default=100000)
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    if args.command == 'build':
+        start = time.perf_counter()
+        n = build_index(args.source, index_path_for(args.source))
+        print(f"Indexed {n} seats into {index_path_for(args.source)} ({time.perf_counter() - start:.2f}s)")
+        return
+
+    try:
+        seats = SeatIndex(args.index, args.source)
+    except FileNotFoundError as e:
+        parser.error(str(e))
+    if args.command == 'lookup':
+        for roll in args.rolls:
+            found = seats.lookup(roll)
+            if not found:
+                print(f"{normalize_roll(roll)}: no seat allocated")
+            for seat in found:
+                print(f"{normalize_roll(roll)}: {seat['date']} ({seat['day']}) {seat['time']}  "
+                      f"{seat['course_code']}  room {seat['room']}")
+    elif args.command == 'serve':
+        serve(seats, args.host, args.port)
+    else:
+        micros = benchmark(seats, args.lookups)
+        print("index is empty" if micros is None else f"{micros:.1f} us per lookup")
+
+
+if __name__ == "__main__":
+    main()
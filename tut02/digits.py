@@ -0,0 +1,252 @@
+"""
+Bulk digit sums and digital roots.
+
+tut02-part1.py repeats a digit-by-digit sum until one digit is left. That
+repeated sum is the digital root, 0 for 0 and 1 + (n - 1) % 9 otherwise (a
+number and its digit sum agree mod 9), so it needs no loop at all. This module
+provides:
+
+* digital_roots()/digit_sums() for NumPy integer arrays, processed in blocks.
+  Digit sums take six digits per step through a 1 MB lookup table, built on
+  first use so importing the module (e.g. for digital_root) stays cheap.
+* digit sums of arbitrarily long decimal strings and files: a slice that is
+  all digits sums as sum(bytes) - 48 * len; otherwise one np.bincount counts
+  each byte value, so the sum is sum(d * count[d]). Whitespace is ignored; any
+  other byte is an error.
+* per-line digit sums for files with one number per line (a cumulative sum
+  differenced at the line boundaries).
+
+All functions work on |n|. Arrays are reduced to uint64 magnitudes first, so
+every int64 and uint64 value is handled, including -2**63 and 2**64 - 1.
+
+Usage:
+    python digits.py root 987654321
+    python digits.py file huge_number.txt [--lines]
+    python digits.py bench [--values 100000000] [--digits-mb 1024]
+"""
+import argparse
+import time
+from functools import lru_cache
+
+import numpy as np
+
+BLOCK_SIZE = 1 << 22
+CHUNK_SIZE = 64 << 20
+_ZERO = ord('0')
+_WHITESPACE = b' \t\r\n\v\f'
+_DIGIT_WEIGHTS = np.zeros(256, dtype=np.int64)
+_DIGIT_WEIGHTS[_ZERO:_ZERO + 10] = np.arange(10)
+_IS_DIGIT = np.zeros(256, dtype=bool)
+_IS_DIGIT[_ZERO:_ZERO + 10] = True
+_ALLOWED = _IS_DIGIT.copy()
+_ALLOWED[list(_WHITESPACE)] = True
+
+
+_TABLE_BASE = 10 ** 6
+
+
+@lru_cache(maxsize=None)
+def _digit_table(base=_TABLE_BASE):
+    # Digit sum of every value below base, as uint8 so the table stays cache-sized
+    rest = np.arange(base)
+    table = np.zeros(base, dtype=np.uint8)
+    while rest.any():
+        rest, low = np.divmod(rest, 10)
+        table += low.astype(np.uint8)
+    return table
+
+
+_BASE = np.uint64(_TABLE_BASE)
+
+
+def _magnitudes(block):
+    # |block| as uint64. Unsigned values pass through; for signed ones ~n + 1
+    # is |n| without the overflow np.abs has at -2**63
+    if block.dtype.kind == 'u' or block.dtype.kind == 'b':
+        return block.astype(np.uint64, copy=False)
+    if block.dtype.kind != 'i':
+        raise TypeError(f"Expected an integer array, got dtype {block.dtype}")
+    block = block.astype(np.int64, copy=False)
+    return np.where(block < 0, (~block).astype(np.uint64) + np.uint64(1), block.astype(np.uint64))
+
+
+def digital_root(n):
+    """Repeated digit sum of one integer (the tut02-part1 result) in O(1)."""
+    n = abs(n)
+    return 0 if n == 0 else 1 + (n - 1) % 9
+
+
+def digital_roots(values, block_size=BLOCK_SIZE):
+    """Digital root of every value of an integer array, as int8."""
+    values = np.asarray(values)
+    out = np.empty(values.shape, dtype=np.int8)
+    flat_in, flat_out = values.reshape(-1), out.reshape(-1)
+    for start in range(0, len(flat_in), block_size):
+        block = _magnitudes(flat_in[start:start + block_size])
+        root = block % np.uint64(9)
+        root[(root == 0) & (block != 0)] = 9
+        flat_out[start:start + block_size] = root
+    return out
+
+
+def digit_sums(values, block_size=BLOCK_SIZE):
+    """Single-pass (not repeated) digit sum of every value of an integer array."""
+    values = np.asarray(values)
+    out = np.empty(values.shape, dtype=np.int64)
+    flat_in, flat_out = values.reshape(-1), out.reshape(-1)
+    table = _digit_table()
+    for start in range(0, len(flat_in), block_size):
+        rest = _magnitudes(flat_in[start:start + block_size])
+        rest, low = np.divmod(rest, _BASE)
+        total = table[low].astype(np.int64)
+        while rest.any():
+            rest, low = np.divmod(rest, _BASE)
+            total += table[low]
+        flat_out[start:start + block_size] = total
+    return out
+
+
+def _count_digits(data, slice_size=1 << 23):
+    # (digit sum, number of digits) of bytes-like decimal text. Slices keep
+    # bincount's intp temporary small; all-digit slices skip it entirely
+    a = np.frombuffer(data, dtype=np.uint8)
+    counts = np.zeros(256, dtype=np.int64)
+    total = n_digits = 0
+    for start in range(0, len(a), slice_size):
+        piece = a[start:start + slice_size]
+        if len(piece) and piece.min() >= _ZERO and piece.max() <= _ZERO + 9:
+            total += int(piece.sum(dtype=np.uint64)) - _ZERO * len(piece)
+            n_digits += len(piece)
+        else:
+            counts += np.bincount(piece, minlength=256)
+    bad = np.flatnonzero((counts > 0) & ~_ALLOWED)
+    if len(bad):
+        raise ValueError(f"Not a decimal number: found byte {bytes([int(bad[0])])!r}")
+    digits = counts[_ZERO:_ZERO + 10]
+    return total + int(digits @ np.arange(10)), n_digits + int(digits.sum())
+
+
+def string_digit_sum(s):
+    """Digit sum of a decimal string (str or bytes) of any length, sign and whitespace ignored."""
+    if isinstance(s, str):
+        s = s.encode()
+    return _count_digits(s.strip().lstrip(b'+-'))[0]
+
+
+def string_digital_root(s):
+    """Digital root of a decimal string of any length."""
+    return digital_root(string_digit_sum(s))
+
+
+def file_digit_sum(path, chunk_size=CHUNK_SIZE):
+    """
+    Digit sum of one huge decimal number stored in a file (whitespace and line
+    breaks are ignored), read in chunks.
+
+    Returns:
+        tuple: (digit sum, number of digits)
+    """
+    total = n_digits = 0
+    with open(path, 'rb') as f:
+        first = True
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            if first:
+                chunk = chunk.lstrip().lstrip(b'+-')
+                first = False
+            s, n = _count_digits(chunk)
+            total += s
+            n_digits += n
+    return total, n_digits
+
+
+def file_digital_root(path, chunk_size=CHUNK_SIZE):
+    return digital_root(file_digit_sum(path, chunk_size)[0])
+
+
+def line_digit_sums(path, chunk_size=CHUNK_SIZE):
+    """
+    Digit sum of every line of a file with one number per line (non-digit bytes
+    are ignored, so signs and '\r' are fine).
+
+    Returns:
+        np.ndarray: int64 digit sums, one per line (a blank line sums to 0).
+    """
+    results = []
+    carry = 0
+    open_line = False
+    with open(path, 'rb') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            a = np.frombuffer(chunk, dtype=np.uint8)
+            weights = _DIGIT_WEIGHTS[a]
+            ends = np.flatnonzero(a == ord('\n'))
+            if len(ends) == 0:
+                carry += int(weights.sum())
+                open_line = True
+                continue
+            # csum[k] is the sum of weights[:k]; line i spans [starts[i], ends[i])
+            csum = np.concatenate(([0], np.cumsum(weights)))
+            starts = np.concatenate(([0], ends[:-1] + 1))
+            sums = csum[ends] - csum[starts]
+            sums[0] += carry     # the first line began in the previous chunk
+            results.append(sums)
+            carry = int(csum[-1] - csum[ends[-1] + 1])
+            open_line = ends[-1] + 1 < len(a)
+    if open_line:
+        results.append(np.array([carry], dtype=np.int64))
+    return np.concatenate(results) if results else np.zeros(0, dtype=np.int64)
+
+
+def benchmark(n_values=10 ** 8, digits_mb=1024, seed=0):
+    """Seconds for digital_roots/digit_sums over n_values random int64s and for a digits_mb digit string."""
+    rng = np.random.default_rng(seed)
+    values = rng.integers(0, 2 ** 62, size=n_values, dtype=np.int64)
+    timings = {}
+    start = time.perf_counter()
+    digital_roots(values)
+    timings[f'digital_roots x {n_values}'] = time.perf_counter() - start
+    start = time.perf_counter()
+    digit_sums(values)
+    timings[f'digit_sums x {n_values}'] = time.perf_counter() - start
+    del values
+
+    digits = (rng.integers(0, 10, size=digits_mb << 20, dtype=np.uint8) + _ZERO).tobytes()
+    start = time.perf_counter()
+    string_digit_sum(digits)
+    timings[f'string_digit_sum {digits_mb} MB'] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Digit sums and digital roots in bulk.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    root = sub.add_parser('root', help="Digital root of a number given on the command line")
+    root.add_argument('number')
+    file_cmd = sub.add_parser('file', help="Digit sum and digital root of a number stored in a file")
+    file_cmd.add_argument('path')
+    file_cmd.add_argument('--lines', action='store_true', help="One number per line")
+    bench = sub.add_parser('bench')
+    bench.add_argument('--values', type=int, default=10 ** 8)
+    bench.add_argument('--digits-mb', type=int, default=1024)
+    args = parser.parse_args()
+
+    if args.command == 'root':
+        print("unitary sum :", string_digital_root(args.number))
+    elif args.command == 'file' and args.lines:
+        for s in line_digit_sums(args.path):
+            print(s, digital_root(int(s)))
+    elif args.command == 'file':
+        total, n_digits = file_digit_sum(args.path)
+        print(f"{n_digits} digits, digit sum {total}, unitary sum {digital_root(total)}")
+    else:
+        for name, seconds in benchmark(args.values, args.digits_mb).items():
+            print(f"{name:<36} {seconds:8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
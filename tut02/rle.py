@@ -0,0 +1,459 @@
+"""
+Run-length encoding codec.
+
+Two formats:
+
+* text, the tut02-part2 form: every run is the character followed by its count in
+  decimal ("aaabb" -> "a3b2"). Lossless for text without digit characters.
+* binary, for arbitrary bytes: the magic b"RLE\\x01", then per run the byte
+  followed by its count as an unsigned LEB128 varint (7 bits per byte, high bit
+  set on all but the last byte). Runs shorter than 128 cost two bytes.
+
+Encoder/Decoder (and TextEncoder/TextDecoder) are incremental: feed() them
+chunks of any size and they carry the open run, or an incomplete record, across
+chunk boundaries. encode_file()/decode_file() stream whole files that way in
+constant memory, and decoded output is emitted in blocks of at most block_size
+bytes however long a run is. Run detection and varint packing use NumPy when it
+is installed and fall back to a C-level regex scan otherwise.
+
+Usage:
+    python rle.py encode input.bin output.rle [--text]
+    python rle.py decode output.rle restored.bin [--text]
+    python rle.py bench [--size-mb 32]
+"""
+import argparse
+import os
+import re
+import time
+import zlib
+
+try:
+    import numpy as np
+except ImportError:  # the pure-Python path still works
+    np = None
+
+MAGIC = b'RLE\x01'
+CHUNK_SIZE = 1 << 20
+BLOCK_SIZE = 1 << 20
+
+_BYTE_RUN = re.compile(rb'(.)\1*', re.S)
+_TEXT_RUN = re.compile(r'(.)\1*', re.S)
+_TEXT_RECORD = re.compile(r'(.)(\d+)', re.S)
+
+
+def encode_text(s):
+    """'aaabb' -> 'a3b2'."""
+    return ''.join(f"{m.group(1)}{m.end() - m.start()}" for m in _TEXT_RUN.finditer(s))
+
+
+def decode_text(s):
+    """'a3b2' -> 'aaabb'."""
+    out = []
+    pos = 0
+    for m in _TEXT_RECORD.finditer(s):
+        if m.start() != pos:
+            raise ValueError(f"Malformed run-length text at position {pos}")
+        out.append(m.group(1) * int(m.group(2)))
+        pos = m.end()
+    if pos != len(s):
+        raise ValueError(f"Malformed run-length text at position {pos}")
+    return ''.join(out)
+
+
+def find_runs(data, use_numpy=None):
+    """
+    Runs of identical bytes.
+
+    Returns:
+        tuple: (symbols, counts) - NumPy arrays on the fast path, lists otherwise.
+    """
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        a = np.frombuffer(data, dtype=np.uint8)
+        if len(a) == 0:
+            return a, np.zeros(0, dtype=np.int64)
+        starts = np.flatnonzero(np.concatenate(([True], a[1:] != a[:-1])))
+        return a[starts], np.diff(np.append(starts, len(a)))
+    symbols, counts = [], []
+    for m in _BYTE_RUN.finditer(data):
+        symbols.append(data[m.start()])
+        counts.append(m.end() - m.start())
+    return symbols, counts
+
+
+def _varint(n):
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7f) | 0x80)
+        n >>= 7
+    out.append(n)
+    return out
+
+
+def pack_runs(symbols, counts):
+    """Binary records (byte + varint count) for parallel runs, without the header."""
+    if np is not None and isinstance(counts, np.ndarray):
+        if len(counts) == 0:
+            return b''
+        counts = counts.astype(np.int64)
+        # Varint length of every count, then scatter each 7-bit group into place
+        nbytes = np.ones(len(counts), dtype=np.int64)
+        rest = counts >> 7
+        while rest.any():
+            nbytes += rest > 0
+            rest >>= 7
+        sizes = nbytes + 1
+        offsets = np.cumsum(sizes) - sizes
+        out = np.empty(int(sizes.sum()), dtype=np.uint8)
+        out[offsets] = symbols
+        for k in range(int(nbytes.max())):
+            rows = np.flatnonzero(nbytes > k)
+            group = (counts[rows] >> (7 * k)) & 0x7f
+            more = (nbytes[rows] > k + 1) * 0x80
+            out[offsets[rows] + 1 + k] = group | more
+        return out.tobytes()
+    out = bytearray()
+    for symbol, count in zip(symbols, counts):
+        out.append(symbol)
+        out += _varint(count)
+    return bytes(out)
+
+
+class Encoder:
+    """
+    Incremental binary encoder. The last run of every chunk is held back until
+    the next chunk shows whether it continues.
+
+    Example:
+        encoder = Encoder()
+        data = encoder.feed(b'aaab') + encoder.feed(b'bbbc') + encoder.flush()
+        decode_bytes(data)   # b'aaabbbbc'
+    """
+
+    def __init__(self, use_numpy=None):
+        self.use_numpy = np is not None if use_numpy is None else use_numpy
+        self.symbol = None
+        self.count = 0
+        self.started = False
+
+    def _header(self):
+        if self.started:
+            return b''
+        self.started = True
+        return MAGIC
+
+    def feed(self, chunk):
+        symbols, counts = find_runs(chunk, self.use_numpy)
+        if len(symbols) == 0:
+            return b''
+        out = self._header()
+        if self.symbol is not None:
+            if symbols[0] == self.symbol:
+                counts[0] += self.count
+            else:
+                out += pack_runs([self.symbol], [self.count])
+        self.symbol, self.count = int(symbols[-1]), int(counts[-1])
+        return out + pack_runs(symbols[:-1], counts[:-1])
+
+    def flush(self):
+        out = self._header()
+        if self.symbol is not None:
+            out += pack_runs([self.symbol], [self.count])
+            self.symbol, self.count = None, 0
+        return out
+
+
+class _RunWriter:
+    # Expands runs into output blocks of at most block_size bytes
+    def __init__(self, block_size, use_numpy):
+        self.block_size = block_size
+        self.use_numpy = use_numpy
+        self.symbols, self.counts, self.total = [], [], 0
+
+    def add(self, symbol, count):
+        if count >= self.block_size:
+            yield from self.drain()
+            piece = symbol * self.block_size
+            for _ in range(count // self.block_size):
+                yield piece
+            count %= self.block_size
+            if not count:
+                return
+        if self.total + count > self.block_size:
+            yield from self.drain()
+        self.symbols.append(symbol)
+        self.counts.append(count)
+        self.total += count
+
+    def drain(self):
+        if not self.symbols:
+            return
+        if self.use_numpy and len(self.symbols) > 64:
+            codes = np.frombuffer(b''.join(self.symbols), dtype=np.uint8)
+            block = np.repeat(codes, self.counts).tobytes()
+        else:
+            block = type(self.symbols[0])().join(s * c for s, c in zip(self.symbols, self.counts))
+        self.symbols, self.counts, self.total = [], [], 0
+        yield block
+
+    def add_short_runs(self, symbols, counts):
+        # NumPy arrays of runs shorter than 128, expanded with np.repeat in blocks of at most block_size
+        yield from self.drain()
+        step = max(1, self.block_size // 128)
+        for i in range(0, len(symbols), step):
+            yield np.repeat(symbols[i:i + step], counts[i:i + step]).tobytes()
+
+
+class Decoder:
+    """
+    Incremental binary decoder. feed() yields decoded blocks; a record cut by
+    the chunk boundary waits for the next chunk.
+
+    With NumPy, stretches of two-byte records (every run shorter than 128, the
+    common case for poorly compressible input) are decoded as one array
+    operation: if the bytes at odd offsets from a record start are all below
+    0x80, every one of those records is a symbol plus a one-byte count.
+    """
+    window = 1 << 16
+
+    def __init__(self, block_size=BLOCK_SIZE, use_numpy=None):
+        self.use_numpy = use_numpy = np is not None if use_numpy is None else use_numpy
+        self.writer = _RunWriter(block_size, use_numpy)
+        self.buffer = b''
+        self.started = False
+
+    def feed(self, chunk):
+        data = self.buffer + chunk
+        pos = 0
+        if not self.started:
+            if len(data) < len(MAGIC):
+                self.buffer = data
+                return
+            if data[:len(MAGIC)] != MAGIC:
+                raise ValueError("Not a binary run-length stream (bad magic)")
+            self.started = True
+            pos = len(MAGIC)
+
+        n = len(data)
+        add = self.writer.add
+        fast = self.use_numpy and self.writer.block_size >= 128
+        streak = 0
+        while pos < n:
+            # Try the array path only after a streak of short records, so long-run
+            # data does not pay for a scan per record
+            if fast and streak >= 16 and n - pos >= 64:
+                streak = 0
+                view = np.frombuffer(data, dtype=np.uint8, count=min(n - pos, self.window) & ~1, offset=pos)
+                long_counts = np.flatnonzero(view[1::2] >= 0x80)
+                short = int(long_counts[0]) if len(long_counts) else len(view) // 2
+                if short:
+                    yield from self.writer.add_short_runs(view[0:2 * short:2], view[1:2 * short:2])
+                    pos += 2 * short
+                    continue
+            start = pos
+            symbol = data[pos:pos + 1]
+            pos += 1
+            count = shift = 0
+            while pos < n:
+                b = data[pos]
+                pos += 1
+                count |= (b & 0x7f) << shift
+                shift += 7
+                if b < 0x80:
+                    break
+            else:
+                pos = start
+                break
+            streak = streak + 1 if count < 0x80 else 0
+            yield from add(symbol, count)
+        self.buffer = data[pos:]
+        yield from self.writer.drain()
+
+    def flush(self):
+        if self.buffer or not self.started:
+            raise ValueError("Truncated run-length stream")
+        yield from self.writer.drain()
+
+
+class TextEncoder:
+    """Incremental encoder for the text form; same carry rule as Encoder."""
+
+    def __init__(self):
+        self.symbol = None
+        self.count = 0
+
+    def feed(self, chunk):
+        out = []
+        for m in _TEXT_RUN.finditer(chunk):
+            symbol, count = m.group(1), m.end() - m.start()
+            if symbol == self.symbol:
+                self.count += count
+                continue
+            if self.symbol is not None:
+                out.append(f"{self.symbol}{self.count}")
+            self.symbol, self.count = symbol, count
+        return ''.join(out)
+
+    def flush(self):
+        out = f"{self.symbol}{self.count}" if self.symbol is not None else ''
+        self.symbol, self.count = None, 0
+        return out
+
+
+class TextDecoder:
+    """Incremental decoder for the text form; a record ending at a chunk boundary waits, as its count may continue."""
+
+    def __init__(self, block_size=BLOCK_SIZE):
+        self.writer = _RunWriter(block_size, use_numpy=False)
+        self.buffer = ''
+
+    def _records(self, final):
+        data = self.buffer
+        pos = 0
+        for m in _TEXT_RECORD.finditer(data):
+            if m.start() != pos:
+                raise ValueError("Malformed run-length text")
+            if m.end() == len(data) and not final:
+                break
+            yield from self.writer.add(m.group(1), int(m.group(2)))
+            pos = m.end()
+        self.buffer = data[pos:]
+
+    def feed(self, chunk):
+        self.buffer += chunk
+        yield from self._records(final=False)
+        yield from self.writer.drain()
+
+    def flush(self):
+        yield from self._records(final=True)
+        if self.buffer:
+            raise ValueError("Malformed run-length text")
+        yield from self.writer.drain()
+
+
+def encode_bytes(data, use_numpy=None):
+    encoder = Encoder(use_numpy)
+    return encoder.feed(data) + encoder.flush()
+
+
+def decode_bytes(data, use_numpy=None):
+    decoder = Decoder(use_numpy=use_numpy)
+    return b''.join(decoder.feed(data)) + b''.join(decoder.flush())
+
+
+def _copy_chunks(src, dst, encoder, chunk_size):
+    # Streams src through an encoder whose feed/flush return a value (not a generator)
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        dst.write(encoder.feed(chunk))
+    dst.write(encoder.flush())
+
+
+def _drain_chunks(src, dst, decoder, chunk_size):
+    # Streams src through a decoder whose feed/flush yield output blocks
+    while True:
+        chunk = src.read(chunk_size)
+        if not chunk:
+            break
+        for block in decoder.feed(chunk):
+            dst.write(block)
+    for block in decoder.flush():
+        dst.write(block)
+
+
+def encode_file(src_path, dst_path, text=False, chunk_size=CHUNK_SIZE):
+    """Encodes a file in chunk_size pieces; text=True writes the 'a3b2' form."""
+    if text:
+        with open(src_path, 'r', newline='') as src, open(dst_path, 'w', newline='') as dst:
+            _copy_chunks(src, dst, TextEncoder(), chunk_size)
+    else:
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            _copy_chunks(src, dst, Encoder(), chunk_size)
+
+
+def decode_file(src_path, dst_path, text=False, chunk_size=CHUNK_SIZE):
+    """Decodes a file written by encode_file in constant memory."""
+    if text:
+        with open(src_path, 'r', newline='') as src, open(dst_path, 'w', newline='') as dst:
+            _drain_chunks(src, dst, TextDecoder(), chunk_size)
+    else:
+        with open(src_path, 'rb') as src, open(dst_path, 'wb') as dst:
+            _drain_chunks(src, dst, Decoder(), chunk_size)
+
+
+def repetitive_data(size, max_run=1000, alphabet=16, seed=0):
+    """Test data of random-length runs drawn from a small alphabet."""
+    import random
+    rng = random.Random(seed)
+    parts = []
+    total = 0
+    while total < size:
+        run = rng.randint(1, max_run)
+        parts.append(bytes((rng.randrange(alphabet),)) * run)
+        total += run
+    return b''.join(parts)[:size]
+
+
+def benchmark(size_mb=32, max_run=1000):
+    """
+    Encode/decode throughput (MB/s of raw data) and compression ratio of RLE,
+    with and without NumPy, against zlib on highly repetitive data.
+    """
+    data = repetitive_data(size_mb << 20, max_run)
+    codecs = {}
+    if np is not None:
+        codecs['rle (numpy)'] = (lambda d: encode_bytes(d, True), lambda d: decode_bytes(d, True))
+    codecs['rle (pure)'] = (lambda d: encode_bytes(d, False), lambda d: decode_bytes(d, False))
+    codecs['zlib level 1'] = (lambda d: zlib.compress(d, 1), zlib.decompress)
+    codecs['zlib level 6'] = (lambda d: zlib.compress(d, 6), zlib.decompress)
+
+    results = {}
+    for name, (encode, decode) in codecs.items():
+        start = time.perf_counter()
+        encoded = encode(data)
+        encode_s = time.perf_counter() - start
+        start = time.perf_counter()
+        decoded = decode(encoded)
+        decode_s = time.perf_counter() - start
+        if decoded != data:
+            raise AssertionError(f"{name} did not round-trip")
+        results[name] = {
+            'ratio': len(data) / len(encoded),
+            'encode_mb_s': size_mb / encode_s,
+            'decode_mb_s': size_mb / decode_s,
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run-length encode/decode files.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    for command in ('encode', 'decode'):
+        p = sub.add_parser(command)
+        p.add_argument('src')
+        p.add_argument('dst')
+        p.add_argument('--text', action='store_true', help="Use the 'a3b2' text form")
+        p.add_argument('--chunk-size', type=int, default=CHUNK_SIZE)
+    bench = sub.add_parser('bench', help="Compare against zlib on repetitive data")
+    bench.add_argument('--size-mb', type=int, default=32)
+    bench.add_argument('--max-run', type=int, default=1000)
+    args = parser.parse_args()
+
+    if args.command == 'bench':
+        print(f"{'codec':<14}{'ratio':>10}{'encode MB/s':>14}{'decode MB/s':>14}")
+        for name, r in benchmark(args.size_mb, args.max_run).items():
+            print(f"{name:<14}{r['ratio']:>10.1f}{r['encode_mb_s']:>14.1f}{r['decode_mb_s']:>14.1f}")
+        return
+
+    start = time.perf_counter()
+    codec = encode_file if args.command == 'encode' else decode_file
+    codec(args.src, args.dst, args.text, args.chunk_size)
+    print(f"{args.command}d {os.path.getsize(args.src)} -> {os.path.getsize(args.dst)} bytes "
+          f"in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from digits import digit_sums, digital_root, digital_roots
+
+
+def reference_sum(n):
+    return sum(map(int, str(abs(int(n)))))
+
+
+def test_uint64_boundary():
+    values = np.array([2**64 - 1, 2**63, 2**63 - 1, 0], dtype=np.uint64)
+    assert digit_sums(values).tolist() == [reference_sum(v) for v in values.tolist()]
+    assert digital_roots(values).tolist() == [digital_root(v) for v in values.tolist()]
+    assert digital_roots([2**64 - 1]).tolist() == [6]
+
+
+def test_int64_boundary():
+    values = np.array([-2**63, 2**63 - 1, -1, 0], dtype=np.int64)
+    assert digit_sums(values).tolist() == [reference_sum(v) for v in values.tolist()]
+    assert digital_roots(values).tolist() == [digital_root(v) for v in values.tolist()]
+
+
+def test_non_integer_input_is_rejected():
+    with pytest.raises(TypeError):
+        digit_sums(np.array([1.5]))
@@ -1,11 +1,5 @@
 num = int(input("enter the number :"))
 
-while num>=10:
-  total = 0
-  temp = num
-  while temp>0 :
-    digit = temp%10
-    total += digit
-    temp = temp//10
-    num = total
-print("unitary sum :" , num)
\ No newline at end of file
+# The repeated digit sum is the digital root: 0 for 0, else 1 + (n - 1) % 9
+# (digits.digital_root, without importing NumPy for one number)
+print("unitary sum :" , 0 if num == 0 else 1 + (abs(num) - 1) % 9)
@@ -0,0 +1,244 @@
+"""
+Circular-prime search over a whole range.
+
+tut03-part1.py checks one number by trial-dividing every rotation. To find all
+circular primes up to N this module instead:
+
+* sieves once with a segmented, odd-only sieve packed 8 numbers per byte
+  (10^8 fits in 6.25 MB), processed in cache-sized NumPy segments;
+* only considers numbers made of the digits 1, 3, 7 and 9: any other digit
+  ends up last in some rotation, making it even or a multiple of 5
+  (2 and 5 themselves are the exceptions);
+* tests each rotation class once, from its smallest rotation, and accepts or
+  rejects all of its members together;
+* generates the 4^d candidates of d digits lazily, in blocks of 4^8, so memory
+  stays flat as d grows.
+
+Range mode is limited to n <= RANGE_LIMIT (10^12, about 100 s); the time still
+grows about 4x per extra digit.
+
+Rotations above the sieve limit, and single huge inputs, use a Miller-Rabin test
+(deterministic for n < 3.3 * 10^24).
+
+Usage:
+    python circular_primes.py 100000000 [--list]
+    python circular_primes.py --check 1111111111111111111
+"""
+import argparse
+import time
+from functools import lru_cache
+from itertools import product
+from math import isqrt
+
+import numpy as np
+
+SEGMENT_SIZE = 1 << 21
+SIEVE_CAP = 10 ** 9
+RANGE_LIMIT = 10 ** 12
+CANDIDATE_BLOCK_DIGITS = 8
+MR_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+CIRCULAR_DIGITS = frozenset('1379')
+
+
+def miller_rabin(n):
+    """Primality test; deterministic for n < 3317044064679887385961981."""
+    if n < 2:
+        return False
+    for p in MR_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in MR_BASES:
+        x = pow(a, d, n)
+        if x == 1 or x == n - 1:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def small_primes(limit):
+    """All primes <= limit with a plain NumPy sieve (used for the base primes)."""
+    if limit < 2:
+        return np.array([], dtype=np.int64)
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, isqrt(limit) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    return np.flatnonzero(is_prime)
+
+
+class PackedSieve:
+    """
+    Primality of every number up to limit, one bit per odd number.
+
+    Example:
+        sieve = PackedSieve(10 ** 8)
+        sieve.is_prime(99999989)                     # True
+        sieve.contains(np.array([9, 11, 13, 15]))    # array([False, True, True, False])
+    """
+
+    def __init__(self, limit, segment_size=SEGMENT_SIZE):
+        self.limit = limit
+        n_odd = (limit + 1) // 2                 # bit i stands for 2i + 1
+        segment_size -= segment_size % 8        # segments start on byte boundaries
+        base = small_primes(isqrt(limit))[1:]   # odd base primes
+        self.bits = np.zeros((n_odd + 7) // 8, dtype=np.uint8)
+
+        for lo in range(0, n_odd, segment_size):
+            hi = min(lo + segment_size, n_odd)
+            segment = np.ones(hi - lo, dtype=bool)
+            first, last = 2 * lo + 1, 2 * hi - 1
+            for p in base:
+                p = int(p)
+                square = p * p
+                if square > last:
+                    break
+                # First odd multiple of p in the segment, never below p*p
+                start = max(square, -(-first // p) * p)
+                if start % 2 == 0:
+                    start += p
+                segment[(start - 1) // 2 - lo::p] = False
+            if lo == 0:
+                segment[0] = False               # 1 is not prime
+            self.bits[lo // 8:lo // 8 + (hi - lo + 7) // 8] = np.packbits(segment)
+
+    def is_prime(self, n):
+        if n == 2:
+            return True
+        if n < 2 or n % 2 == 0:
+            return False
+        if n > self.limit:
+            raise ValueError(f"{n} is beyond the sieve limit {self.limit}")
+        i = (n - 1) // 2
+        return bool((self.bits[i >> 3] >> (7 - (i & 7))) & 1)
+
+    def contains(self, values):
+        """Vectorized is_prime for an integer array with every value <= limit."""
+        values = np.asarray(values, dtype=np.int64)
+        i = np.maximum(values - 1, 0) // 2
+        prime = ((self.bits[i >> 3] >> (7 - (i & 7))) & 1).astype(bool)
+        return np.where(values % 2 == 0, values == 2, prime & (values > 1))
+
+    def count(self):
+        """Number of primes <= limit."""
+        return int(np.unpackbits(self.bits).sum()) + (self.limit >= 2)
+
+
+def rotations(n):
+    """Left rotations of n's digits, n itself first (like get_rotations in tut03-part1)."""
+    s = str(n)
+    return [int(s[i:] + s[:i]) for i in range(len(s))]
+
+
+@lru_cache(maxsize=None)
+def _rotation_class_is_prime(smallest):
+    return all(miller_rabin(r) for r in rotations(smallest))
+
+
+def is_circular_prime(n):
+    """
+    Single-number check with digit pruning and Miller-Rabin, so huge inputs are
+    fine. Results are cached per rotation class.
+    """
+    if n < 2:
+        return False
+    if n in (2, 5):
+        return True
+    if not CIRCULAR_DIGITS.issuperset(str(n)):
+        return False
+    return _rotation_class_is_prime(min(rotations(n)))
+
+
+def _digit_candidates(d, block_digits=CANDIDATE_BLOCK_DIGITS):
+    # Every d-digit number made only of 1, 3, 7 and 9, ascending, yielded in
+    # blocks: one fixed prefix of the leading digits each
+    low = min(d, block_digits)
+    suffixes = np.zeros(1, dtype=np.int64)
+    for _ in range(low):
+        suffixes = (suffixes[:, None] * 10 + np.array([1, 3, 7, 9], dtype=np.int64)).ravel()
+    for prefix in product('1379', repeat=d - low):
+        yield int(''.join(prefix) or 0) * 10 ** low + suffixes
+
+
+def _rotation_matrix(nums, d):
+    # Column k holds the left rotation by k digits
+    rots = np.empty((len(nums), d), dtype=np.int64)
+    for k in range(d):
+        split = 10 ** (d - k)
+        rots[:, k] = nums % split * 10 ** k + nums // split
+    return rots
+
+
+def _are_prime(values, sieve):
+    # Sieve lookups, with Miller-Rabin for values beyond the sieve
+    within = values <= sieve.limit
+    result = np.zeros(values.shape, dtype=bool)
+    result[within] = sieve.contains(values[within])
+    outside = np.flatnonzero(~within.ravel())
+    if len(outside):
+        result.ravel()[outside] = [miller_rabin(int(v)) for v in values.ravel()[outside]]
+    return result
+
+
+def circular_primes(n, sieve=None):
+    """
+    All circular primes <= n, ascending.
+
+    The sieve covers min(n, SIEVE_CAP); pass a prebuilt PackedSieve to reuse one
+    across calls.
+    """
+    if n > RANGE_LIMIT:
+        raise ValueError("Range mode supports n <= 10^12; use is_circular_prime for single numbers.")
+    if sieve is None:
+        sieve = PackedSieve(min(n, SIEVE_CAP))
+    found = [p for p in (2, 3, 5, 7) if p <= n]
+    for d in range(2, len(str(n)) + 1):
+        members = []
+        for candidates in _digit_candidates(d):
+            if candidates[0] > n:
+                break
+            # One representative per rotation class: the candidate that is its own smallest rotation
+            representatives = candidates[candidates == _rotation_matrix(candidates, d).min(axis=1)]
+            rots = _rotation_matrix(representatives, d)
+            # Cheap filter first: the representative itself must be prime
+            rots = rots[_are_prime(rots[:, 0], sieve)]
+            members.append(rots[_are_prime(rots, sieve).all(axis=1)].ravel())
+        # Members of a class can fall in other blocks than its representative
+        members = np.unique(np.concatenate(members)) if members else np.array([], dtype=np.int64)
+        found.extend(int(m) for m in members[members <= n])
+    return found
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find circular primes.")
+    parser.add_argument('n', nargs='?', type=int, help="Find all circular primes up to n")
+    parser.add_argument('--list', action='store_true', help="Print every circular prime found")
+    parser.add_argument('--check', type=int, help="Check a single (possibly huge) number")
+    args = parser.parse_args()
+
+    if args.check is not None:
+        verdict = "is" if is_circular_prime(args.check) else "is not"
+        print(f"{args.check} {verdict} a rotational prime.")
+        return
+    if args.n is None:
+        parser.error("give n or --check")
+
+    start = time.perf_counter()
+    found = circular_primes(args.n)
+    elapsed = time.perf_counter() - start
+    if args.list:
+        print(*found, sep='\n')
+    print(f"{len(found)} circular primes up to {args.n} ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Lazy permutations of multisets.
+
+tut03-part2.py used to build every permutation (duplicates included) in a list
+before printing: O(n! * n) memory, and "aab" printed "aab" twice. This module
+generates the distinct permutations lazily, in lexicographic order, with the
+classic next-permutation step (swap, then reverse the suffix), so memory is
+O(n) and a repeated character never produces a duplicate.
+
+* rank()/unrank() map between a permutation and its lexicographic index
+  without enumerating, so any slice [start, stop) can be generated directly.
+* parallel_map() shards the permutation space by prefix across worker
+  processes; parallel_count() is the common case.
+
+Usage:
+    python permutations.py aabbc [--count]
+    python permutations.py --bench aabbccdde
+"""
+import argparse
+import itertools
+import os
+import time
+import tracemalloc
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from math import factorial
+
+
+def next_permutation(seq):
+    """
+    Rearranges a list into the next lexicographic permutation in place.
+    Returns False (leaving seq unchanged) if it was the last one.
+    """
+    i = len(seq) - 2
+    while i >= 0 and seq[i] >= seq[i + 1]:
+        i -= 1
+    if i < 0:
+        return False
+    j = len(seq) - 1
+    while seq[j] <= seq[i]:
+        j -= 1
+    seq[i], seq[j] = seq[j], seq[i]
+    seq[i + 1:] = seq[:i:-1]
+    return True
+
+
+def _joiner(items):
+    return ''.join if isinstance(items, str) else tuple
+
+
+def count_permutations(items):
+    """Number of distinct permutations: n! / (c1! * c2! * ...)."""
+    total = factorial(len(items))
+    for c in Counter(items).values():
+        total //= factorial(c)
+    return total
+
+
+def rank(perm):
+    """Lexicographic index of perm among the distinct permutations of its items."""
+    counts = Counter(perm)
+    remaining = len(perm)
+    total = count_permutations(perm)
+    index = 0
+    for item in perm:
+        # Permutations of the remaining items starting with s: total * counts[s] / remaining
+        smaller = sum(c for s, c in counts.items() if s < item)
+        index += total * smaller // remaining
+        total = total * counts[item] // remaining
+        counts[item] -= 1
+        remaining -= 1
+    return index
+
+
+def unrank(items, index):
+    """The distinct permutation of items with the given lexicographic index."""
+    counts = Counter(items)
+    symbols = sorted(counts)
+    remaining = len(items)
+    total = count_permutations(items)
+    if not 0 <= index < total:
+        raise IndexError(f"Permutation index {index} out of range (0..{total - 1})")
+    perm = []
+    for _ in range(len(items)):
+        for s in symbols:
+            if not counts[s]:
+                continue
+            block = total * counts[s] // remaining
+            if index < block:
+                perm.append(s)
+                total = block
+                counts[s] -= 1
+                remaining -= 1
+                break
+            index -= block
+    return _joiner(items)(perm)
+
+
+def multiset_permutations(items, start=0, stop=None):
+    """
+    Yields the distinct permutations of items in lexicographic order, from index
+    start up to (not including) stop. Strings yield strings, other sequences
+    yield tuples.
+
+    Example:
+        list(multiset_permutations('aab'))              # ['aab', 'aba', 'baa']
+        next(multiset_permutations('aabbcc', 50))       # unrank('aabbcc', 50)
+    """
+    join = _joiner(items)
+    if start and start >= count_permutations(items):
+        return
+    seq = list(unrank(items, start)) if start else sorted(items)
+    remaining = None if stop is None else stop - start
+    while remaining is None or remaining > 0:
+        yield join(seq)
+        if remaining is not None:
+            remaining -= 1
+        if not next_permutation(seq):
+            return
+
+
+def prefix_shards(items, depth):
+    """
+    Distinct prefixes of the given length, in lexicographic order, each with the
+    multiset of items left after it.
+
+    Returns:
+        list: (prefix, rest) tuples; prefix + every permutation of rest covers
+        the permutation space exactly once.
+    """
+    shards = []
+
+    def extend(prefix, counts, left):
+        if left == 0:
+            rest = [s for s in sorted(counts) for _ in range(counts[s])]
+            shards.append((prefix, rest))
+            return
+        for s in sorted(counts):
+            if counts[s]:
+                counts[s] -= 1
+                extend(prefix + [s], counts, left - 1)
+                counts[s] += 1
+
+    extend([], Counter(items), min(depth, len(items)))
+    return shards
+
+
+def _auto_depth(items, workers):
+    # Shallowest depth giving a few shards per worker, for load balancing
+    target = 4 * workers
+    for depth in range(1, len(items) + 1):
+        if len(prefix_shards(items, depth)) >= target:
+            return depth
+    return len(items)
+
+
+def _run_shard(func, as_str, prefix, rest):
+    join = ''.join if as_str else tuple
+    head = join(prefix)
+    perms = (head + p for p in multiset_permutations(join(rest)))
+    return func(perms)
+
+
+def parallel_map(items, func, depth=None, workers=None):
+    """
+    Calls func(perms) in a worker process for every prefix shard, where perms
+    lazily yields that shard's permutations. func must be picklable (a
+    module-level function or functools.partial of one).
+
+    Returns:
+        list: func's results, in lexicographic order of the shards.
+    """
+    workers = workers or os.cpu_count() or 1
+    depth = depth or _auto_depth(items, workers)
+    shards = prefix_shards(items, depth)
+    as_str = isinstance(items, str)
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_run_shard, func, as_str, prefix, rest) for prefix, rest in shards]
+        return [future.result() for future in futures]
+
+
+def _count(predicate, perms):
+    if predicate is None:
+        return sum(1 for _ in perms)
+    return sum(1 for p in perms if predicate(p))
+
+
+def parallel_count(items, predicate=None, depth=None, workers=None):
+    """Counts the distinct permutations (matching a picklable predicate, if given) in parallel."""
+    return sum(parallel_map(items, partial(_count, predicate), depth, workers))
+
+
+def benchmark(items):
+    """
+    Time and peak memory to obtain every distinct permutation: this generator
+    against set(itertools.permutations(...)).
+    """
+    results = {}
+    candidates = {
+        'multiset_permutations': lambda: sum(1 for _ in multiset_permutations(items)),
+        'itertools + set': lambda: len(set(itertools.permutations(items))),
+    }
+    for name, run in candidates.items():
+        tracemalloc.start()
+        start = time.perf_counter()
+        count = run()
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        results[name] = {'count': count, 'seconds': elapsed, 'peak_mb': peak / 2 ** 20}
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Distinct permutations of a string.")
+    parser.add_argument('string')
+    parser.add_argument('--count', action='store_true', help="Only count, in parallel")
+    parser.add_argument('--bench', action='store_true', help="Compare with itertools.permutations + set")
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    if args.bench:
+        for name, r in benchmark(args.string).items():
+            print(f"{name:<22} {r['count']:>10} perms  {r['seconds']:8.3f}s  peak {r['peak_mb']:8.1f} MB")
+    elif args.count:
+        print(parallel_count(args.string, workers=args.workers))
+    else:
+        for perm in multiset_permutations(args.string):
+            print(perm)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""
+Anagram index for large word lists.
+
+Words are grouped under a signature shared by all their anagrams: the sorted
+lowercase letters ("listen" -> "eilnst"), or a 26-letter count vector for
+words made only of ASCII letters (any other word falls back to the sorted
+signature). Groups and the words inside them live in dicts, so
+they keep first-seen order with no words.index() scans, and duplicate words are
+dropped in O(1). Building is one pass over a streamed file (O(n) time,
+memory proportional to the words kept). "Anagrams of X" is one dict lookup, and
+the index can be saved and reloaded without re-reading the word list.
+
+Usage:
+    python anagram_index.py build words.txt words.idx
+    python anagram_index.py query words.idx listen
+    python anagram_index.py groups words.idx [--top 10]
+"""
+import argparse
+import heapq
+import os
+import pickle
+import string
+import time
+
+FORMAT_VERSION = 2
+
+
+def sorted_signature(word):
+    """'Listen' -> 'eilnst'."""
+    return ''.join(sorted(word.lower()))
+
+
+def count_signature(word):
+    """
+    26 letter counts for a word of ASCII letters only; any other word gets its
+    sorted_signature, so digits, punctuation and non-ASCII letters still count.
+    """
+    if not (word.isascii() and word.isalpha()):
+        return sorted_signature(word)
+    word = word.lower()
+    counts = map(word.count, string.ascii_lowercase)
+    # No count exceeds the word length, so one byte per letter is enough below 256;
+    # anagrams have equal lengths and therefore always get the same kind of key
+    return bytes(counts) if len(word) < 256 else tuple(counts)
+
+
+SIGNATURES = {'sorted': sorted_signature, 'counts': count_signature}
+
+
+def iter_words(path, encoding='utf-8'):
+    """Streams a word list, one word per line; blank lines are skipped."""
+    with open(path, 'r', encoding=encoding, errors='replace') as f:
+        for line in f:
+            word = line.strip()
+            if word:
+                yield word
+
+
+class AnagramIndex:
+    """
+    Words grouped by anagram signature, in first-seen order.
+
+    Example:
+        index = AnagramIndex()
+        index.update(["listen", "silent", "cat", "act"])
+        index.anagrams_of("enlist")      # ['listen', 'silent']
+        list(index.groups())             # [['listen', 'silent'], ['cat', 'act']]
+    """
+
+    def __init__(self, key='sorted'):
+        if key not in SIGNATURES:
+            raise ValueError(f"Unknown signature {key!r}. Choose from {sorted(SIGNATURES)}.")
+        self.key = key
+        self.signature = SIGNATURES[key]
+        self.index = {}
+        self.size = 0
+
+    def add(self, word):
+        """Adds a word; a word already in its group is not added twice."""
+        self.update((word,))
+
+    def update(self, words):
+        signature, index = self.signature, self.index
+        for word in words:
+            key = signature(word)
+            group = index.get(key)
+            if group is None:
+                index[key] = {word: None}
+            elif word in group:
+                continue
+            else:
+                group[word] = None
+            self.size += 1
+        return self
+
+    @classmethod
+    def from_file(cls, path, key='sorted'):
+        return cls(key).update(iter_words(path))
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, word):
+        return word in self.index.get(self.signature(word), ())
+
+    def anagrams_of(self, word, include_self=False):
+        """Indexed anagrams of word (which need not be indexed itself), in first-seen order."""
+        group = self.index.get(self.signature(word), {})
+        return list(group) if include_self else [w for w in group if w != word]
+
+    def groups(self, min_size=1):
+        """Groups in first-seen order; min_size=2 keeps only words with anagrams."""
+        return (list(group) for group in self.index.values() if len(group) >= min_size)
+
+    def largest_groups(self, top=10):
+        """The top groups by word count, ties broken by first-seen order."""
+        ranked = heapq.nsmallest(top, enumerate(self.index.values()), key=lambda item: (-len(item[1]), item[0]))
+        return [list(group) for _, group in ranked]
+
+    def save(self, path):
+        """Pickles the index atomically (written to a temp file, then renamed)."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'version': FORMAT_VERSION, 'key': self.key, 'size': self.size, 'index': self.index},
+                        f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Loads an index written by save(). Only load files you created: this unpickles."""
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+        if data.get('version') != FORMAT_VERSION:
+            raise ValueError(f"{path} was written by an incompatible version of the index")
+        index = cls(data['key'])
+        index.index = data['index']
+        index.size = data['size']
+        return index
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and query an anagram index.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    build = sub.add_parser('build', help="Index a word list (one word per line)")
+    build.add_argument('words')
+    build.add_argument('index')
+    build.add_argument('--key', choices=sorted(SIGNATURES), default='sorted')
+    query = sub.add_parser('query', help="Anagrams of one or more words")
+    query.add_argument('index')
+    query.add_argument('words', nargs='+')
+    groups = sub.add_parser('groups', help="Largest anagram groups")
+    groups.add_argument('index')
+    groups.add_argument('--top', type=int, default=10)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'build':
+        index = AnagramIndex.from_file(args.words, args.key)
+        index.save(args.index)
+        print(f"Indexed {len(index)} words in {len(index.index)} groups ({time.perf_counter() - start:.2f}s)")
+        return
+
+    index = AnagramIndex.load(args.index)
+    if args.command == 'query':
+        for word in args.words:
+            print(f"{word}: {index.anagrams_of(word)}")
+    else:
+        for group in index.largest_groups(args.top):
+            print(f"{len(group)}: {group}")
+
+
+if __name__ == "__main__":
+    main()
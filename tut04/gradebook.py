@@ -0,0 +1,248 @@
+"""
+Gradebook with incremental averages and a maintained ranking.
+
+tut04-part1.py keeps every grade list and recomputes every average whenever it
+prints or sorts. Here each student is a slot in two compact arrays (running sum
+and grade count), so adding or replacing grades updates the average in O(1).
+
+The ranking is a sorted list of (-average, slot) keys. It is built with one
+sort on the first ranking query and then kept up to date with bisect on each
+update, so top-k is a slice and a student's rank is a binary search. Ties keep
+insertion order, as sorted(..., reverse=True) does in tut04-part1.py. Students
+with no grades have no average and are not ranked.
+
+Gradebooks are loaded from and saved to CSV, so a 100k-student cohort needs no
+input() loop:
+
+* read_grades() streams rows of "name,grade,grade,...". A name seen again gets
+  the new grades added.
+* save()/load() store "name,count,total,average" rows, one per student.
+
+Usage:
+    python gradebook.py grades.csv [--top 10] [--rank alice bob] [--save book.csv]
+    python gradebook.py --load book.csv --top 10
+    python gradebook.py --bench 100000
+"""
+import argparse
+import csv
+import os
+import random
+import time
+from array import array
+from bisect import bisect_left, insort
+
+SAVE_HEADER = ['name', 'count', 'total', 'average']
+
+
+class Gradebook:
+    """
+    Students (case-insensitive names) with running grade sums and counts.
+
+    Example:
+        book = Gradebook()
+        book.set_grades("Alice", [90, 80])
+        book.add_grades("bob", [70])
+        book.average("alice")      # 85.0
+        book.top(1)                # [('alice', 85.0)]
+        book.rank("bob")           # 2
+    """
+
+    def __init__(self, keep_grades=False):
+        self.names = []
+        self.slots = {}
+        self.totals = array('d')
+        self.counts = array('I')
+        # Grade lists are only kept on request (e.g. to print them); averages never need them
+        self.grades = [] if keep_grades else None
+        self._ranking = None
+
+    def __len__(self):
+        return len(self.names)
+
+    def __contains__(self, name):
+        return name.lower() in self.slots
+
+    def _slot(self, name):
+        name = name.lower()
+        slot = self.slots.get(name)
+        if slot is None:
+            slot = self.slots[name] = len(self.names)
+            self.names.append(name)
+            self.totals.append(0.0)
+            self.counts.append(0)
+            if self.grades is not None:
+                self.grades.append([])
+        return slot
+
+    def _key(self, slot):
+        return (-self.totals[slot] / self.counts[slot], slot)
+
+    def _update(self, slot, total, count, grades=None):
+        ranking = self._ranking
+        if ranking is not None and self.counts[slot]:
+            old = self._key(slot)
+            del ranking[bisect_left(ranking, old)]
+        self.totals[slot] = total
+        self.counts[slot] = count
+        if grades is not None and self.grades is not None:
+            self.grades[slot] = grades
+        if ranking is not None and count:
+            insort(ranking, self._key(slot))
+
+    def set_grades(self, name, grades):
+        """Replaces a student's grades (adding the student if needed), like update_grades()."""
+        grades = list(grades)
+        self._update(self._slot(name), float(sum(grades)), len(grades), grades)
+
+    def add_grades(self, name, grades):
+        """Adds grades to a student's existing ones."""
+        grades = list(grades)
+        slot = self._slot(name)
+        if self.grades is not None:
+            self.grades[slot].extend(grades)
+        self._update(slot, self.totals[slot] + sum(grades), self.counts[slot] + len(grades))
+
+    def add_grade(self, name, grade):
+        self.add_grades(name, (grade,))
+
+    def remove(self, name):
+        """Drops a student from the ranking (the slot is kept, with no grades)."""
+        self._update(self.slots[name.lower()], 0.0, 0, [])
+
+    def average(self, name):
+        """A student's average, or None if they have no grades."""
+        slot = self.slots[name.lower()]
+        return self.totals[slot] / self.counts[slot] if self.counts[slot] else None
+
+    def grades_of(self, name):
+        if self.grades is None:
+            raise ValueError("Grade lists are not kept; create the Gradebook with keep_grades=True")
+        return self.grades[self.slots[name.lower()]]
+
+    def ranking(self):
+        """The (-average, slot) keys in rank order, built on first use and maintained after that."""
+        if self._ranking is None:
+            self._ranking = sorted(self._key(slot) for slot in range(len(self.names)) if self.counts[slot])
+        return self._ranking
+
+    def top(self, k=10):
+        """The k best students as (name, average), best first."""
+        return [(self.names[slot], -neg_avg) for neg_avg, slot in self.ranking()[:k]]
+
+    def rank(self, name):
+        """1-based rank of a student, or None if they have no grades."""
+        slot = self.slots[name.lower()]
+        if not self.counts[slot]:
+            return None
+        return bisect_left(self.ranking(), self._key(slot)) + 1
+
+    @classmethod
+    def from_dict(cls, students, keep_grades=False):
+        """A gradebook from a tut04-part1 students dict (name -> grade list)."""
+        book = cls(keep_grades)
+        for name, grades in students.items():
+            book.set_grades(name, grades)
+        return book
+
+    def read_grades(self, path):
+        """Streams "name,grade,grade,..." rows from a CSV file; a non-numeric first row is skipped as a header."""
+        with open(path, newline='') as f:
+            for line_no, row in enumerate(csv.reader(f)):
+                if not row or not row[0].strip():
+                    continue
+                try:
+                    grades = [float(g) for g in row[1:] if g.strip()]
+                except ValueError:
+                    if line_no == 0:
+                        continue
+                    raise ValueError(f"{path}:{line_no + 1}: grades must be numbers") from None
+                self.add_grades(row[0].strip(), grades)
+        return self
+
+    def save(self, path):
+        """Writes "name,count,total,average" rows atomically (temp file, then rename)."""
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(SAVE_HEADER)
+            for slot, name in enumerate(self.names):
+                count = self.counts[slot]
+                average = f"{self.totals[slot] / count:.4f}" if count else ''
+                writer.writerow([name, count, repr(self.totals[slot]), average])
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """Loads a gradebook written by save() (grade lists are not stored)."""
+        book = cls()
+        with open(path, newline='') as f:
+            reader = csv.reader(f)
+            if next(reader, None) != SAVE_HEADER:
+                raise ValueError(f"{path} is not a saved gradebook (expected header {','.join(SAVE_HEADER)})")
+            for name, count, total, _ in reader:
+                slot = book._slot(name)
+                book.totals[slot] = float(total)
+                book.counts[slot] = int(count)
+        return book
+
+
+def benchmark(n_students=100000, n_updates=100, seed=0):
+    """
+    Seconds for n_updates grade updates, each followed by a top-10 query: the
+    tut04-part1 full re-sort against the maintained ranking.
+    """
+    rng = random.Random(seed)
+    students = {f"student{i}": [rng.randint(0, 100) for _ in range(5)] for i in range(n_students)}
+    updates = [(f"student{rng.randrange(n_students)}", [rng.randint(0, 100) for _ in range(5)])
+               for _ in range(n_updates)]
+    timings = {}
+
+    start = time.perf_counter()
+    for name, grades in updates:
+        students[name] = grades
+        sorted(students.items(), key=lambda x: sum(x[1]) / len(x[1]), reverse=True)[:10]
+    timings['re-sort per query'] = time.perf_counter() - start
+
+    book = Gradebook.from_dict(students)
+    start = time.perf_counter()
+    book.top(10)
+    timings['gradebook first ranking'] = time.perf_counter() - start
+    start = time.perf_counter()
+    for name, grades in updates:
+        book.set_grades(name, grades)
+        book.top(10)
+    timings['gradebook update + top'] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Averages and rankings for large gradebooks.")
+    parser.add_argument('grades', nargs='?', help='CSV of "name,grade,grade,..." rows')
+    parser.add_argument('--load', help="Gradebook saved with --save")
+    parser.add_argument('--save', help="Write name,count,total,average rows here")
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--rank', nargs='+', default=[], metavar='NAME')
+    parser.add_argument('--bench', type=int, metavar='N', help="Benchmark with N random students")
+    args = parser.parse_args()
+
+    if args.bench:
+        for name, seconds in benchmark(args.bench).items():
+            print(f"{name:<26} {seconds:8.3f}s")
+        return
+    if bool(args.grades) == bool(args.load):
+        parser.error("give either a grades CSV or --load")
+
+    book = Gradebook.load(args.load) if args.load else Gradebook().read_grades(args.grades)
+    for position, (name, avg) in enumerate(book.top(args.top), 1):
+        print(f"{position:>4}. {name.capitalize()} - Average: {avg:.2f}")
+    for name in args.rank:
+        if name not in book:
+            print(f"{name}: not found")
+        else:
+            print(f"{name.capitalize()}: rank {book.rank(name)} of {len(book.ranking())}, average {book.average(name)}")
+    if args.save:
+        book.save(args.save)
+
+
+if __name__ == "__main__":
+    main()
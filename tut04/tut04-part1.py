@@ -1,3 +1,5 @@
+from gradebook import Gradebook
+
 def add_student(students, name, grades):
     students[name.lower()] = grades
 
@@ -7,15 +9,17 @@ def update_grades(students, name, grades):
 def calculate_average(grades):
     return sum(grades) / len(grades)
 
-def print_averages(students):
-    averages = {name: calculate_average(grades) for name, grades in students.items()}
-    sorted_averages = sorted(averages.items(), key=lambda x: x[1], reverse=True)
-    for name, avg in sorted_averages:
+def print_averages(students, book=None):
+    # Each average is computed once, in the Gradebook, instead of once per sort
+    if book is None:
+        book = Gradebook.from_dict(students)
+    for name, avg in book.top(len(book)):
         print(f"{name.capitalize()} - Average: {avg:.2f}")
 
-def sort_students(students):
-    sorted_students = sorted(students.items(), key=lambda x: calculate_average(x[1]), reverse=True)
-    return sorted_students
+def sort_students(students, book=None):
+    if book is None:
+        book = Gradebook.from_dict(students)
+    return [(name, students[name]) for name, _ in book.top(len(book))]
 
 def get_student_data():
     students = {}
@@ -28,15 +32,17 @@ def get_student_data():
         add_student(students, name, grades)
     return students
 
-# Get student data
-students = get_student_data()
+if __name__ == "__main__":
+    # Get student data (bulk CSV gradebooks: python gradebook.py grades.csv)
+    students = get_student_data()
+    book = Gradebook.from_dict(students)
 
-# Print averages sorted
-print("\nStudent Averages:")
-print_averages(students)
+    # Print averages sorted
+    print("\nStudent Averages:")
+    print_averages(students, book)
 
-# Sort students by average
-print("\nSorted Students by Average:")
-sorted_students = sort_students(students)
-for name, grades in sorted_students:
-    print(f"{name.capitalize()} - Grades: {grades}")
\ No newline at end of file
+    # Sort students by average
+    print("\nSorted Students by Average:")
+    sorted_students = sort_students(students, book)
+    for name, grades in sorted_students:
+        print(f"{name.capitalize()} - Grades: {grades}")
\ No newline at end of file
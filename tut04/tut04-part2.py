@@ -14,22 +14,23 @@ def calculate_frequency(word_list):
     return frequency
 
 def main(words):
-    anagrams = group_anagrams(words)
-    sorted_anagrams = sorted(anagrams.keys(), key=lambda x: words.index(anagrams[x][0]))
-    anagram_dict = {word: anagrams[word] for word in sorted_anagrams}
+    # Groups are created in first-seen order, so the dict is already ordered by each group's first word
+    anagram_dict = dict(group_anagrams(words))
 
+    # The total letter frequency of a group is just its total length; only the winner needs a Counter
     max_freq_word = None
     max_freq = Counter()
+    if anagram_dict:
+        best = max(anagram_dict.values(), key=lambda word_list: sum(map(len, word_list)))
+        max_freq_word = best[0]
+        max_freq = calculate_frequency(best)
 
-    for word_list in anagram_dict.values():
-        freq = calculate_frequency(word_list)
-        if sum(freq.values()) > sum(max_freq.values()):
-            max_freq = freq
-            max_freq_word = word_list[0]
-
-    print(f"words = {sorted(words, key=lambda x: words.index(x))}")
+    first_seen = {}
+    for i, word in enumerate(words):
+        first_seen.setdefault(word, i)
+    print(f"words = {sorted(words, key=first_seen.__getitem__)}")
     print(f"Anagram Dictionary = {anagram_dict}")
     print(f"Group with highest total frequency: {max_freq_word} - {max_freq}")
 
 words = ["listen", "silent", "enlist", "inlets", "google", "goolge", "cat", "tac", "act"]
-main(words)
\ No newline at end of file
+main(words)
@@ -0,0 +1,252 @@
+"""
+Streaming, chunk-parallel bracket validation for large files.
+
+Unlike isValid in tut05_part2.py, every byte that is not one of ()[]{} is
+skipped, and a failure comes with the byte position of the first error.
+
+Each chunk of the file is reduced to a Summary: the closers it could not match
+(they belong to openers in earlier chunks), the openers still open at its end,
+and the first error found inside it, if any. Summaries combine associatively,
+(a + b) + c == a + (b + c), so chunks can be reduced in worker processes and
+folded in order. Memory is bounded by the unmatched brackets, not the file size.
+
+With NumPy a chunk is summarized without a Python loop over brackets: with the
+nesting depth as a cumulative sum, an opener and its closer share a depth
+level, so a stable sort by (level, position) puts every matched pair next to
+each other.
+
+Usage:
+    python brackets.py big.json [-j WORKERS] [--chunk-mb 64]
+"""
+import argparse
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import numpy as np
+except ImportError:  # the pure-Python scanner still works
+    np = None
+
+CHUNK_SIZE = 64 << 20
+OPENERS = '([{'
+CLOSERS = ')]}'
+# Opener codes are 1..3, the matching closer is the negative code
+CODES = {ord(ch): i + 1 for i, ch in enumerate(OPENERS)}
+CODES.update({ord(ch): -(i + 1) for i, ch in enumerate(CLOSERS)})
+_BRACKET = re.compile(rb'[()\[\]{}]')
+
+
+def _char(code):
+    return OPENERS[code - 1] if code > 0 else CLOSERS[-code - 1]
+
+
+def _mismatch(closer_code, closer_pos, opener_code, opener_pos):
+    return (closer_pos, f"mismatched '{_char(closer_code)}' at byte {closer_pos}, "
+                        f"expected '{_char(-opener_code)}' for '{_char(opener_code)}' at byte {opener_pos}")
+
+
+class Summary:
+    """
+    Reduction of a byte range: unmatched closers and openers (codes and
+    positions, in file order) plus the first error as (position, message).
+    Closers after an error are dropped, since the scan would have stopped there.
+    """
+    __slots__ = ('closer_codes', 'closer_pos', 'opener_codes', 'opener_pos', 'error')
+
+    def __init__(self, closer_codes=(), closer_pos=(), opener_codes=(), opener_pos=(), error=None):
+        self.closer_codes = list(closer_codes)
+        self.closer_pos = list(closer_pos)
+        self.opener_codes = list(opener_codes)
+        self.opener_pos = list(opener_pos)
+        self.error = error
+
+    def __add__(self, other):
+        if self.error is not None:
+            return self
+        # The other range's unmatched closers pop this range's open stack, innermost first
+        k = min(len(self.opener_codes), len(other.closer_codes))
+        for j in range(k):
+            opener_code = self.opener_codes[-1 - j]
+            if other.closer_codes[j] != -opener_code:
+                return Summary(self.closer_codes, self.closer_pos, error=_mismatch(
+                    other.closer_codes[j], other.closer_pos[j], opener_code, self.opener_pos[-1 - j]))
+        n_open = len(self.opener_codes) - k
+        return Summary(
+            self.closer_codes + other.closer_codes[k:],
+            self.closer_pos + other.closer_pos[k:],
+            self.opener_codes[:n_open] + other.opener_codes,
+            self.opener_pos[:n_open] + other.opener_pos,
+            other.error,
+        )
+
+
+def _summarize_python(chunk, offset):
+    closer_codes, closer_pos, stack_codes, stack_pos = [], [], [], []
+    for m in _BRACKET.finditer(chunk):
+        pos = offset + m.start()
+        code = CODES[chunk[m.start()]]
+        if code > 0:
+            stack_codes.append(code)
+            stack_pos.append(pos)
+        elif not stack_codes:
+            closer_codes.append(code)
+            closer_pos.append(pos)
+        elif stack_codes[-1] == -code:
+            stack_codes.pop()
+            stack_pos.pop()
+        else:
+            return Summary(closer_codes, closer_pos, error=_mismatch(code, pos, stack_codes[-1], stack_pos[-1]))
+    return Summary(closer_codes, closer_pos, stack_codes, stack_pos)
+
+
+def _summarize_numpy(chunk, offset):
+    table = np.zeros(256, dtype=np.int8)
+    for byte, code in CODES.items():
+        table[byte] = code
+    codes_all = table[np.frombuffer(chunk, dtype=np.uint8)]
+    pos = np.flatnonzero(codes_all)
+    if len(pos) == 0:
+        return Summary()
+    codes = codes_all[pos].astype(np.int64)
+    step = np.sign(codes)
+    after = np.cumsum(step)
+    before = after - step
+    is_opener = step > 0
+
+    # A closer is unmatched if it takes the depth to a new low below zero
+    low_before = np.minimum.accumulate(np.concatenate(([0], after[:-1])))
+    lone_closer = ~is_opener & (after < np.minimum(low_before, 0))
+    # An opener is unmatched if the depth never drops below its level afterwards
+    suffix_low = np.minimum.accumulate(after[::-1])[::-1]
+    later_low = np.concatenate((suffix_low[1:], [np.iinfo(np.int64).max]))
+    lone_opener = is_opener & (later_low >= after)
+
+    # Matched brackets: an opener and its closer share a level, and are adjacent once sorted by (level, position)
+    matched = np.flatnonzero(~(lone_closer | lone_opener))
+    level = np.where(is_opener, after, before)[matched]
+    order = matched[np.argsort(level, kind='stable')]
+    openers, closers = order[0::2], order[1::2]
+    bad = np.flatnonzero(codes[openers] != -codes[closers])
+
+    error = None
+    limit = len(codes)
+    if len(bad):
+        # The first bad closer in file order is where the scan stops
+        first = bad[np.argmin(closers[bad])]
+        o, c = openers[first], closers[first]
+        error = _mismatch(int(codes[c]), offset + int(pos[c]), int(codes[o]), offset + int(pos[o]))
+        limit = int(c)
+    lone_c = np.flatnonzero(lone_closer[:limit])
+    if error is not None:
+        return Summary(codes[lone_c].tolist(), (pos[lone_c] + offset).tolist(), error=error)
+    lone_o = np.flatnonzero(lone_opener)
+    return Summary(codes[lone_c].tolist(), (pos[lone_c] + offset).tolist(),
+                   codes[lone_o].tolist(), (pos[lone_o] + offset).tolist())
+
+
+def summarize_chunk(chunk, offset=0, use_numpy=None):
+    """Summary of a bytes chunk that starts at byte offset in the file."""
+    if use_numpy is None:
+        use_numpy = np is not None
+    return _summarize_numpy(chunk, offset) if use_numpy else _summarize_python(chunk, offset)
+
+
+def verdict(summary, size):
+    """
+    Final result of a whole-input Summary.
+
+    Returns:
+        dict: valid (bool), position (byte of the first error, None if valid) and message.
+    """
+    # Unmatched closers are kept only when they come before the recorded error
+    if summary.closer_codes:
+        position = summary.closer_pos[0]
+        message = f"unexpected '{_char(summary.closer_codes[0])}' at byte {position}, nothing is open"
+    elif summary.error is not None:
+        position, message = summary.error
+    elif summary.opener_codes:
+        position = size
+        message = (f"end of input with {len(summary.opener_codes)} unclosed bracket(s), innermost "
+                   f"'{_char(summary.opener_codes[-1])}' at byte {summary.opener_pos[-1]}")
+    else:
+        return {'valid': True, 'position': None, 'message': "valid"}
+    return {'valid': False, 'position': position, 'message': message}
+
+
+def validate_bytes(data, use_numpy=None):
+    """Validates an in-memory bytes/str value."""
+    if isinstance(data, str):
+        data = data.encode()
+    return verdict(summarize_chunk(data, 0, use_numpy), len(data))
+
+
+def _summarize_range(path, start, end, use_numpy):
+    with open(path, 'rb') as f:
+        f.seek(start)
+        return summarize_chunk(f.read(end - start), start, use_numpy)
+
+
+def validate_file(path, chunk_size=CHUNK_SIZE, workers=1, use_numpy=None):
+    """
+    Validates a file chunk by chunk. With workers > 1, chunks are summarized in
+    a process pool and folded in file order. Brackets are single ASCII bytes, so
+    chunks may split the file anywhere, even inside a UTF-8 character.
+    """
+    size = os.path.getsize(path)
+    ranges = [(start, min(start + chunk_size, size)) for start in range(0, size, chunk_size)]
+    total = Summary()
+    if workers <= 1:
+        for start, end in ranges:
+            total = total + _summarize_range(path, start, end, use_numpy)
+            if total.error is not None:
+                break
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(_summarize_range, path, start, end, use_numpy) for start, end in ranges]
+            for future in futures:
+                total = total + future.result()
+                if total.error is not None:
+                    # Everything after the first error is irrelevant
+                    for pending in futures:
+                        pending.cancel()
+                    break
+    return verdict(total, size)
+
+
+def line_col(path, position, chunk_size=CHUNK_SIZE):
+    """1-based (line, column) of a byte position, for error messages."""
+    line, line_start, done = 1, 0, 0
+    with open(path, 'rb') as f:
+        while done < position:
+            chunk = f.read(min(chunk_size, position - done))
+            if not chunk:
+                break
+            newlines = chunk.count(b'\n')
+            if newlines:
+                line += newlines
+                line_start = done + chunk.rindex(b'\n') + 1
+            done += len(chunk)
+    return line, position - line_start + 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate bracket nesting in a large file.")
+    parser.add_argument('path')
+    parser.add_argument('--chunk-mb', type=int, default=CHUNK_SIZE >> 20)
+    parser.add_argument('-j', '--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    result = validate_file(args.path, args.chunk_mb << 20, args.workers)
+    elapsed = time.perf_counter() - start
+    if result['valid']:
+        print(f"{args.path}: valid ({elapsed:.2f}s)")
+    else:
+        line, col = line_col(args.path, result['position'])
+        print(f"{args.path}:{line}:{col}: {result['message']} ({elapsed:.2f}s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""
+k-sum: unique value tuples (a <= b <= ...) of k = 2, 3 or 4 elements summing to
+a target.
+
+The solvers work on the distinct values and their counts instead of the raw
+list. A value never needs more than k copies, so counts are capped at k, and
+the input can be streamed from a file of integers without keeping it in memory.
+
+* k = 2: two pointers over the distinct values.
+* k = 3: the tut05_part1 two-pointer scan, or with NumPy, one vectorized
+  stage per first element: every candidate b up to (target - a) / 2 at once,
+  its complement looked up with searchsorted, and multiplicities checked with
+  array comparisons.
+* k = 4: meet in the middle. Pair sums are hashed once (O(m^2) for m distinct
+  values), and each low pair (a, b) looks up the high pairs (c, d) with c >= b
+  in its complement bucket.
+
+count_only=True returns the number of tuples without building them.
+
+Usage:
+    python ksum.py numbers.txt [-k 3] [--target 0] [--count]
+    python ksum.py --bench 1000 10000
+"""
+import argparse
+import random
+import time
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+
+try:
+    import numpy as np
+except ImportError:  # the pure-Python solvers still work
+    np = None
+
+from tut05_part1 import f as tut05_f  # the original solver, kept as the benchmark baseline
+
+CHUNK_SIZE = 1 << 20
+
+
+def read_counts(path, chunk_size=CHUNK_SIZE):
+    """
+    Streams whitespace-separated integers from a file in chunks.
+
+    Returns:
+        Counter: value -> number of occurrences.
+    """
+    counts = Counter()
+    tail = ''
+    with open(path, 'r') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            tokens = (tail + chunk).split()
+            # The last token may continue in the next chunk
+            tail = tokens.pop() if tokens and not chunk[-1].isspace() else ''
+            counts.update(map(int, tokens))
+    if tail:
+        counts[int(tail)] += 1
+    return counts
+
+
+def _capped(counts, k):
+    # Sorted distinct values and their counts, capped at k copies
+    values = sorted(counts)
+    return values, [min(counts[v], k) for v in values]
+
+
+def _two_sum(values, counts, target, count_only):
+    found = []
+    total = 0
+    lo, hi = 0, len(values) - 1
+    while lo <= hi:
+        s = values[lo] + values[hi]
+        if s == target:
+            if lo < hi or counts[lo] >= 2:
+                total += 1
+                if not count_only:
+                    found.append((values[lo], values[hi]))
+            lo += 1
+            hi -= 1
+        elif s < target:
+            lo += 1
+        else:
+            hi -= 1
+    return total if count_only else found
+
+
+def _three_sum(values, counts, target, count_only):
+    # The tut05_part1 scan over the capped multiset (sorted copy, input untouched)
+    nums = [v for v, c in zip(values, counts) for _ in range(c)]
+    found = []
+    total = 0
+    for i in range(len(nums) - 2):
+        if i > 0 and nums[i] == nums[i - 1]:
+            continue
+        left, right = i + 1, len(nums) - 1
+        while left < right:
+            s = nums[i] + nums[left] + nums[right]
+            if s == target:
+                total += 1
+                if not count_only:
+                    found.append((nums[i], nums[left], nums[right]))
+                left += 1
+                right -= 1
+                while left < right and nums[left] == nums[left - 1]:
+                    left += 1
+                while left < right and nums[right] == nums[right + 1]:
+                    right -= 1
+            elif s < target:
+                left += 1
+            else:
+                right -= 1
+    return total if count_only else found
+
+
+def _three_sum_numpy(values, counts, target, count_only):
+    u = np.asarray(values, dtype=np.int64)
+    c = np.asarray(counts, dtype=np.int64)
+    found = []
+    total = 0
+    for p in range(len(u)):
+        a = int(u[p])
+        if 3 * a > target:
+            break
+        # b runs over u[p:hi]: a <= b <= (target - a) / 2, so the complement is >= b
+        hi = int(np.searchsorted(u, (target - a) // 2, side='right'))
+        if hi <= p:
+            continue
+        b = u[p:hi]
+        rest = target - a - b
+        idx = np.minimum(np.searchsorted(u, rest), len(u) - 1)
+        ok = u[idx] == rest
+        ok &= c[p] >= 1 + (b == a) + (rest == a)
+        ok &= c[p:hi] >= 1 + (b == a) + (b == rest)
+        ok &= c[idx] >= 1 + (rest == a) + (rest == b)
+        if count_only:
+            total += int(np.count_nonzero(ok))
+        else:
+            found.extend((a, int(y), int(z)) for y, z in zip(b[ok], rest[ok]))
+    return total if count_only else found
+
+
+def _four_sum(values, counts, target, count_only):
+    # Pair sums over distinct values (i <= j), bucketed by sum; a bucket is sorted by its first value
+    pairs = defaultdict(list)
+    for i, x in enumerate(values):
+        for j in range(i, len(values)):
+            if i == j and counts[i] < 2:
+                continue
+            pairs[x + values[j]].append((x, values[j]))
+    firsts = {s: [p[0] for p in bucket] for s, bucket in pairs.items()}
+    count_of = dict(zip(values, counts))
+
+    found = []
+    total = 0
+    for s, bucket in pairs.items():
+        high = pairs.get(target - s)
+        if high is None:
+            continue
+        high_firsts = firsts[target - s]
+        for a, b in bucket:
+            start = bisect_left(high_firsts, b)
+            # Only high pairs starting with b itself can overuse a value
+            end = bisect_right(high_firsts, b, start)
+            valid = [(a, b, c, d) for c, d in high[start:end]
+                     if all(count_of[v] >= n for v, n in Counter((a, b, c, d)).items())]
+            if count_only:
+                total += len(valid) + len(high) - end
+            else:
+                found.extend(valid)
+                found.extend((a, b, c, d) for c, d in high[end:])
+    return total if count_only else sorted(found)
+
+
+def k_sum(data, k=3, target=0, count_only=False, use_numpy=None):
+    """
+    Unique k-tuples (in ascending order, each tuple ascending) summing to target.
+
+    Args:
+        data: An iterable of integers, or a Counter of value -> occurrences
+            (as returned by read_counts).
+        count_only: Return the number of tuples instead of the tuples.
+        use_numpy: Force the NumPy (True) or pure-Python (False) 2/3-sum path;
+            by default NumPy is used when installed.
+    """
+    counts = data if isinstance(data, Counter) else Counter(data)
+    values, capped = _capped(counts, k)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if k == 2:
+        return _two_sum(values, capped, target, count_only)
+    if k == 3:
+        solver = _three_sum_numpy if use_numpy else _three_sum
+        return solver(values, capped, target, count_only)
+    if k == 4:
+        return _four_sum(values, capped, target, count_only)
+    raise ValueError("k must be 2, 3 or 4")
+
+
+def benchmark(sizes=(1000, 10000), seed=0):
+    """Seconds for zero-sum triplets: tut05_part1 f() against the k_sum paths, per input size."""
+    rng = random.Random(seed)
+    results = {}
+    for n in sizes:
+        nums = [rng.randint(-n, n) for _ in range(n)]
+        runs = {
+            'tut05_part1 f': lambda: len(tut05_f(nums)),
+            'k_sum python': lambda: len(k_sum(nums, 3, use_numpy=False)),
+        }
+        if np is not None:
+            runs['k_sum numpy'] = lambda: len(k_sum(nums, 3, use_numpy=True))
+            runs['k_sum numpy count'] = lambda: k_sum(nums, 3, count_only=True, use_numpy=True)
+        timings = {}
+        for name, run in runs.items():
+            start = time.perf_counter()
+            found = run()
+            timings[name] = (found, time.perf_counter() - start)
+        results[n] = timings
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Find unique k-tuples summing to a target.")
+    parser.add_argument('path', nargs='?', help="File of whitespace-separated integers")
+    parser.add_argument('-k', type=int, default=3, choices=[2, 3, 4])
+    parser.add_argument('--target', type=int, default=0)
+    parser.add_argument('--count', action='store_true', help="Only count the tuples")
+    parser.add_argument('--bench', type=int, nargs='+', metavar='N', help="Benchmark on random inputs of size N")
+    args = parser.parse_args()
+
+    if args.bench:
+        for n, timings in benchmark(args.bench).items():
+            for name, (found, seconds) in timings.items():
+                print(f"n={n:<8} {name:<20} {found:>10} triplets  {seconds:8.3f}s")
+        return
+    if args.path is None:
+        parser.error("give a file of integers or --bench")
+
+    result = k_sum(read_counts(args.path), args.k, args.target, args.count)
+    if args.count:
+        print(f"{result} unique {args.k}-tuples sum to {args.target}")
+    else:
+        for combo in result:
+            print(*combo)
+        print(f"{len(result)} unique {args.k}-tuples sum to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,7 @@
 #finding triplest
 
 def f(nums):
-    nums.sort()
+    nums = sorted(nums)  # sorted copy, the caller's list is left untouched
     triplets = []  # Initialize the list
     for i in range(len(nums) - 2):
         if i > 0 and nums[i] == nums[i - 1]:
@@ -24,6 +24,7 @@ def f(nums):
                 right -= 1
     return triplets
 
-n = list(map(int, input("Enter list separated by spaces: ").split()))
-result = f(n)
-print("Unique triplets are:", result)
+if __name__ == "__main__":
+    n = list(map(int, input("Enter list separated by spaces: ").split()))
+    result = f(n)
+    print("Unique triplets are:", result)
@@ -0,0 +1,236 @@
+"""
+Parallel, resumable audit of large password files.
+
+The input is split into line-aligned byte-range chunks (64 MB by default) that a
+process pool validates with password_batch.BatchValidator. Every finished chunk
+is checkpointed to disk, so an interrupted audit resumes with the chunks that
+are still missing. When all chunks are done, the results are merged into:
+
+* a report file with one "<line number>\t<failed rules>" row per failing line,
+* aggregate statistics per failed rule (also saved as <report>.summary.json).
+
+Nothing is printed per record and the input file is only ever read. Cleaning
+up a checkpoint removes only the files the audit wrote (manifest.json and
+chunk_*), and the directory itself only if the audit created it.
+
+Usage:
+    python password_audit.py input.txt report.tsv --criteria 1,2,3,4 [-j WORKERS]
+"""
+import argparse
+import json
+import logging
+import os
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from password_batch import MIN_LENGTH, BatchValidator, describe, iter_range_lines, split_ranges, summarize
+
+CHUNK_SIZE = 64 << 20
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _chunk_paths(checkpoint_dir, index):
+    base = os.path.join(checkpoint_dir, f"chunk_{index:06d}")
+    return f"{base}.json", f"{base}.bin"
+
+
+def _is_checkpoint_file(name):
+    return name.startswith('chunk_') or name in ('manifest.json', 'manifest.json.tmp')
+
+
+def _clear_checkpoint(checkpoint_dir, remove_dir=False):
+    """
+    Deletes the checkpoint files the audit wrote, never anything else. The
+    directory is removed only when remove_dir is set (the audit created it)
+    and nothing else is left in it.
+    """
+    for name in os.listdir(checkpoint_dir):
+        if _is_checkpoint_file(name):
+            os.remove(os.path.join(checkpoint_dir, name))
+    if remove_dir and not os.listdir(checkpoint_dir):
+        os.rmdir(checkpoint_dir)
+
+
+def _write_atomic(path, write):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        write(f)
+    os.replace(tmp_path, path)
+
+
+def audit_chunk(path, index, start, end, criteria, min_length, checkpoint_dir):
+    """
+    Validates one byte range and checkpoints its result: the failing lines
+    (chunk-local line index + mask) in a binary file, then the line count and
+    mask counts in a JSON file. The JSON file is written last and marks the chunk
+    as done.
+
+    Returns:
+        int: The chunk index.
+    """
+    check = BatchValidator(criteria, min_length).check_bytes
+    failing_lines = array('I')
+    failing_masks = array('B')
+    mask_counts = Counter()
+    lines = 0
+    for lines, line in enumerate(iter_range_lines(path, start, end), start=1):
+        mask = check(line)
+        mask_counts[mask] += 1
+        if mask:
+            failing_lines.append(lines - 1)
+            failing_masks.append(mask)
+
+    meta_path, bin_path = _chunk_paths(checkpoint_dir, index)
+
+    def write_bin(f):
+        f.write(len(failing_lines).to_bytes(8, 'little'))
+        failing_lines.tofile(f)
+        failing_masks.tofile(f)
+
+    _write_atomic(bin_path, write_bin)
+    meta = {'lines': lines, 'mask_counts': {str(mask): count for mask, count in mask_counts.items()}}
+    _write_atomic(meta_path, lambda f: f.write(json.dumps(meta).encode()))
+    return index
+
+
+def _read_chunk(checkpoint_dir, index):
+    meta_path, bin_path = _chunk_paths(checkpoint_dir, index)
+    with open(meta_path, 'r') as f:
+        meta = json.load(f)
+    failing_lines, failing_masks = array('I'), array('B')
+    with open(bin_path, 'rb') as f:
+        n = int.from_bytes(f.read(8), 'little')
+        failing_lines.fromfile(f, n)
+        failing_masks.fromfile(f, n)
+    return meta, failing_lines, failing_masks
+
+
+def _prepare_checkpoint(path, checkpoint_dir, criteria, min_length, chunk_size):
+    """
+    Loads the checkpoint manifest if it belongs to the same input file and
+    settings, otherwise starts a fresh checkpoint.
+
+    Returns:
+        tuple: (chunk ranges, whether the audit created checkpoint_dir).
+
+    Raises:
+        ValueError: If checkpoint_dir is a non-empty directory with no manifest,
+            i.e. not a checkpoint this tool wrote.
+    """
+    stat = os.stat(path)
+    settings = {
+        'path': os.path.abspath(path),
+        'size': stat.st_size,
+        'mtime': stat.st_mtime,
+        'criteria': sorted(set(criteria)),
+        'min_length': min_length,
+        'chunk_size': chunk_size,
+    }
+    manifest_path = os.path.join(checkpoint_dir, 'manifest.json')
+    created = not os.path.exists(checkpoint_dir)
+    if os.path.exists(manifest_path):
+        with open(manifest_path, 'r') as f:
+            manifest = json.load(f)
+        created = manifest.get('created_dir', False)
+        if manifest['settings'] == settings:
+            return [tuple(r) for r in manifest['ranges']], created
+        logger.info("Input or settings changed since the last run; discarding the old checkpoint")
+        _clear_checkpoint(checkpoint_dir)
+    elif not created and os.listdir(checkpoint_dir):
+        raise ValueError(f"{checkpoint_dir} is not empty and holds no audit checkpoint; "
+                         "choose an empty or new directory")
+
+    os.makedirs(checkpoint_dir, exist_ok=True)
+    parts = max(1, -(-stat.st_size // chunk_size))
+    ranges = split_ranges(path, parts)
+    manifest = {'settings': settings, 'ranges': ranges, 'created_dir': created}
+    _write_atomic(manifest_path, lambda f: f.write(json.dumps(manifest).encode()))
+    return ranges, created
+
+
+def merge_results(checkpoint_dir, n_chunks, report_path):
+    """
+    Writes the failing-line report in line order and returns the aggregate
+    summary. Chunks are read one at a time, so memory stays bounded.
+    """
+    mask_counts = Counter()
+    names = {}
+    offset = 0
+    with open(report_path, 'w') as report:
+        report.write("line\tfailed\n")
+        for index in range(n_chunks):
+            meta, failing_lines, failing_masks = _read_chunk(checkpoint_dir, index)
+            mask_counts.update({int(mask): count for mask, count in meta['mask_counts'].items()})
+            for local, mask in zip(failing_lines, failing_masks):
+                if mask not in names:
+                    names[mask] = ', '.join(describe(mask))
+                report.write(f"{offset + local + 1}\t{names[mask]}\n")
+            offset += meta['lines']
+    return summarize(mask_counts)
+
+
+def audit_file(path, criteria, report_path, checkpoint_dir=None, min_length=MIN_LENGTH,
+               workers=None, chunk_size=CHUNK_SIZE, keep_checkpoint=False):
+    """
+    Audits a password file in parallel, resuming from an existing checkpoint.
+
+    Returns:
+        dict: total, valid, invalid, per-rule failures and the number of chunks
+        that were resumed from the checkpoint.
+    """
+    checkpoint_dir = checkpoint_dir or f"{report_path}.checkpoint"
+    ranges, created = _prepare_checkpoint(path, checkpoint_dir, criteria, min_length, chunk_size)
+    pending = [i for i in range(len(ranges)) if not os.path.exists(_chunk_paths(checkpoint_dir, i)[0])]
+    resumed = len(ranges) - len(pending)
+    if resumed:
+        logger.info("Resuming: %d of %d chunks already done", resumed, len(ranges))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(audit_chunk, path, i, *ranges[i], criteria, min_length, checkpoint_dir)
+                       for i in pending]
+            for done, future in enumerate(as_completed(futures), start=1):
+                future.result()
+                logger.info("Chunk %d/%d done", done + resumed, len(ranges))
+
+    summary = merge_results(checkpoint_dir, len(ranges), report_path)
+    summary['chunks'] = len(ranges)
+    summary['chunks_resumed'] = resumed
+    with open(f"{report_path}.summary.json", 'w') as f:
+        json.dump(summary, f, indent=2)
+    if not keep_checkpoint:
+        _clear_checkpoint(checkpoint_dir, remove_dir=created)
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parallel, resumable password file audit.")
+    parser.add_argument('path', help="Password file, one password per line")
+    parser.add_argument('report', help="Where the failing-line report is written")
+    parser.add_argument('--criteria', default='1,2,3,4', help="Comma-separated criteria, e.g. 1,3,4")
+    parser.add_argument('--min-length', type=int, default=MIN_LENGTH)
+    parser.add_argument('--chunk-mb', type=int, default=CHUNK_SIZE >> 20)
+    parser.add_argument('--checkpoint-dir', default=None)
+    parser.add_argument('--keep-checkpoint', action='store_true')
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    try:
+        summary = audit_file(args.path, list(map(int, args.criteria.split(','))), args.report, args.checkpoint_dir,
+                             args.min_length, args.workers, args.chunk_mb << 20, args.keep_checkpoint)
+    except ValueError as e:
+        parser.error(str(e))
+    print(f"Total Valid Passwords: {summary['valid']}")
+    print(f"Total Invalid Passwords: {summary['invalid']}")
+    for name, count in summary['failures'].items():
+        print(f"  {name}: {count}")
+    print(f"Audited {summary['total']} passwords in {time.perf_counter() - start:.2f}s; report: {args.report}")
+
+
+if __name__ == "__main__":
+    main()
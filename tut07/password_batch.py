@@ -0,0 +1,193 @@
+"""
+Batch password validation for large credential-policy dumps.
+
+Same rules as validate_password in tut06.py / tut07.py (minimum 8 characters,
+plus the selected criteria 1-4), but:
+
+* each password is classified in one pass: set(password) is built once in C and
+  checked against precomputed character-class sets, instead of one re.search
+  per criterion and a second round of searches to build the message;
+* results are returned as a bitmask of failed rules instead of printed;
+* files are streamed in fixed-size binary blocks, so memory stays bounded, and
+  can be split into line-aligned byte ranges validated by a process pool.
+
+Usage:
+    python password_batch.py input.txt --criteria 1,2,3,4 [-j WORKERS]
+"""
+import argparse
+import os
+import string
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+MIN_LENGTH = 8
+BLOCK_SIZE = 1 << 23
+
+TOO_SHORT = 1
+MISSING_UPPER = 2
+MISSING_LOWER = 4
+MISSING_DIGIT = 8
+MISSING_SPECIAL = 16
+
+CRITERIA = {
+    1: (MISSING_UPPER, string.ascii_uppercase, "Uppercase letters"),
+    2: (MISSING_LOWER, string.ascii_lowercase, "Lowercase letters"),
+    3: (MISSING_DIGIT, string.digits, "Numbers"),
+    4: (MISSING_SPECIAL, "!@#", "Special characters"),
+}
+FAILURE_NAMES = {TOO_SHORT: "Less than 8 Characters"}
+FAILURE_NAMES.update({flag: name for flag, _, name in CRITERIA.values()})
+
+
+def describe(mask):
+    """Names of the rules a result mask failed, in criterion order."""
+    return [name for flag, name in FAILURE_NAMES.items() if mask & flag]
+
+
+class BatchValidator:
+    """
+    Compiled password policy: build once, then call check() per password.
+
+    Example:
+        validator = BatchValidator([1, 3, 4])
+        mask = validator.check("abc12345")   # MISSING_UPPER | MISSING_SPECIAL
+        describe(mask)                       # ['Uppercase letters', 'Special characters']
+    """
+
+    def __init__(self, criteria, min_length=MIN_LENGTH):
+        unknown = set(criteria) - set(CRITERIA)
+        if unknown:
+            raise ValueError(f"Unknown criteria {sorted(unknown)}. Choose from {sorted(CRITERIA)}.")
+        self.criteria = sorted(set(criteria))
+        self.min_length = min_length
+        # One (flag, class) pair per criterion, for str input and for ASCII bytes input
+        self._str_checks = [(CRITERIA[c][0], frozenset(CRITERIA[c][1])) for c in self.criteria]
+        self._byte_checks = [(CRITERIA[c][0], frozenset(CRITERIA[c][1].encode())) for c in self.criteria]
+
+    def check(self, password):
+        """Returns 0 for a valid password, otherwise the OR of the failed rule flags."""
+        if isinstance(password, bytes):
+            return self.check_bytes(password)
+        mask = TOO_SHORT if len(password) < self.min_length else 0
+        chars = set(password)
+        for flag, char_class in self._str_checks:
+            if char_class.isdisjoint(chars):
+                mask |= flag
+        return mask
+
+    def check_bytes(self, password):
+        """check() for a raw line from a binary file; non-ASCII lines are decoded first."""
+        if not password.isascii():
+            return self.check(password.decode('utf-8', errors='replace'))
+        mask = TOO_SHORT if len(password) < self.min_length else 0
+        chars = set(password)
+        for flag, char_class in self._byte_checks:
+            if char_class.isdisjoint(chars):
+                mask |= flag
+        return mask
+
+    def count(self, passwords):
+        """Counter of result masks over an iterable of passwords (mask 0 = valid)."""
+        return Counter(map(self.check, passwords))
+
+
+def iter_range_lines(path, start=0, end=None, block_size=BLOCK_SIZE):
+    """
+    Yields the stripped lines of path between byte offsets start and end, reading
+    fixed-size blocks so memory stays bounded. start must be a line start.
+    """
+    if end is None:
+        end = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        f.seek(start)
+        remaining = end - start
+        tail = b''
+        while remaining > 0:
+            block = f.read(min(block_size, remaining))
+            if not block:
+                break
+            remaining -= len(block)
+            lines = (tail + block).split(b'\n')
+            tail = lines.pop()
+            yield from map(bytes.strip, lines)
+        if tail:
+            yield tail.strip()
+
+
+def split_ranges(path, parts):
+    """Splits a file into at most `parts` byte ranges that each start at a line start."""
+    size = os.path.getsize(path)
+    bounds = [0]
+    with open(path, 'rb') as f:
+        for i in range(1, parts):
+            pos = size * i // parts
+            if pos <= bounds[-1]:
+                continue
+            # The first line start at or after pos
+            f.seek(pos - 1)
+            f.readline()
+            boundary = f.tell()
+            if bounds[-1] < boundary < size:
+                bounds.append(boundary)
+    bounds.append(size)
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def validate_range(path, start, end, criteria, min_length=MIN_LENGTH):
+    """Counter of result masks for the lines of one byte range (runs in a worker)."""
+    validator = BatchValidator(criteria, min_length)
+    return Counter(map(validator.check_bytes, iter_range_lines(path, start, end)))
+
+
+def summarize(mask_counts):
+    """Turns a Counter of masks into totals and a count per failed rule."""
+    total = sum(mask_counts.values())
+    valid = mask_counts.get(0, 0)
+    failures = {name: 0 for name in FAILURE_NAMES.values()}
+    for mask, count in mask_counts.items():
+        for name in describe(mask):
+            failures[name] += count
+    return {'total': total, 'valid': valid, 'invalid': total - valid, 'failures': failures}
+
+
+def validate_file(path, criteria, min_length=MIN_LENGTH, workers=1):
+    """
+    Validates every line of a password file without printing per password.
+
+    Returns:
+        dict: total, valid, invalid and per-rule failure counts.
+    """
+    if workers <= 1:
+        return summarize(validate_range(path, 0, None, criteria, min_length))
+    ranges = split_ranges(path, workers * 4)
+    mask_counts = Counter()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(validate_range, path, start, end, criteria, min_length) for start, end in ranges]
+        for future in futures:
+            mask_counts.update(future.result())
+    return summarize(mask_counts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a password file in bulk.")
+    parser.add_argument('path')
+    parser.add_argument('--criteria', default='1,2,3,4', help="Comma-separated criteria, e.g. 1,3,4")
+    parser.add_argument('--min-length', type=int, default=MIN_LENGTH)
+    parser.add_argument('-j', '--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    criteria = list(map(int, args.criteria.split(',')))
+    start = time.perf_counter()
+    summary = validate_file(args.path, criteria, args.min_length, args.workers)
+    elapsed = time.perf_counter() - start
+
+    print(f"Total Valid Passwords: {summary['valid']}")
+    print(f"Total Invalid Passwords: {summary['invalid']}")
+    for name, count in summary['failures'].items():
+        print(f"  {name}: {count}")
+    print(f"{summary['total']} passwords in {elapsed:.2f}s ({summary['total'] / max(elapsed, 1e-9):,.0f}/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,464 @@
+"""
+Declarative password policies.
+
+A policy is a list of rule specs (plain dicts, so it can live in a JSON file):
+
+    [
+        {"rule": "length", "min": 12},
+        {"rule": "char_class", "class": "upper"},
+        {"rule": "char_class", "class": "digit"},
+        {"rule": "banned", "words": ["password", "qwerty", "letmein"]},
+        {"rule": "dictionary", "path": "words.txt"},
+        {"rule": "repeats", "max_run": 3},
+        {"rule": "entropy", "min_bits": 50}
+    ]
+
+compile_policy() builds every rule once (character tables, the Aho-Corasick
+automaton for banned substrings, the dictionary set), and the resulting Policy
+evaluates whole batches: the passwords are packed into one NumPy byte matrix, so
+length, character-class, repeated-run and entropy rules are array operations
+instead of per-password regex searches. The matrix is at most MAX_MATRIX_WIDTH
+bytes wide; longer passwords take a per-password path, so one huge line does not
+blow up the whole batch. Results are bitmasks, one bit per rule.
+
+New rules are plugins: subclass Rule, implement failures(batch) and register it
+with @register_rule("name").
+
+Usage:
+    python policy.py policy.json passwords.txt
+"""
+import argparse
+import json
+from collections import deque
+from functools import cached_property
+from itertools import groupby, islice
+
+import numpy as np
+
+from password_batch import CRITERIA, MIN_LENGTH, iter_range_lines
+
+BATCH_SIZE = 100_000
+MAX_MATRIX_WIDTH = 256
+
+CHAR_CLASSES = {
+    'upper': b'ABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    'lower': b'abcdefghijklmnopqrstuvwxyz',
+    'digit': b'0123456789',
+    'special': b'!@#',
+    'symbol': b' !"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~',
+}
+# Pool sizes for the entropy estimate; bytes >= 128 (non-ASCII) count as one extra pool
+ENTROPY_POOLS = [
+    (CHAR_CLASSES['lower'], 26),
+    (CHAR_CLASSES['upper'], 26),
+    (CHAR_CLASSES['digit'], 10),
+    (CHAR_CLASSES['symbol'], 33),
+    (bytes(range(128, 256)), 100),
+]
+LEET = str.maketrans('013457@$!', 'oieastasi')
+
+RULES = {}
+
+
+def register_rule(name):
+    """Class decorator adding a Rule subclass to the registry under name."""
+    def decorator(cls):
+        cls.kind = name
+        RULES[name] = cls
+        return cls
+    return decorator
+
+
+def _byte_table(chars):
+    table = np.zeros(256, dtype=bool)
+    table[np.frombuffer(chars, dtype=np.uint8)] = True
+    return table
+
+
+class Batch:
+    """
+    A batch of passwords with the derived arrays rules share, each computed once
+    on first use: lengths, the zero-padded byte matrix and lowercase text.
+    Passwords longer than MAX_MATRIX_WIDTH bytes are left out of the matrix
+    (zero rows) and listed in long_rows, for the rules to check one by one.
+    """
+
+    def __init__(self, passwords):
+        self.passwords = [p if isinstance(p, (str, bytes)) else str(p) for p in passwords]
+
+    def __len__(self):
+        return len(self.passwords)
+
+    @cached_property
+    def texts(self):
+        return [p.decode('utf-8', errors='replace') if isinstance(p, bytes) else p for p in self.passwords]
+
+    @cached_property
+    def lowered(self):
+        return [t.lower() for t in self.texts]
+
+    @cached_property
+    def lengths(self):
+        return np.fromiter(map(len, self.texts), dtype=np.int64, count=len(self))
+
+    @cached_property
+    def encoded(self):
+        return [p if isinstance(p, bytes) else p.encode('utf-8', errors='replace') for p in self.passwords]
+
+    @cached_property
+    def long_rows(self):
+        """Indices of the passwords too long for the matrix."""
+        sizes = np.fromiter(map(len, self.encoded), dtype=np.int64, count=len(self))
+        return np.flatnonzero(sizes > MAX_MATRIX_WIDTH)
+
+    @cached_property
+    def matrix(self):
+        """(n, width) uint8 matrix of the UTF-8 bytes, zero-padded on the right; width <= MAX_MATRIX_WIDTH."""
+        encoded = self.encoded
+        if len(self.long_rows):
+            encoded = list(encoded)
+            for i in self.long_rows:
+                encoded[i] = b''
+        width = max(map(len, encoded), default=0) or 1
+        return np.array(encoded, dtype=f'S{width}').view(np.uint8).reshape(len(encoded), width)
+
+    @cached_property
+    def non_ascii(self):
+        """Per password: True if it has a non-ASCII byte (long passwords included)."""
+        flags = (self.matrix >= 128).any(axis=1)
+        for i in self.long_rows:
+            flags[i] = not self.encoded[i].isascii()
+        return flags
+
+    def contains_any(self, table):
+        """Per password: True if any byte is in the 256-entry lookup table."""
+        found = table[self.matrix].any(axis=1)
+        for i in self.long_rows:
+            found[i] = table[np.frombuffer(self.encoded[i], dtype=np.uint8)].any()
+        return found
+
+
+class Rule:
+    """
+    Base class of policy rules. failures(batch) returns a bool array, True where
+    a password breaks the rule.
+    """
+    kind = None
+
+    def __init__(self, name=None):
+        self.name = name or self.kind
+
+    def failures(self, batch):
+        raise NotImplementedError
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.name!r})"
+
+
+@register_rule('length')
+class LengthRule(Rule):
+    def __init__(self, min=MIN_LENGTH, max=None, name=None):
+        super().__init__(name or f"Less than {min} Characters")
+        self.min, self.max = min, max
+
+    def failures(self, batch):
+        failed = batch.lengths < self.min
+        if self.max is not None:
+            failed |= batch.lengths > self.max
+        return failed
+
+
+@register_rule('char_class')
+class CharClassRule(Rule):
+    """Requires at least one character of a named class or of an explicit 'chars' string."""
+
+    def __init__(self, chars=None, name=None, **kwargs):
+        char_class = kwargs.get('class')
+        if chars is None:
+            if char_class not in CHAR_CLASSES:
+                raise ValueError(f"Unknown character class {char_class!r}. Choose from {sorted(CHAR_CLASSES)}.")
+            chars = CHAR_CLASSES[char_class]
+        elif isinstance(chars, str):
+            chars = chars.encode()
+        super().__init__(name or f"Missing {char_class or chars.decode()}")
+        self._table = _byte_table(chars)
+
+    def failures(self, batch):
+        return ~batch.contains_any(self._table)
+
+
+class AhoCorasick:
+    """
+    Aho-Corasick automaton over a word list: one pass over a text finds every
+    occurrence of every word, however long the list.
+
+    Example:
+        automaton = AhoCorasick(['pass', 'word', 'qwerty'])
+        automaton.contains('mypassword1')            # True
+        list(automaton.find_all('mypassword1'))      # [(2, 'pass'), (6, 'word')]
+    """
+
+    def __init__(self, words):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+        for word in words:
+            if not word:
+                continue
+            state = 0
+            for char in word:
+                nxt = self.goto[state].get(char)
+                if nxt is None:
+                    nxt = len(self.goto)
+                    self.goto[state][char] = nxt
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = nxt
+            self.output[state].append(word)
+
+        # Breadth-first failure links; each state also inherits the outputs of its failure state
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self.goto[state].items():
+                queue.append(nxt)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[nxt] = self.goto[fallback].get(char, 0)
+                self.output[nxt] = self.output[nxt] + self.output[self.fail[nxt]]
+        self.accepting = [bool(out) for out in self.output]
+
+    def _step(self, state, char):
+        goto, fail = self.goto, self.fail
+        while state and char not in goto[state]:
+            state = fail[state]
+        return goto[state].get(char, 0)
+
+    def contains(self, text):
+        """True as soon as any word occurs in text."""
+        state, accepting, step = 0, self.accepting, self._step
+        for char in text:
+            state = step(state, char)
+            if accepting[state]:
+                return True
+        return False
+
+    def find_all(self, text):
+        """Yields (start index, word) for every occurrence, in order of end position."""
+        state = 0
+        for i, char in enumerate(text):
+            state = self._step(state, char)
+            for word in self.output[state]:
+                yield i - len(word) + 1, word
+
+
+def _read_words(path):
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return [line.strip() for line in f if line.strip()]
+
+
+@register_rule('banned')
+class BannedSubstringRule(Rule):
+    """Rejects passwords containing any blocklisted substring (case-insensitive by default)."""
+
+    def __init__(self, words=(), path=None, case_sensitive=False, name=None):
+        super().__init__(name or "Contains a banned word")
+        words = list(words) + (_read_words(path) if path else [])
+        self.case_sensitive = case_sensitive
+        self.automaton = AhoCorasick(words if case_sensitive else [w.lower() for w in words])
+
+    def failures(self, batch):
+        texts = batch.texts if self.case_sensitive else batch.lowered
+        return np.fromiter(map(self.automaton.contains, texts), dtype=bool, count=len(batch))
+
+
+@register_rule('dictionary')
+class DictionaryRule(Rule):
+    """
+    Rejects passwords that are a dictionary word once lowercased, de-leeted
+    (p@$$w0rd -> password) and stripped of leading/trailing digits and symbols.
+    """
+
+    def __init__(self, words=(), path=None, name=None):
+        super().__init__(name or "Dictionary word")
+        words = list(words) + (_read_words(path) if path else [])
+        self.words = frozenset(w.lower() for w in words)
+
+    def _normalize(self, text):
+        core = text.strip('0123456789' + CHAR_CLASSES['symbol'].decode())
+        return core.translate(LEET)
+
+    def failures(self, batch):
+        words = self.words
+        normalized = map(self._normalize, batch.lowered)
+        return np.fromiter((w in words for w in normalized), dtype=bool, count=len(batch))
+
+
+@register_rule('repeats')
+class RepeatRule(Rule):
+    """
+    Rejects runs of more than max_run identical characters (aaaa, 1111, éééé).
+    ASCII passwords are compared byte by byte in the matrix; non-ASCII and
+    over-long ones are compared by code point, one at a time.
+    """
+
+    def __init__(self, max_run=3, name=None):
+        super().__init__(name or f"More than {max_run} repeated characters")
+        self.max_run = max_run
+
+    def _has_run(self, text):
+        return any(sum(1 for _ in run) > self.max_run for _, run in groupby(text))
+
+    def failures(self, batch):
+        m = batch.matrix
+        # run[:, j]: byte j+1 equals byte j (padding excluded); a run of max_run + 1
+        # identical bytes is max_run consecutive True values
+        run = (m[:, 1:] == m[:, :-1]) & (m[:, 1:] != 0)
+        for _ in range(1, self.max_run):
+            run = run[:, :-1] & run[:, 1:]
+        failed = run.any(axis=1)
+        # A multibyte character repeats as a byte pattern, not as equal neighbours
+        scalar = batch.non_ascii.copy()
+        scalar[batch.long_rows] = True
+        texts = batch.texts
+        for i in np.flatnonzero(scalar):
+            failed[i] = self._has_run(texts[i])
+        return failed
+
+
+@register_rule('entropy')
+class EntropyRule(Rule):
+    """
+    Rejects passwords whose estimated entropy, length * log2(pool size), is below
+    min_bits. The pool is the sum of the character classes present.
+    """
+
+    def __init__(self, min_bits=40, name=None):
+        super().__init__(name or f"Entropy below {min_bits} bits")
+        self.min_bits = min_bits
+        self._pools = [(_byte_table(chars), size) for chars, size in ENTROPY_POOLS]
+
+    def bits(self, batch):
+        pool = np.zeros(len(batch), dtype=np.float64)
+        for table, size in self._pools:
+            pool += batch.contains_any(table) * size
+        return batch.lengths * np.log2(np.maximum(pool, 1))
+
+    def failures(self, batch):
+        return self.bits(batch) < self.min_bits
+
+
+class Policy:
+    """
+    A compiled policy. evaluate() returns one uint32 mask per password, with bit i
+    set when rule i failed (0 = valid).
+
+    Example:
+        policy = compile_policy([{"rule": "length", "min": 10}, {"rule": "banned", "words": ["admin"]}])
+        masks = policy.evaluate(["Admin12345", "correct horse"])   # array([2, 0])
+        policy.describe(masks[0])                                  # ['Contains a banned word']
+    """
+
+    def __init__(self, rules):
+        if len(rules) > 32:
+            raise ValueError("A policy supports at most 32 rules.")
+        self.rules = list(rules)
+
+    def __len__(self):
+        return len(self.rules)
+
+    @property
+    def names(self):
+        return [rule.name for rule in self.rules]
+
+    def evaluate(self, passwords):
+        """Masks for a batch: a list, NumPy array or pandas Series of str/bytes."""
+        batch = passwords if isinstance(passwords, Batch) else Batch(passwords)
+        masks = np.zeros(len(batch), dtype=np.uint32)
+        if len(batch):
+            for bit, rule in enumerate(self.rules):
+                masks[rule.failures(batch)] |= np.uint32(1 << bit)
+        return masks
+
+    def to_frame(self, passwords):
+        """pandas DataFrame: Password, one bool column per rule (True = failed) and Valid."""
+        import pandas as pd
+        passwords = list(passwords)
+        masks = self.evaluate(passwords)
+        frame = pd.DataFrame({'Password': passwords})
+        for bit, name in enumerate(self.names):
+            frame[name] = (masks & (1 << bit)) != 0
+        frame['Valid'] = masks == 0
+        return frame
+
+    def describe(self, mask):
+        """Names of the rules a mask failed, in policy order."""
+        return [name for bit, name in enumerate(self.names) if int(mask) & (1 << bit)]
+
+    def summarize(self, masks):
+        """Totals and a failure count per rule for an array of masks."""
+        masks = np.asarray(masks, dtype=np.uint32)
+        failures = {name: int(np.count_nonzero(masks & (1 << bit))) for bit, name in enumerate(self.names)}
+        valid = int(np.count_nonzero(masks == 0))
+        return {'total': len(masks), 'valid': valid, 'invalid': len(masks) - valid, 'failures': failures}
+
+    def evaluate_file(self, path, batch_size=BATCH_SIZE):
+        """Streams a password file (one per line) in batches and returns summarize() totals."""
+        summary = {'total': 0, 'valid': 0, 'invalid': 0, 'failures': dict.fromkeys(self.names, 0)}
+        lines = iter_range_lines(path)
+        while True:
+            batch = list(islice(lines, batch_size))
+            if not batch:
+                return summary
+            part = self.summarize(self.evaluate(batch))
+            for key in ('total', 'valid', 'invalid'):
+                summary[key] += part[key]
+            for name, count in part['failures'].items():
+                summary['failures'][name] += count
+
+
+def compile_policy(spec):
+    """Builds a Policy from a list of rule specs, each {"rule": <registered name>, **params}."""
+    rules = []
+    for entry in spec:
+        params = dict(entry)
+        kind = params.pop('rule', None)
+        if kind not in RULES:
+            raise ValueError(f"Unknown rule {kind!r}. Choose from {sorted(RULES)}.")
+        rules.append(RULES[kind](**params))
+    return Policy(rules)
+
+
+def load_policy(path):
+    """compile_policy() of a JSON file holding the rule list."""
+    with open(path, 'r') as f:
+        return compile_policy(json.load(f))
+
+
+def policy_from_criteria(criteria, min_length=MIN_LENGTH):
+    """The tut06/tut07 rules (minimum length plus criteria 1-4) as a Policy."""
+    spec = [{'rule': 'length', 'min': min_length}]
+    for criterion in sorted(set(criteria)):
+        _, chars, name = CRITERIA[criterion]
+        spec.append({'rule': 'char_class', 'chars': chars, 'name': name})
+    return compile_policy(spec)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Evaluate a password file against a JSON policy.")
+    parser.add_argument('policy', help="JSON file with the list of rule specs")
+    parser.add_argument('path', help="Password file, one password per line")
+    parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+    args = parser.parse_args()
+
+    summary = load_policy(args.policy).evaluate_file(args.path, args.batch_size)
+    print(f"Total Valid Passwords: {summary['valid']}")
+    print(f"Total Invalid Passwords: {summary['invalid']}")
+    for name, count in summary['failures'].items():
+        print(f"  {name}: {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import os
 import re
 
 passwords = """abc12345
@@ -5,8 +6,6 @@ abc
 123456789
 """
 
-with open('input.txt', 'w') as f:
-    f.write(passwords)
 def validate_password(password, criteria):
     if len(password) < 8:
         print(f"'{password}' - Invalid password. Less than 8 Characters.")
@@ -36,7 +35,18 @@ def validate_password(password, criteria):
     print(f"'{password}' - Valid password.")
     return True
 
-def validate_password_from_file(filename, criteria):
+def validate_password_from_file(filename, criteria, report_path=None, workers=None):
+    # Audit mode: parallel, resumable, failing line numbers go to report_path instead of the console
+    if report_path is not None:
+        from password_audit import audit_file
+        summary = audit_file(filename, criteria, report_path, workers=workers)
+        print(f"Total Valid Passwords: {summary['valid']}")
+        print(f"Total Invalid Passwords: {summary['invalid']}")
+        for name, count in summary['failures'].items():
+            print(f"  {name}: {count}")
+        print(f"Failing lines written to {report_path}")
+        return summary
+
     valid_count = 0
     invalid_count = 0
 
@@ -51,12 +61,21 @@ def validate_password_from_file(filename, criteria):
     print(f"Total Valid Passwords: {valid_count}")
     print(f"Total Invalid Passwords: {invalid_count}")
 
-print("Select criteria to check:")
-print("1 - Uppercase letters (A-Z)")
-print("2 - Lowercase letters (a-z)")
-print("3 - Numbers (0-9)")
-print("4 - Special characters (!, @, #)")
-criteria_input = input("Enter your criteria (comma-separated, e.g., 1,3,4): ")
-criteria = list(map(int, criteria_input.split(',')))
+def main():
+    # Only create the sample file when there is none, so a real input.txt is never overwritten
+    if not os.path.exists('input.txt'):
+        with open('input.txt', 'w') as f:
+            f.write(passwords)
+
+    print("Select criteria to check:")
+    print("1 - Uppercase letters (A-Z)")
+    print("2 - Lowercase letters (a-z)")
+    print("3 - Numbers (0-9)")
+    print("4 - Special characters (!, @, #)")
+    criteria_input = input("Enter your criteria (comma-separated, e.g., 1,3,4): ")
+    criteria = list(map(int, criteria_input.split(',')))
+
+    validate_password_from_file('input.txt', criteria)
 
-validate_password_from_file('input.txt', criteria)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,224 @@
+"""
+Moving-average crossover backtests over a grid of (fast, slow) windows.
+
+tut08.py labels each day Bullish when the 50-day MA is above the 200-day MA,
+but never checks whether trading on that signal pays. This module simulates
+the rule for every (fast, slow) pair of a grid at once. The strategy is long
+(or long/short) while the fast MA is above the slow MA, and flat (or short)
+otherwise. A position is taken at the close and earns the next day's return.
+
+* The moving average of every window comes from one cumulative-sum array:
+  mean[w, t] = (csum[t + 1] - csum[t + 1 - w]) / w.
+* Per fast window, the positions for all slow windows form one
+  (n_slow x days) array. Strategy returns, the equity curve, maximum drawdown,
+  annualized Sharpe ratio and trade counts are 2-D NumPy reductions along the
+  time axis.
+* backtest_many() shards tickers across worker processes.
+
+Usage:
+    python backtest.py infy_stock.csv [more.csv ...] [--fast 5:105] [--slow 20:420:4]
+                       [--metric sharpe] [--top 10] [--cost-bps 0] [--long-short] [-j WORKERS]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+
+from indicators import LONG_WINDOW, SHORT_WINDOW
+from ingest import fill_gaps, read_prices
+
+TRADING_DAYS = 252
+DEFAULT_FAST = np.arange(5, 105)
+DEFAULT_SLOW = np.arange(20, 420, 4)
+METRICS = ('total_return', 'cagr', 'max_drawdown', 'sharpe', 'trades', 'exposure')
+
+
+def moving_averages(close, windows):
+    """
+    Trailing means of close for every window, from one cumulative sum.
+
+    Returns:
+        np.ndarray: (len(windows), len(close)) array, NaN until each window is full.
+    """
+    close = np.asarray(close, dtype=float)
+    windows = np.asarray(windows, dtype=np.int64)
+    csum = np.concatenate(([0.0], np.cumsum(close)))
+    ends = np.arange(1, len(close) + 1)
+    starts = ends[None, :] - windows[:, None]
+    means = (csum[ends][None, :] - csum[np.maximum(starts, 0)]) / windows[:, None]
+    means[starts < 0] = np.nan
+    return means
+
+
+def evaluate_positions(positions, returns, cost=0.0):
+    """
+    Metrics of many strategies at once.
+
+    Args:
+        positions: (n_strategies x days) array of positions held at each close
+            (1 long, 0 flat, -1 short).
+        returns: (days,) simple daily returns of the asset; returns[t] is earned
+            by positions[t - 1].
+        cost: Fraction of equity lost per unit of position change.
+
+    Returns:
+        dict: metric name -> (n_strategies,) array.
+    """
+    held = positions[:, :-1]
+    strategy = held * returns[None, 1:]
+    changes = np.abs(np.diff(positions, axis=1, prepend=0))
+    if cost:
+        strategy = strategy - cost * changes[:, :-1]
+
+    log_equity = np.cumsum(np.log1p(strategy), axis=1)
+    peak = np.maximum.accumulate(np.maximum(log_equity, 0.0), axis=1)
+    drawdown = 1.0 - np.exp((log_equity - peak).min(axis=1))
+    years = strategy.shape[1] / TRADING_DAYS
+    total = np.expm1(log_equity[:, -1])
+
+    mean = strategy.mean(axis=1)
+    std = strategy.std(axis=1, ddof=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sharpe = np.where(std > 0, mean / std * np.sqrt(TRADING_DAYS), np.nan)
+    return {
+        'total_return': total,
+        'cagr': np.exp(log_equity[:, -1] / years) - 1.0,
+        'max_drawdown': drawdown,
+        'sharpe': sharpe,
+        'trades': changes.sum(axis=1).astype(np.int64),
+        'exposure': np.abs(held).mean(axis=1),
+    }
+
+
+def grid_search(close, fast=DEFAULT_FAST, slow=DEFAULT_SLOW, cost_bps=0.0, long_short=False):
+    """
+    Backtests every (fast, slow) pair with fast < slow.
+
+    Returns:
+        pd.DataFrame: One row per pair: fast, slow and the METRICS columns.
+    """
+    close = np.asarray(close, dtype=float)
+    close = close[~np.isnan(close)]
+    fast = np.asarray(fast, dtype=np.int64)
+    slow = np.asarray(slow, dtype=np.int64)
+    returns = np.concatenate(([0.0], close[1:] / close[:-1] - 1.0))
+    fast_ma = moving_averages(close, fast)
+    slow_ma = moving_averages(close, slow)
+    short = -1.0 if long_short else 0.0
+
+    blocks = []
+    for i, f in enumerate(fast):
+        rows = np.flatnonzero(slow > f)
+        if not len(rows):
+            continue
+        # NaN comparisons are False, and positions stay flat until the slow MA exists
+        above = fast_ma[i][None, :] > slow_ma[rows]
+        ready = ~np.isnan(slow_ma[rows])
+        positions = np.where(above, 1.0, np.where(ready, short, 0.0))
+        metrics = evaluate_positions(positions, returns, cost_bps / 1e4)
+        blocks.append(pd.DataFrame({'fast': f, 'slow': slow[rows], **metrics}))
+    if not blocks:
+        return pd.DataFrame(columns=['fast', 'slow', *METRICS])
+    return pd.concat(blocks, ignore_index=True)
+
+
+def buy_and_hold(close):
+    """METRICS of holding the asset throughout, for comparison."""
+    close = np.asarray(close, dtype=float)
+    close = close[~np.isnan(close)]
+    returns = np.concatenate(([0.0], close[1:] / close[:-1] - 1.0))
+    metrics = evaluate_positions(np.ones((1, len(close))), returns)
+    return {name: float(values[0]) for name, values in metrics.items()}
+
+
+def _backtest_file(path, fast, slow, cost_bps, long_short, price):
+    # Worker entry point: load one ticker CSV and run the whole grid
+    start = time.perf_counter()
+    ticker = os.path.splitext(os.path.basename(path))[0]
+    close = fill_gaps(read_prices(path, usecols=[price]))[price].to_numpy()
+    results = grid_search(close, fast, slow, cost_bps, long_short)
+    return ticker, results, buy_and_hold(close), time.perf_counter() - start
+
+
+def backtest_many(csv_paths, fast=DEFAULT_FAST, slow=DEFAULT_SLOW, cost_bps=0.0, long_short=False,
+                  price='Close', workers=None):
+    """
+    Runs the grid over every ticker CSV, one ticker per task in a process pool
+    (in-process when workers == 1).
+
+    Returns:
+        dict: ticker -> (grid DataFrame, buy-and-hold metrics, seconds), or
+        (None, error message, None) on failure.
+    """
+    args = (fast, slow, cost_bps, long_short, price)
+    results = {}
+    if workers == 1:
+        for path in csv_paths:
+            ticker, grid, hold, seconds = _backtest_file(path, *args)
+            results[ticker] = (grid, hold, seconds)
+        return results
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_backtest_file, path, *args): path for path in csv_paths}
+        for future in as_completed(futures):
+            ticker = os.path.splitext(os.path.basename(futures[future]))[0]
+            try:
+                ticker, grid, hold, seconds = future.result()
+                results[ticker] = (grid, hold, seconds)
+            except Exception as e:
+                results[ticker] = (None, f"{type(e).__name__}: {e}", None)
+    return results
+
+
+def _window_range(text):
+    # "start:stop[:step]" -> np.arange
+    parts = [int(p) for p in text.split(':')]
+    if not 2 <= len(parts) <= 3:
+        raise argparse.ArgumentTypeError("expected start:stop[:step]")
+    return np.arange(*parts)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grid-search moving-average crossover strategies.")
+    parser.add_argument('csv_files', nargs='+', help="Ticker CSVs in the infy_stock.csv layout")
+    parser.add_argument('--fast', type=_window_range, default=DEFAULT_FAST, help="Fast windows, start:stop[:step]")
+    parser.add_argument('--slow', type=_window_range, default=DEFAULT_SLOW, help="Slow windows, start:stop[:step]")
+    parser.add_argument('--metric', choices=METRICS, default='sharpe', help="Rank pairs by this metric")
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--cost-bps', type=float, default=0.0, help="Cost per unit of position change, in bps")
+    parser.add_argument('--long-short', action='store_true', help="Short instead of flat below the slow MA")
+    parser.add_argument('--price', default='Close', choices=['Close', 'Adj Close'])
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    parser.add_argument('--out', help="Directory for one <ticker>_grid.csv per ticker")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = backtest_many(args.csv_files, args.fast, args.slow, args.cost_bps, args.long_short,
+                            args.price, args.workers)
+    # Drawdown is the one metric where lower is better
+    ascending = args.metric == 'max_drawdown'
+    pd.set_option('display.width', 120)
+    for ticker, (grid, hold, seconds) in sorted(results.items()):
+        if grid is None:
+            print(f"{ticker}: failed - {hold}")
+            continue
+        print(f"\n{ticker}: {len(grid)} (fast, slow) pairs in {seconds:.2f}s")
+        print(grid.sort_values(args.metric, ascending=ascending, kind='stable').head(args.top)
+              .to_string(index=False, float_format=lambda v: f"{v:.4f}"))
+        tut08_pair = grid[(grid['fast'] == SHORT_WINDOW) & (grid['slow'] == LONG_WINDOW)]
+        if len(tut08_pair):
+            row = tut08_pair.iloc[0]
+            print(f"tut08 {SHORT_WINDOW}/{LONG_WINDOW}: sharpe {row['sharpe']:.3f}, "
+                  f"total return {row['total_return']:.2%}, max drawdown {row['max_drawdown']:.2%}")
+        print(f"buy and hold: sharpe {hold['sharpe']:.3f}, total return {hold['total_return']:.2%}, "
+              f"max drawdown {hold['max_drawdown']:.2%}")
+        if args.out:
+            os.makedirs(args.out, exist_ok=True)
+            grid.to_csv(os.path.join(args.out, f"{ticker}_grid.csv"), index=False)
+    print(f"\nBacktested {len(results)} tickers in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Indicator engine for the tut08 stock analytics.
+
+Two ways to get the same indicators tut08.py computes (daily return %, 50/200-day
+moving averages, 30-day volatility and the Bullish/Bearish trend):
+
+* compute_indicators: batch mode, one vectorized pass over NumPy arrays using
+  cumulative sums instead of pandas rolling windows.
+* IndicatorState: incremental mode. Keeps running sums, sums of squares and ring
+  buffers per window, so appending one day's bar updates every indicator in O(1).
+  The state is saved to / loaded from a small JSON file per ticker, so a daily
+  refresh only has to feed the new bars.
+"""
+import json
+import math
+import os
+
+import numpy as np
+
+SHORT_WINDOW = 50
+LONG_WINDOW = 200
+VOLATILITY_WINDOW = 30
+
+
+class RollingWindow:
+    """Fixed-size window with O(1) push, mean and sample standard deviation."""
+
+    def __init__(self, size, values=None):
+        self.size = size
+        self.buffer = [0.0] * size
+        self.pos = 0
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.pushes = 0
+        for value in values or []:
+            self.push(value)
+
+    def push(self, value):
+        value = float(value)
+        if self.count == self.size:
+            old = self.buffer[self.pos]
+            self.total -= old
+            self.total_sq -= old * old
+        else:
+            self.count += 1
+        self.buffer[self.pos] = value
+        self.pos = (self.pos + 1) % self.size
+        self.total += value
+        self.total_sq += value * value
+
+        # Re-sum the buffer once per window length so floating point drift never accumulates
+        self.pushes += 1
+        if self.pushes % self.size == 0:
+            window = self.values()
+            self.total = math.fsum(window)
+            self.total_sq = math.fsum(v * v for v in window)
+
+    def full(self):
+        return self.count == self.size
+
+    def mean(self):
+        return self.total / self.size if self.full() else math.nan
+
+    def std(self):
+        if not self.full() or self.size < 2:
+            return math.nan
+        variance = (self.total_sq - self.total * self.total / self.size) / (self.size - 1)
+        return math.sqrt(max(variance, 0.0))
+
+    def values(self):
+        """Window contents, oldest first."""
+        if self.count < self.size:
+            return self.buffer[:self.count]
+        return self.buffer[self.pos:] + self.buffer[:self.pos]
+
+    def to_dict(self):
+        return {'size': self.size, 'values': self.values()}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data['size'], data['values'])
+
+
+class IndicatorState:
+    """
+    Running indicator state of one ticker.
+
+    Example:
+        state = IndicatorState.load('state/INFY.json')
+        row = state.update('2024-11-04', open_=1790.0, close=1802.5)
+        state.save('state/INFY.json')
+    """
+
+    def __init__(self, short=SHORT_WINDOW, long=LONG_WINDOW, volatility=VOLATILITY_WINDOW):
+        self.short = RollingWindow(short)
+        self.long = RollingWindow(long)
+        self.volatility = RollingWindow(volatility)
+        self.last_date = None
+
+    def update(self, date, open_, close):
+        """
+        Appends one daily bar and returns that day's indicators.
+        Bars at or before the last seen date are rejected so reruns cannot double count.
+        """
+        date = str(date)
+        if self.last_date is not None and date <= self.last_date:
+            raise ValueError(f"Bar for {date} is not after the last processed date {self.last_date}.")
+        self.last_date = date
+
+        for window in (self.short, self.long, self.volatility):
+            window.push(close)
+        short_ma, long_ma = self.short.mean(), self.long.mean()
+        return {
+            'Date': date,
+            'Daily Return (%)': (close - open_) / open_ * 100,
+            f'{self.short.size}-Day MA': short_ma,
+            f'{self.long.size}-Day MA': long_ma,
+            f'{self.volatility.size}-Day Volatility': self.volatility.std(),
+            'Trend': 'Bullish' if short_ma > long_ma else 'Bearish',
+        }
+
+    def to_dict(self):
+        return {
+            'last_date': self.last_date,
+            'short': self.short.to_dict(),
+            'long': self.long.to_dict(),
+            'volatility': self.volatility.to_dict(),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        state = cls.__new__(cls)
+        state.short = RollingWindow.from_dict(data['short'])
+        state.long = RollingWindow.from_dict(data['long'])
+        state.volatility = RollingWindow.from_dict(data['volatility'])
+        state.last_date = data['last_date']
+        return state
+
+    @classmethod
+    def from_history(cls, dates, close, **windows):
+        """Seeds the state from a price history, keeping only the tail each window needs."""
+        state = cls(**windows)
+        close = np.asarray(close, dtype=float)
+        for window in (state.short, state.long, state.volatility):
+            for value in close[-window.size:]:
+                window.push(value)
+        if len(dates):
+            state.last_date = str(dates[-1])
+        return state
+
+    def save(self, path):
+        # Write to a temporary file first so a crash never leaves a half-written state
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.to_dict(), f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        if not os.path.exists(path):
+            return cls()
+        with open(path, 'r') as f:
+            return cls.from_dict(json.load(f))
+
+
+def _window_sums(values, window):
+    # Sums of every trailing window along axis 0 from one cumulative sum (first window - 1 rows dropped)
+    csum = np.cumsum(values, axis=0)
+    csum = np.concatenate([np.zeros((1,) + values.shape[1:]), csum])
+    return csum[window:] - csum[:-window]
+
+
+def rolling_mean(values, window):
+    """
+    Trailing mean over `window` rows along axis 0, for 1-D series or 2-D
+    (dates x tickers) arrays. NaN until the window is full or while it contains a
+    NaN, like pandas rolling(window).mean().
+    """
+    values = np.asarray(values, dtype=float)
+    result = np.full(values.shape, np.nan)
+    if len(values) < window:
+        return result
+    valid = ~np.isnan(values)
+    sums = _window_sums(np.where(valid, values, 0.0), window)
+    counts = _window_sums(valid.astype(float), window)
+    result[window - 1:] = np.where(counts == window, sums / window, np.nan)
+    return result
+
+
+def rolling_std(values, window):
+    """Trailing sample standard deviation (ddof=1, as pandas) from window sums of x and x^2."""
+    values = np.asarray(values, dtype=float)
+    result = np.full(values.shape, np.nan)
+    if len(values) < window or window < 2:
+        return result
+    valid = ~np.isnan(values)
+    # Shifting each series by its mean keeps the sums small and the subtraction accurate
+    n_valid = valid.sum(axis=0)
+    reference = np.where(valid, values, 0.0).sum(axis=0) / np.maximum(n_valid, 1)
+    shifted = np.where(valid, values - reference, 0.0)
+    total = _window_sums(shifted, window)
+    total_sq = _window_sums(shifted * shifted, window)
+    counts = _window_sums(valid.astype(float), window)
+    variance = (total_sq - total * total / window) / (window - 1)
+    result[window - 1:] = np.where(counts == window, np.sqrt(np.maximum(variance, 0.0)), np.nan)
+    return result
+
+
+def compute_indicators(open_, close, short=SHORT_WINDOW, long=LONG_WINDOW, volatility=VOLATILITY_WINDOW):
+    """
+    Batch mode: every indicator of a full history in one vectorized pass.
+
+    Returns:
+        dict: Column name -> NumPy array, with the same names tut08.py uses.
+    """
+    open_ = np.asarray(open_, dtype=float)
+    close = np.asarray(close, dtype=float)
+    short_ma = rolling_mean(close, short)
+    long_ma = rolling_mean(close, long)
+    return {
+        'Daily Return (%)': (close - open_) / open_ * 100,
+        f'{short}-Day MA': short_ma,
+        f'{long}-Day MA': long_ma,
+        f'{volatility}-Day Volatility': rolling_std(close, volatility),
+        'Trend': np.where(short_ma > long_ma, 'Bullish', 'Bearish'),
+    }
+
+
+def add_indicators(df):
+    """Adds the batch indicators as columns of a DataFrame with Open and Close columns."""
+    for name, values in compute_indicators(df['Open'].to_numpy(), df['Close'].to_numpy()).items():
+        df[name] = values
+    return df
+
+
+def refresh_ticker(state_dir, ticker, bars):
+    """
+    Daily refresh of one ticker: loads its saved state, applies the new bars
+    (an iterable of (ISO date, open, close)) and saves the state again.
+
+    Returns:
+        list: One indicator dict per applied bar.
+    """
+    os.makedirs(state_dir, exist_ok=True)
+    path = os.path.join(state_dir, f"{ticker}.json")
+    state = IndicatorState.load(path)
+    rows = []
+    for date, open_, close in bars:
+        # Bars already folded into the state are skipped, so a rerun is harmless
+        if state.last_date is not None and str(date) <= state.last_date:
+            continue
+        rows.append(state.update(date, open_, close))
+    state.save(path)
+    return rows
@@ -0,0 +1,105 @@
+"""
+Typed CSV ingestion for daily price data in the infy_stock.csv layout.
+
+* Explicit compact dtypes (float32 prices, nullable Int64 volume) and dates
+  parsed during the read, with Yahoo-style 'null' cells read as missing instead
+  of turning whole columns into object dtype.
+* Chunked streaming reads for files too large to load at once.
+* Vectorized gap reporting (runs of rows with missing values) and forward
+  filling, replacing the deprecated fillna(method='ffill').
+"""
+import numpy as np
+import pandas as pd
+
+PRICE_DTYPES = {
+    'Open': np.float32,
+    'High': np.float32,
+    'Low': np.float32,
+    'Close': np.float32,
+    'Adj Close': np.float32,
+    'Volume': 'Int64',
+}
+NA_VALUES = ['null', 'NULL', 'NaN', 'nan', '']
+DEFAULT_CHUNKSIZE = 1_000_000
+
+
+def _read_kwargs(usecols):
+    columns = list(PRICE_DTYPES) if usecols is None else [c for c in usecols if c != 'Date']
+    return dict(
+        usecols=['Date'] + columns,
+        dtype={c: PRICE_DTYPES[c] for c in columns if c in PRICE_DTYPES},
+        na_values=NA_VALUES,
+        keep_default_na=False,
+        parse_dates=['Date'],
+        index_col='Date',
+    )
+
+
+def read_prices(path, usecols=None):
+    """Reads a whole price CSV into a Date-indexed DataFrame with compact dtypes."""
+    return pd.read_csv(path, **_read_kwargs(usecols))
+
+
+def iter_price_chunks(path, chunksize=DEFAULT_CHUNKSIZE, usecols=None):
+    """Yields Date-indexed chunks of at most chunksize rows with compact dtypes."""
+    with pd.read_csv(path, chunksize=chunksize, **_read_kwargs(usecols)) as reader:
+        yield from reader
+
+
+def find_gaps(df):
+    """
+    Runs of consecutive rows with at least one missing value.
+
+    Returns:
+        pd.DataFrame: start, end (dates) and rows of every gap, in order.
+    """
+    missing = df.isna().any(axis=1).to_numpy()
+    if not missing.any():
+        return pd.DataFrame({'start': pd.Series(dtype=df.index.dtype),
+                             'end': pd.Series(dtype=df.index.dtype),
+                             'rows': pd.Series(dtype=np.int64)})
+    # Rising and falling edges of the missing mask delimit each run
+    edges = np.diff(np.concatenate(([0], missing.astype(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1) - 1
+    return pd.DataFrame({'start': df.index[starts], 'end': df.index[ends], 'rows': ends - starts + 1})
+
+
+def fill_gaps(df):
+    """Forward-fills missing values (leading gaps with nothing before them stay missing)."""
+    return df.ffill()
+
+
+def load_prices(path, usecols=None):
+    """
+    Reads, gap-reports and forward-fills a price CSV in one call.
+
+    Returns:
+        tuple: (filled DataFrame, gaps DataFrame)
+    """
+    df = read_prices(path, usecols)
+    return fill_gaps(df), find_gaps(df)
+
+
+def stream_prices(path, chunksize=DEFAULT_CHUNKSIZE, usecols=None):
+    """
+    Streams a large price file in chunks, forward-filling across chunk boundaries.
+
+    Yields:
+        tuple: (filled chunk, gaps found in that chunk). A gap that continues from
+        the previous chunk is reported again starting at this chunk's first row.
+    """
+    carry = None
+    for chunk in iter_price_chunks(path, chunksize, usecols):
+        gaps = find_gaps(chunk)
+        filled = fill_gaps(chunk)
+        if carry is not None:
+            filled = filled.fillna(carry)
+        if len(filled):
+            carry = filled.iloc[-1]
+        yield filled, gaps
+
+
+def memory_usage(df):
+    """Total bytes used by a DataFrame, index included."""
+    return int(df.memory_usage(index=True, deep=True).sum())
@@ -0,0 +1,243 @@
+"""
+Columnar, memory-mapped price store for many tickers.
+
+Ticker CSVs in the infy_stock.csv layout (Date, Open, High, Low, Close, Adj Close,
+Volume) are ingested once into one .npy file per field, shaped
+(dates, tickers) on a shared sorted date index. Gaps are NaN, and present.npy
+marks the dates each ticker's own CSV has. Analytics open the files with
+mmap_mode='r' and work on blocks of tickers as 2-D array operations, so 2,000
+tickers x 25 years never has to be fully in memory.
+
+Usage:
+    python price_store.py ingest <store_dir> <csv files...>
+    python price_store.py analyze <store_dir>
+"""
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from ingest import fill_gaps, read_prices
+from indicators import LONG_WINDOW, SHORT_WINDOW, VOLATILITY_WINDOW, rolling_mean, rolling_std
+
+PRICE_FIELDS = ['Open', 'High', 'Low', 'Close', 'Adj Close', 'Volume']
+FIELD_DTYPES = {'Volume': np.float64}  # float so gaps can be NaN; prices are float32
+# Tickers rolled together; the window sums are memory-bound, and a (dates x 16)
+# slice of 25 years stays in cache where a (dates x 256) one does not
+COMPUTE_COLUMNS = 16
+
+
+def _field_file(root, field):
+    return os.path.join(root, field.replace(' ', '_').replace('/', '_') + '.npy')
+
+
+def _present_file(root):
+    return os.path.join(root, 'present.npy')
+
+
+def ingest(csv_paths, root, fields=PRICE_FIELDS):
+    """
+    Builds a store from ticker CSVs (ticker name = file name without extension).
+    Pass 1 reads only the Date columns to build the aligned date index; pass 2
+    writes each ticker's columns straight into the memory-mapped arrays.
+
+    Returns:
+        PriceStore: The opened store.
+    """
+    os.makedirs(root, exist_ok=True)
+    tickers = [os.path.splitext(os.path.basename(path))[0] for path in csv_paths]
+
+    all_dates = [pd.read_csv(path, usecols=['Date'], parse_dates=['Date'])['Date'].to_numpy('datetime64[D]')
+                 for path in csv_paths]
+    dates = np.unique(np.concatenate(all_dates)) if all_dates else np.array([], dtype='datetime64[D]')
+    np.save(os.path.join(root, 'dates.npy'), dates)
+
+    arrays = {
+        field: np.lib.format.open_memmap(_field_file(root, field), mode='w+',
+                                         dtype=FIELD_DTYPES.get(field, np.float32),
+                                         shape=(len(dates), len(tickers)))
+        for field in fields
+    }
+    present = np.lib.format.open_memmap(_present_file(root), mode='w+', dtype=np.bool_,
+                                        shape=(len(dates), len(tickers)))
+    for array in arrays.values():
+        array[:] = np.nan
+    present[:] = False
+
+    for col, (path, ticker_dates) in enumerate(zip(csv_paths, all_dates)):
+        df = read_prices(path, usecols=fields)
+        rows = np.searchsorted(dates, ticker_dates)
+        present[rows, col] = True
+        for field in fields:
+            arrays[field][rows, col] = df[field].to_numpy(dtype=float, na_value=np.nan)
+
+    for array in [*arrays.values(), present]:
+        array.flush()
+    with open(os.path.join(root, 'meta.json'), 'w') as f:
+        json.dump({'tickers': tickers, 'fields': list(fields), 'analytics': []}, f)
+    return PriceStore(root)
+
+
+class PriceStore:
+    """Read access to an ingested store. Fields are (dates, tickers) memory maps."""
+
+    def __init__(self, root):
+        self.root = root
+        with open(os.path.join(root, 'meta.json'), 'r') as f:
+            self.meta = json.load(f)
+        self.tickers = self.meta['tickers']
+        self.dates = np.load(os.path.join(root, 'dates.npy'))
+        self._columns = {ticker: i for i, ticker in enumerate(self.tickers)}
+
+    def __getitem__(self, field):
+        return np.load(_field_file(self.root, field), mmap_mode='r')
+
+    def fields(self):
+        return self.meta['fields'] + self.meta['analytics']
+
+    def present(self):
+        """(dates, tickers) mask of the dates each ticker's CSV has."""
+        if os.path.exists(_present_file(self.root)):
+            return np.load(_present_file(self.root), mmap_mode='r')
+        # Stores ingested before present.npy existed: any field set
+        return ~np.all([np.isnan(self[field]) for field in self.meta['fields']], axis=0)
+
+    def ticker(self, name, fields=None):
+        """One ticker's columns on its own dates, as a Date-indexed DataFrame like tut08.py loads it."""
+        col = self._columns[name]
+        rows = np.flatnonzero(self.present()[:, col])
+        data = {field: np.asarray(self[field][rows, col]) for field in (fields or self.fields())}
+        return pd.DataFrame(data, index=pd.DatetimeIndex(self.dates[rows], name='Date'))
+
+    def blocks(self, block_size):
+        """Yields slices covering the ticker axis in blocks of block_size columns."""
+        for start in range(0, len(self.tickers), block_size):
+            yield slice(start, min(start + block_size, len(self.tickers)))
+
+
+def _indicators(open_, close, short, long, volatility):
+    # Same steps as tut08.py: forward-fill the ticker's own rows, then roll
+    open_ = fill_gaps(pd.DataFrame(open_)).to_numpy(dtype=float)
+    close = fill_gaps(pd.DataFrame(close)).to_numpy(dtype=float)
+    short_ma = rolling_mean(close, short)
+    long_ma = rolling_mean(close, long)
+    return [(close - open_) / open_ * 100, short_ma, long_ma, rolling_std(close, volatility), short_ma > long_ma]
+
+
+def _ragged_indicators(open_, close, own, short, long, volatility):
+    # Ticker-major (tickers x dates) in and out, each ticker on its own dates:
+    # its rows are packed to the front of its row with boolean-mask gathers, the
+    # whole slice is rolled at once, and the results are scattered back.
+    # Absent dates end up NaN / False
+    packed = None
+    if not own.all():
+        counts = own.sum(axis=1)
+        packed = np.arange(counts.max(initial=0))[None, :] < counts[:, None]
+
+        def pack(values):
+            compact = np.full(packed.shape, np.nan)
+            compact[packed] = values[own]
+            return compact
+
+        open_, close = pack(open_), pack(close)
+
+    results = []
+    # The transposes are views: the rolling functions run down dates (axis 0), one contiguous ticker each
+    for values in _indicators(open_.T, close.T, short, long, volatility):
+        values = values.T
+        if packed is not None:
+            result = np.full(own.shape, False if values.dtype == np.bool_ else np.nan, dtype=values.dtype)
+            result[own] = values[packed]
+            values = result
+        results.append(values)
+    return results
+
+
+def analyze(store, block_size=256, short=SHORT_WINDOW, long=LONG_WINDOW, volatility=VOLATILITY_WINDOW):
+    """
+    Computes daily return %, the short/long moving averages, rolling volatility
+    and the Bullish flag for every ticker, as 2-D operations over blocks of tickers.
+    Results are written back into the store as memory-mapped fields.
+
+    Windows run over each ticker's own forward-filled rows, as in tut08.py.
+    Ragged tickers (listed later, or skipping dates) take the same 2-D path:
+    their own rows are compacted before rolling and scattered back afterwards.
+    Dates a ticker does not have stay NaN (False for Bullish). block_size
+    tickers are read and written at a time, and rolled COMPUTE_COLUMNS at a time.
+    """
+    shape = (len(store.dates), len(store.tickers))
+    names = ['Daily Return (%)', f'{short}-Day MA', f'{long}-Day MA', f'{volatility}-Day Volatility', 'Bullish']
+    out = {name: np.lib.format.open_memmap(_field_file(store.root, name), mode='w+',
+                                           dtype=np.bool_ if name == 'Bullish' else np.float32, shape=shape)
+           for name in names}
+
+    open_, close, present = store['Open'], store['Close'], store.present()
+    for cols in store.blocks(block_size):
+        # Ticker-major copies, so every ticker's history is contiguous
+        o = np.ascontiguousarray(np.asarray(open_[:, cols], dtype=float).T)
+        c = np.ascontiguousarray(np.asarray(close[:, cols], dtype=float).T)
+        p = np.ascontiguousarray(np.asarray(present[:, cols]).T)
+        block = [np.empty(o.shape, dtype=np.bool_ if name == 'Bullish' else float) for name in names]
+        for start in range(0, len(o), COMPUTE_COLUMNS):
+            part = slice(start, start + COMPUTE_COLUMNS)
+            for result, values in zip(block, _ragged_indicators(o[part], c[part], p[part],
+                                                                short, long, volatility)):
+                result[part] = values
+
+        for name, result in zip(names, block):
+            out[name][:, cols] = result.T
+
+    for array in out.values():
+        array.flush()
+    store.meta['analytics'] = names
+    with open(os.path.join(store.root, 'meta.json'), 'w') as f:
+        json.dump(store.meta, f)
+    return store
+
+
+def summarize(store, block_size=256):
+    """
+    Per-ticker statistics tut08.py prints for one ticker (average / median daily
+    return, std of closing prices) plus the latest trend, for every ticker at once.
+    """
+    rows = []
+    returns, close, bullish = store['Daily Return (%)'], store['Close'], store['Bullish']
+    for cols in store.blocks(block_size):
+        r = np.asarray(returns[:, cols], dtype=float)
+        c = np.asarray(close[:, cols], dtype=float)
+        rows.append(pd.DataFrame({
+            'Ticker': store.tickers[cols],
+            'Average Daily Return (%)': np.nanmean(r, axis=0),
+            'Median Daily Return (%)': np.nanmedian(r, axis=0),
+            'Std Dev of Close': np.nanstd(c, axis=0, ddof=1),
+            'Trend': np.where(bullish[-1, cols], 'Bullish', 'Bearish'),
+        }))
+    return pd.concat(rows, ignore_index=True) if rows else pd.DataFrame()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory-mapped multi-ticker price store.")
+    sub = parser.add_subparsers(dest='command', required=True)
+    ingest_parser = sub.add_parser('ingest', help="Ingest ticker CSVs into a store")
+    ingest_parser.add_argument('store_dir')
+    ingest_parser.add_argument('csv_files', nargs='+')
+    analyze_parser = sub.add_parser('analyze', help="Compute analytics for every ticker of a store")
+    analyze_parser.add_argument('store_dir')
+    analyze_parser.add_argument('--block-size', type=int, default=256)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.command == 'ingest':
+        store = ingest(args.csv_files, args.store_dir)
+        print(f"Ingested {len(store.tickers)} tickers x {len(store.dates)} dates in {time.perf_counter() - start:.2f}s")
+    else:
+        store = analyze(PriceStore(args.store_dir), args.block_size)
+        print(summarize(store).to_string(index=False))
+        print(f"\nAnalyzed {len(store.tickers)} tickers in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,161 @@
+"""
+Trend-regime segmentation for the 50/200-day moving-average crossover.
+
+Instead of a per-row Trend label that is filtered again for every question, the
+crossover series is run-length encoded once into intervals (start, end, regime,
+return) with a vectorized diff over the regime codes. RegimeIndex keeps those
+intervals sorted by date, so "regime at a date" and "crossovers in a range" are
+binary searches and "longest bull run" is precomputed.
+"""
+import numpy as np
+import pandas as pd
+
+from indicators import LONG_WINDOW, SHORT_WINDOW
+
+REGIME_NAMES = {True: 'Bullish', False: 'Bearish'}
+
+
+def segment_regimes(dates, short_ma, long_ma, close):
+    """
+    Run-length encodes the crossover series. Rows where either moving average is
+    still undefined (the warm-up period) or missing belong to no regime.
+
+    Returns:
+        dict: Parallel arrays start, end (dates), start_row, end_row, bullish,
+        rows and return_pct (close-to-close return over the interval).
+    """
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    short_ma = np.asarray(short_ma, dtype=float)
+    long_ma = np.asarray(long_ma, dtype=float)
+    close = np.asarray(close, dtype=float)
+
+    # 1 = bullish, 0 = bearish, -1 = undefined
+    codes = np.where(np.isnan(short_ma) | np.isnan(long_ma), -1, (short_ma > long_ma).astype(np.int8))
+    if len(codes) == 0:
+        starts = ends = np.array([], dtype=np.int64)
+    else:
+        changed = np.flatnonzero(np.diff(codes) != 0) + 1
+        starts = np.concatenate(([0], changed))
+        ends = np.concatenate((changed - 1, [len(codes) - 1]))
+        defined = codes[starts] != -1
+        starts, ends = starts[defined], ends[defined]
+
+    return {
+        'start': dates[starts],
+        'end': dates[ends],
+        'start_row': starts,
+        'end_row': ends,
+        'bullish': codes[starts] == 1 if len(starts) else np.array([], dtype=bool),
+        'rows': ends - starts + 1,
+        'return_pct': (close[ends] / close[starts] - 1) * 100 if len(starts) else np.array([], dtype=float),
+    }
+
+
+class RegimeIndex:
+    """
+    Queryable regime intervals of one ticker.
+
+    Example:
+        index = RegimeIndex.from_frame(df)
+        index.regime_at('2008-10-01')        # 'Bearish'
+        index.longest('Bullish')             # the longest bull run as a dict
+        index.crossovers('2010', '2015')     # DataFrame of crossovers in the range
+    """
+
+    def __init__(self, intervals):
+        self.intervals = intervals
+        self.start = intervals['start']
+        self.end = intervals['end']
+        self.bullish = intervals['bullish']
+        lengths = intervals['rows']
+        # A crossover is an interval whose regime differs from the previous one
+        self._crossings = np.flatnonzero(self.bullish[1:] != self.bullish[:-1]) + 1
+        self._crossing_dates = self.start[self._crossings]
+        self._longest = {}
+        for flag in (True, False):
+            candidates = np.flatnonzero(self.bullish == flag)
+            if len(candidates):
+                self._longest[flag] = int(candidates[np.argmax(lengths[candidates])])
+
+    @classmethod
+    def from_frame(cls, df, short=SHORT_WINDOW, long=LONG_WINDOW):
+        """Builds the index from a Date-indexed DataFrame with Close and the moving-average columns."""
+        return cls(segment_regimes(df.index, df[f'{short}-Day MA'], df[f'{long}-Day MA'], df['Close']))
+
+    def __len__(self):
+        return len(self.start)
+
+    def _interval(self, i):
+        return {
+            'start': pd.Timestamp(self.start[i]),
+            'end': pd.Timestamp(self.end[i]),
+            'regime': REGIME_NAMES[bool(self.bullish[i])],
+            'rows': int(self.intervals['rows'][i]),
+            'return_pct': float(self.intervals['return_pct'][i]),
+        }
+
+    def _locate(self, date):
+        # Index of the last interval starting at or before date, or -1
+        return int(np.searchsorted(self.start, np.datetime64(pd.Timestamp(date)), side='right')) - 1
+
+    def regime_at(self, date):
+        """'Bullish' / 'Bearish' on a date, or None outside every regime."""
+        i = self._locate(date)
+        if i < 0 or np.datetime64(pd.Timestamp(date)) > self.end[i]:
+            return None
+        return REGIME_NAMES[bool(self.bullish[i])]
+
+    def interval_at(self, date):
+        """The full interval containing a date, or None."""
+        i = self._locate(date)
+        if i < 0 or np.datetime64(pd.Timestamp(date)) > self.end[i]:
+            return None
+        return self._interval(i)
+
+    def longest(self, regime='Bullish'):
+        """The longest interval of a regime (in trading days), or None."""
+        i = self._longest.get(regime == 'Bullish')
+        return None if i is None else self._interval(i)
+
+    def crossovers(self, start=None, end=None):
+        """Crossovers (regime changes) dated within [start, end]."""
+        dates = self._crossing_dates
+        lo = 0 if start is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(start)), side='left')
+        hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(pd.Timestamp(end)), side='right')
+        positions = self._crossings[lo:hi]
+        return pd.DataFrame({
+            'Date': self.start[positions],
+            'Crossover': np.where(self.bullish[positions], 'Golden Cross', 'Death Cross'),
+            'Regime': np.where(self.bullish[positions], 'Bullish', 'Bearish'),
+        })
+
+    def to_frame(self):
+        """All intervals as a DataFrame."""
+        return pd.DataFrame({
+            'Start': self.start,
+            'End': self.end,
+            'Regime': np.where(self.bullish, 'Bullish', 'Bearish'),
+            'Trading Days': self.intervals['rows'],
+            'Return (%)': self.intervals['return_pct'],
+        })
+
+    def save(self, path):
+        np.savez_compressed(path, **self.intervals)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path) as data:
+            return cls({key: data[key] for key in data.files})
+
+
+def build_store_indexes(store, short=SHORT_WINDOW, long=LONG_WINDOW):
+    """RegimeIndex for every ticker of an analyzed PriceStore (see price_store.py)."""
+    short_ma, long_ma, close = store[f'{short}-Day MA'], store[f'{long}-Day MA'], store['Close']
+    present = store.present()
+    indexes = {}
+    for col, ticker in enumerate(store.tickers):
+        # Only the ticker's own dates, so dates it does not trade do not split its regimes
+        rows = np.flatnonzero(present[:, col])
+        indexes[ticker] = RegimeIndex(segment_regimes(store.dates[rows], short_ma[rows, col],
+                                                      long_ma[rows, col], close[rows, col]))
+    return indexes
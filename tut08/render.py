@@ -0,0 +1,220 @@
+"""
+Headless chart rendering for tut08 reports.
+
+Draws the same four charts as tut08.py (closing price, candlesticks, moving
+averages, volatility) plus the bullish/bearish trend chart, but:
+
+* writes PNG/SVG files with the Agg backend instead of calling plt.show(),
+* downsamples line series to about one point per horizontal pixel with LTTB
+  (largest-triangle-three-buckets) or min/max bucket decimation,
+* resamples candlesticks to weekly/monthly OHLC so at most max_candles are drawn,
+* renders many tickers in parallel worker processes.
+
+Usage:
+    python render.py <csv files...> [-o OUTPUT_DIR] [--format png|svg] [-j WORKERS]
+"""
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from indicators import add_indicators
+from ingest import fill_gaps, read_prices
+
+DPI = 100
+WIDTH_PX = 1400
+MAX_CANDLES = 300
+
+
+def _pyplot():
+    # Select the non-interactive backend before pyplot is imported, so rendering never blocks
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Largest-triangle-three-buckets downsampling. Keeps the first and last point
+    and, per bucket, the point forming the largest triangle with the previously
+    kept point and the average of the next bucket.
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(int)
+    kept = np.empty(n_out, dtype=int)
+    kept[0], kept[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        kept[i + 1] = a
+    return kept
+
+
+def minmax_indices(y, n_buckets):
+    """Keeps the minimum and maximum of every bucket, so no spike is lost."""
+    y = np.asarray(y, dtype=float)
+    n = len(y)
+    if 2 * n_buckets >= n:
+        return np.arange(n)
+    edges = np.linspace(0, n, n_buckets + 1).astype(int)
+    kept = []
+    for start, end in zip(edges[:-1], edges[1:]):
+        bucket = y[start:end]
+        kept.extend((start + int(np.argmin(bucket)), start + int(np.argmax(bucket))))
+    return np.unique(kept)
+
+
+def decimate(series, n_out=WIDTH_PX, method='lttb'):
+    """Downsamples a Date-indexed Series to about n_out points, ignoring NaNs."""
+    series = series.dropna()
+    if len(series) <= n_out:
+        return series
+    if method == 'minmax':
+        kept = minmax_indices(series.to_numpy(), n_out // 2)
+    else:
+        x = series.index.to_numpy().astype('datetime64[D]').astype(np.int64)
+        kept = lttb_indices(x, series.to_numpy(), n_out)
+    return series.iloc[kept]
+
+
+def resample_ohlc(df, max_candles=MAX_CANDLES):
+    """Daily bars resampled to weekly, then monthly, OHLC until at most max_candles remain."""
+    if len(df) <= max_candles:
+        return df
+    agg = {'Open': 'first', 'High': 'max', 'Low': 'min', 'Close': 'last', 'Volume': 'sum'}
+    for rule in ('W', 'ME', 'QE', 'YE'):
+        resampled = df[list(agg)].resample(rule).agg(agg).dropna(subset=['Open'])
+        if len(resampled) <= max_candles:
+            return resampled
+    return resampled
+
+
+def render_ticker(df, output_dir, ticker, fmt='png', width_px=WIDTH_PX, method='lttb'):
+    """
+    Writes every chart of one ticker. df must be Date-indexed with the tut08
+    columns; indicator columns are added when missing.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    plt = _pyplot()
+    if 'Trend' not in df.columns:
+        df = add_indicators(df.copy())
+    os.makedirs(output_dir, exist_ok=True)
+    figsize = (width_px / DPI, 6)
+    n_out = width_px
+    paths = []
+
+    def save(fig, name):
+        path = os.path.join(output_dir, f"{ticker}_{name}.{fmt}")
+        fig.savefig(path, dpi=DPI, format=fmt)
+        plt.close(fig)
+        paths.append(path)
+
+    close = decimate(df['Close'], n_out, method)
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.plot(close, label='Closing Price')
+    ax.set(title=f'{ticker} Closing Price Over Time', xlabel='Date', ylabel='Closing Price')
+    ax.legend()
+    save(fig, 'close')
+
+    import mplfinance as mpf
+    ohlc = resample_ohlc(df)
+    path = os.path.join(output_dir, f"{ticker}_candlestick.{fmt}")
+    mpf.plot(ohlc, type='candle', style='charles', volume=True, title=f'{ticker} Candlestick Chart',
+             figsize=figsize, savefig=dict(fname=path, dpi=DPI, format=fmt), closefig=True)
+    paths.append(path)
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.plot(close, label='Closing Price', alpha=0.5)
+    ax.plot(decimate(df['50-Day MA'], n_out, method), label='50-Day Moving Average', color='green')
+    ax.plot(decimate(df['200-Day MA'], n_out, method), label='200-Day Moving Average', color='red')
+    ax.set(title='50-Day and 200-Day Moving Averages', xlabel='Date', ylabel='Price')
+    ax.legend()
+    save(fig, 'moving_averages')
+
+    fig, ax = plt.subplots(figsize=figsize)
+    ax.plot(decimate(df['30-Day Volatility'], n_out, 'minmax'), label='30-Day Volatility', color='orange')
+    ax.set(title='Stock Price Volatility (30-Day Rolling Std)', xlabel='Date', ylabel='Volatility')
+    ax.legend()
+    save(fig, 'volatility')
+
+    # One fill per regime over the decimated close, masked with the trend at the kept dates
+    bullish = (df['Trend'] == 'Bullish').reindex(close.index).to_numpy()
+    fig, ax = plt.subplots(figsize=(width_px / DPI, 7))
+    ax.fill_between(close.index, close.to_numpy(), where=bullish, color='green', alpha=0.3, label='Bullish')
+    ax.fill_between(close.index, close.to_numpy(), where=~bullish, color='red', alpha=0.3, label='Bearish')
+    ax.set(title="Bullish and Bearish Trends in Stock Price", xlabel="Date", ylabel="Stock Price")
+    ax.legend()
+    save(fig, 'trend')
+    return paths
+
+
+def _render_file(path, output_dir, fmt, width_px, method):
+    # Worker entry point: load, compute indicators and render one ticker CSV
+    start = time.perf_counter()
+    ticker = os.path.splitext(os.path.basename(path))[0]
+    df = fill_gaps(read_prices(path))
+    paths = render_ticker(df, output_dir, ticker, fmt, width_px, method)
+    return ticker, paths, time.perf_counter() - start
+
+
+def render_many(csv_paths, output_dir, fmt='png', width_px=WIDTH_PX, method='lttb', workers=None):
+    """
+    Renders every ticker CSV in parallel worker processes.
+
+    Returns:
+        dict: ticker -> (written paths, seconds), or (None, error message) on failure.
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(_render_file, path, output_dir, fmt, width_px, method): path for path in csv_paths}
+        for future in as_completed(futures):
+            ticker = os.path.splitext(os.path.basename(futures[future]))[0]
+            try:
+                ticker, paths, seconds = future.result()
+                results[ticker] = (paths, seconds)
+            except Exception as e:
+                results[ticker] = (None, f"{type(e).__name__}: {e}")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render tut08 charts to files without a display.")
+    parser.add_argument('csv_files', nargs='+', help="Ticker CSVs in the infy_stock.csv layout")
+    parser.add_argument('-o', '--output-dir', default='charts')
+    parser.add_argument('--format', choices=['png', 'svg'], default='png')
+    parser.add_argument('--width', type=int, default=WIDTH_PX, help="Chart width in pixels")
+    parser.add_argument('--method', choices=['lttb', 'minmax'], default='lttb', help="Line decimation method")
+    parser.add_argument('-j', '--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = render_many(args.csv_files, args.output_dir, args.format, args.width, args.method, args.workers)
+    for ticker, (paths, info) in sorted(results.items()):
+        if paths is None:
+            print(f"{ticker}: failed - {info}")
+        else:
+            print(f"{ticker}: {len(paths)} charts in {info:.2f}s")
+    print(f"Rendered {len(results)} tickers in {time.perf_counter() - start:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import os
+
+import numpy as np
+import pytest
+
+from indicators import LONG_WINDOW, SHORT_WINDOW, VOLATILITY_WINDOW, IndicatorState, add_indicators
+from ingest import fill_gaps, read_prices
+
+INFY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'infy_stock.csv')
+COLUMNS = [f'{SHORT_WINDOW}-Day MA', f'{LONG_WINDOW}-Day MA', f'{VOLATILITY_WINDOW}-Day Volatility']
+
+
+@pytest.fixture
+def prices():
+    # What tut08.py loads
+    return fill_gaps(read_prices(INFY))
+
+
+def pandas_rolling(df):
+    close = df['Close'].astype(float)
+    return {
+        'Daily Return (%)': (df['Close'] - df['Open']) / df['Open'] * 100,
+        COLUMNS[0]: close.rolling(window=SHORT_WINDOW).mean(),
+        COLUMNS[1]: close.rolling(window=LONG_WINDOW).mean(),
+        COLUMNS[2]: close.rolling(window=VOLATILITY_WINDOW).std(),
+    }
+
+
+def test_add_indicators_matches_pandas_rolling(prices):
+    expected = pandas_rolling(prices)
+    got = add_indicators(prices.copy())
+    for column, values in expected.items():
+        np.testing.assert_allclose(got[column].to_numpy(dtype=float), values.to_numpy(dtype=float),
+                                   rtol=1e-6, atol=1e-6, equal_nan=True, err_msg=column)
+    trend = np.where(expected[COLUMNS[0]] > expected[COLUMNS[1]], 'Bullish', 'Bearish')
+    np.testing.assert_array_equal(got['Trend'].to_numpy(), trend)
+
+
+def test_indicator_state_matches_pandas_rolling(prices):
+    # Seed from all but the last 100 bars, then stream those one day at a time
+    expected = pandas_rolling(prices)
+    split = len(prices) - 100
+    dates = prices.index.strftime('%Y-%m-%d')
+    state = IndicatorState.from_history(dates[:split], prices['Close'].to_numpy()[:split])
+    for i in range(split, len(prices)):
+        row = state.update(dates[i], float(prices['Open'].iloc[i]), float(prices['Close'].iloc[i]))
+        for column, values in expected.items():
+            assert row[column] == pytest.approx(float(values.iloc[i]), rel=1e-6, abs=1e-6), (dates[i], column)
@@ -0,0 +1,60 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from indicators import LONG_WINDOW, SHORT_WINDOW, VOLATILITY_WINDOW
+from ingest import fill_gaps, read_prices
+from price_store import analyze, ingest
+
+COLUMNS = [f'{SHORT_WINDOW}-Day MA', f'{LONG_WINDOW}-Day MA', f'{VOLATILITY_WINDOW}-Day Volatility']
+
+
+def tut08_frame(path):
+    # What tut08.py computes for one ticker
+    df = fill_gaps(read_prices(path))
+    df['Daily Return (%)'] = (df['Close'] - df['Open']) / df['Open'] * 100
+    df[COLUMNS[0]] = df['Close'].rolling(window=SHORT_WINDOW).mean()
+    df[COLUMNS[1]] = df['Close'].rolling(window=LONG_WINDOW).mean()
+    df[COLUMNS[2]] = df['Close'].rolling(window=VOLATILITY_WINDOW).std()
+    return df
+
+
+def assert_matches_tut08(store, ticker, path):
+    expected = tut08_frame(path)
+    got = store.ticker(ticker)
+    assert got.index.equals(expected.index)
+    for column in ['Daily Return (%)', *COLUMNS]:
+        np.testing.assert_allclose(got[column].to_numpy(dtype=float), expected[column].to_numpy(dtype=float),
+                                   rtol=1e-4, atol=1e-4, equal_nan=True, err_msg=column)
+    bullish = (expected[COLUMNS[0]] > expected[COLUMNS[1]]).to_numpy()
+    np.testing.assert_array_equal(got['Bullish'].to_numpy(), bullish)
+
+
+@pytest.fixture
+def tickers(tmp_path):
+    infy = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'infy_stock.csv')
+    # A ticker on a different calendar: every third date of infy
+    sparse = tmp_path / 'sparse.csv'
+    prices = pd.read_csv(infy)
+    prices.iloc[::3].to_csv(sparse, index=False)
+    # Listed later, and missing some days
+    late = tmp_path / 'late.csv'
+    prices.iloc[3000:].to_csv(late, index=False)
+    holes = tmp_path / 'holes.csv'
+    prices.drop(index=prices.index[np.random.default_rng(0).random(len(prices)) < 0.05]).to_csv(holes, index=False)
+    return {'infy_stock': infy, 'sparse': str(sparse), 'late': str(late), 'holes': str(holes)}
+
+
+def test_analyze_matches_tut08_per_ticker(tickers, tmp_path):
+    store = analyze(ingest(list(tickers.values()), str(tmp_path / 'store')), block_size=1)
+    for ticker, path in tickers.items():
+        assert_matches_tut08(store, ticker, path)
+
+
+def test_analyze_ragged_block(tickers, tmp_path):
+    store = analyze(ingest(list(tickers.values()), str(tmp_path / 'store')), block_size=256)
+    for ticker, path in tickers.items():
+        assert_matches_tut08(store, ticker, path)
+    assert store.ticker('sparse')[COLUMNS[1]].notna().any()
@@ -1,98 +1,157 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import mplfinance as mpf
-
-# Load the dataset
-df = pd.read_csv('infy_stock.csv')
-
-# Convert the 'Date' column to datetime format
-df['Date'] = pd.to_datetime(df['Date'])
-
-# Set 'Date' as the index
-df.set_index('Date', inplace=True)
-
-# Display the first 10 rows of the dataset
-print("First 10 rows of the dataset:")
-print(df.head(10))
-
-# Check for missing values and handle them
-print("\nMissing values in each column:")
-print(df.isnull().sum())
-df.fillna(method='ffill', inplace=True)
-
-# Plot the closing price over time
-plt.figure(figsize=(10, 6))
-plt.plot(df['Close'], label='Closing Price')
-plt.title('Closing Price Over Time')
-plt.xlabel('Date')
-plt.ylabel('Closing Price')
-plt.legend()
-plt.show()
-
-# Plot a candlestick chart using mplfinance
-mpf.plot(df, type='candle', style='charles', volume=True, title='Candlestick Chart')
-
-# Calculate the daily return percentage
-df['Daily Return (%)'] = ((df['Close'] - df['Open']) / df['Open']) * 100
-
-# Statistical Analysis
-average_return = df['Daily Return (%)'].mean()
-median_return = df['Daily Return (%)'].median()
-std_dev_close = df['Close'].std()
-
-print(f"\nAverage Daily Return: {average_return:.2f}%")
-print(f"Median Daily Return: {median_return:.2f}%")
-print(f"Standard Deviation of Closing Prices: {std_dev_close:.2f}")
-
-# Calculate the 50-day and 200-day moving averages
-df['50-Day MA'] = df['Close'].rolling(window=50).mean()
-df['200-Day MA'] = df['Close'].rolling(window=200).mean()
-
-# Plot the moving averages
-plt.figure(figsize=(10, 6))
-plt.plot(df['Close'], label='Closing Price', alpha=0.5)
-plt.plot(df['50-Day MA'], label='50-Day Moving Average', color='green')
-plt.plot(df['200-Day MA'], label='200-Day Moving Average', color='red')
-plt.title('50-Day and 200-Day Moving Averages')
-plt.xlabel('Date')
-plt.ylabel('Price')
-plt.legend()
-plt.show()
-
-# Volatility analysis using rolling standard deviation (30-day window)
-df['30-Day Volatility'] = df['Close'].rolling(window=30).std()
-
-plt.figure(figsize=(10, 6))
-plt.plot(df['30-Day Volatility'], label='30-Day Volatility', color='orange')
-plt.title('Stock Price Volatility (30-Day Rolling Std)')
-plt.xlabel('Date')
-plt.ylabel('Volatility')
-plt.legend()
-plt.show()
-
-# Identify bullish and bearish trends based on moving averages
-df['Trend'] = np.where(df['50-Day MA'] > df['200-Day MA'], 'Bullish', 'Bearish')
-
-# Filter bullish and bearish periods
-bullish = df[df['Trend'] == 'Bullish']
-bearish = df[df['Trend'] == 'Bearish']
-
-# Plot bullish and bearish trends with fill_between
-plt.figure(figsize=(14, 7))
-
-# Bullish periods
-plt.fill_between(bullish.index, df.loc[bullish.index, 'Close'], color='green', alpha=0.3, label='Bullish')
-
-# Bearish periods
-plt.fill_between(bearish.index, df.loc[bearish.index, 'Close'], color='red', alpha=0.3, label='Bearish')
-
-# Adding labels and titles
-plt.title("Bullish and Bearish Trends in Stock Price")
-plt.xlabel("Date")
-plt.ylabel("Stock Price")
-plt.legend()
-
-# Show the plot
-plt.show()
+"""
+Stock analysis of infy_stock.csv: statistics, moving averages, volatility and
+bullish/bearish regimes, with charts.
+
+The daily return, moving averages, volatility and trend come from the
+indicator engine (indicators.compute_indicators, one cumulative-sum pass; see
+IndicatorState there for daily incremental updates).
+
+matplotlib and mplfinance are only imported when a chart is drawn, so
+`python tut08.py --no-plots` (analytics only, e.g. on a headless machine) never
+loads them.
+
+Usage:
+    python tut08.py [infy_stock.csv] [--no-plots]
+"""
+import argparse
+
+from indicators import add_indicators
+from ingest import fill_gaps, find_gaps, read_prices
+from regimes import RegimeIndex
+
+
+def _pyplot():
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def load_prices(path):
+    # Load the dataset with compact dtypes and 'Date' parsed as the index
+    df = read_prices(path)
+
+    # Display the first 10 rows of the dataset
+    print("First 10 rows of the dataset:")
+    print(df.head(10))
+
+    # Check for missing values and handle them
+    print("\nMissing values in each column:")
+    print(df.isnull().sum())
+    print("\nGaps (consecutive rows with missing values):")
+    print(find_gaps(df))
+    return fill_gaps(df)
+
+
+def plot_close(df):
+    # Plot the closing price over time
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
+    plt.plot(df['Close'], label='Closing Price')
+    plt.title('Closing Price Over Time')
+    plt.xlabel('Date')
+    plt.ylabel('Closing Price')
+    plt.legend()
+    plt.show()
+
+
+def plot_candles(df):
+    # Plot a candlestick chart using mplfinance
+    import mplfinance as mpf
+    mpf.plot(df, type='candle', style='charles', volume=True, title='Candlestick Chart')
+
+
+def print_statistics(df):
+    # Statistical Analysis
+    average_return = df['Daily Return (%)'].mean()
+    median_return = df['Daily Return (%)'].median()
+    std_dev_close = df['Close'].std()
+
+    print(f"\nAverage Daily Return: {average_return:.2f}%")
+    print(f"Median Daily Return: {median_return:.2f}%")
+    print(f"Standard Deviation of Closing Prices: {std_dev_close:.2f}")
+
+
+def plot_moving_averages(df):
+    # Plot the moving averages
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
+    plt.plot(df['Close'], label='Closing Price', alpha=0.5)
+    plt.plot(df['50-Day MA'], label='50-Day Moving Average', color='green')
+    plt.plot(df['200-Day MA'], label='200-Day Moving Average', color='red')
+    plt.title('50-Day and 200-Day Moving Averages')
+    plt.xlabel('Date')
+    plt.ylabel('Price')
+    plt.legend()
+    plt.show()
+
+
+def plot_volatility(df):
+    plt = _pyplot()
+    plt.figure(figsize=(10, 6))
+    plt.plot(df['30-Day Volatility'], label='30-Day Volatility', color='orange')
+    plt.title('Stock Price Volatility (30-Day Rolling Std)')
+    plt.xlabel('Date')
+    plt.ylabel('Volatility')
+    plt.legend()
+    plt.show()
+
+
+def print_regimes(df):
+    # Segment the crossover series into bullish/bearish intervals once
+    regimes = RegimeIndex.from_frame(df)
+    longest_bull = regimes.longest('Bullish')
+    if longest_bull:
+        print(f"\nLongest bullish run: {longest_bull['start']:%Y-%m-%d} to {longest_bull['end']:%Y-%m-%d} "
+              f"({longest_bull['rows']} trading days, {longest_bull['return_pct']:.2f}% return)")
+    print(f"Number of crossovers: {len(regimes.crossovers())}")
+
+
+def plot_trends(df):
+    # Plot bullish and bearish trends with fill_between
+    plt = _pyplot()
+    plt.figure(figsize=(14, 7))
+    bullish = (df['Trend'] == 'Bullish').to_numpy()
+
+    # Bullish periods
+    plt.fill_between(df.index, df['Close'], where=bullish, color='green', alpha=0.3, label='Bullish')
+
+    # Bearish periods
+    plt.fill_between(df.index, df['Close'], where=~bullish, color='red', alpha=0.3, label='Bearish')
+
+    # Adding labels and titles
+    plt.title("Bullish and Bearish Trends in Stock Price")
+    plt.xlabel("Date")
+    plt.ylabel("Stock Price")
+    plt.legend()
+
+    # Show the plot
+    plt.show()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse a daily OHLCV stock CSV.")
+    parser.add_argument('path', nargs='?', default='infy_stock.csv')
+    parser.add_argument('--no-plots', action='store_true', help="Analytics only; matplotlib is never imported")
+    args = parser.parse_args()
+    plots = not args.no_plots
+
+    df = load_prices(args.path)
+    if plots:
+        plot_close(df)
+        plot_candles(df)
+
+    # Daily return %, the 50/200-day moving averages, 30-day volatility (rolling
+    # standard deviation) and the Bullish/Bearish trend, in one pass
+    df = add_indicators(df)
+    print_statistics(df)
+
+    if plots:
+        plot_moving_averages(df)
+        plot_volatility(df)
+
+    print_regimes(df)
+    if plots:
+        plot_trends(df)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Persisted attendance store with query API.
+
+process_attendance() in tut09.py writes the per-(roll, class date) check-in
+counts here as well as to the coloured workbook. Questions like "who is below
+75%?", "how does attendance move week by week?" or "how many proxies on each
+date?" are then answered by SQLite from indexed and pre-aggregated tables,
+without re-reading the raw CSV.
+
+Tables:
+* attendance(roll, date, records): one row per student and class date,
+  with the number of check-ins (0 for absent). Keyed by (roll, date), with an
+  index on (date, roll).
+* student_totals: per student, the same totals as the workbook's last columns
+  plus pct, with an index on pct for threshold queries.
+* date_totals: per class date (and ISO week), present/full/partial/proxy counts.
+
+Records are read as the workbook reads them: 2 is full attendance, 1 is
+partial and counts as a proxy, and more than 2 is a proxy marked as 3. So
+student_totals.marked equals the workbook's "Total Attendance Marked".
+pct = 100 * sum(min(records, 2)) / (2 * classes taken).
+
+Usage:
+    python attendance_store.py below 75 [--store attendance.sqlite]
+    python attendance_store.py student 2201CB05
+    python attendance_store.py trend [--by week|date]
+    python attendance_store.py proxies
+"""
+import argparse
+import os
+import sqlite3
+from datetime import datetime
+
+DEFAULT_STORE = 'attendance.sqlite'
+SCHEMA = """
+CREATE TABLE students (roll TEXT PRIMARY KEY, name TEXT) WITHOUT ROWID;
+CREATE TABLE classes (date TEXT PRIMARY KEY, week TEXT) WITHOUT ROWID;
+CREATE TABLE attendance (roll TEXT, date TEXT, records INTEGER, PRIMARY KEY (roll, date)) WITHOUT ROWID;
+CREATE INDEX attendance_date ON attendance (date, roll);
+"""
+# Pre-aggregated once the base tables are filled
+AGGREGATES = """
+CREATE TABLE student_totals AS
+    SELECT a.roll, s.name,
+           COUNT(*) AS classes,
+           SUM(a.records > 0) AS days_attended,
+           SUM(MIN(a.records, 3)) AS marked,
+           2 * SUM(a.records > 0) AS allowed,
+           SUM(a.records = 1 OR a.records > 2) AS proxies,
+           ROUND(100.0 * SUM(MIN(a.records, 2)) / (2 * COUNT(*)), 2) AS pct
+    FROM attendance a JOIN students s USING (roll)
+    GROUP BY a.roll;
+CREATE INDEX student_totals_pct ON student_totals (pct);
+CREATE TABLE date_totals AS
+    SELECT a.date, c.week,
+           SUM(a.records > 0) AS present,
+           SUM(a.records = 2) AS full,
+           SUM(a.records = 1) AS partial,
+           SUM(a.records = 1 OR a.records > 2) AS proxies,
+           COUNT(*) AS students,
+           SUM(MIN(a.records, 2)) AS marks
+    FROM attendance a JOIN classes c USING (date)
+    GROUP BY a.date;
+"""
+
+
+def _iso_date(date):
+    # Class dates are DD/MM/YYYY in python_dates.txt; ISO dates sort correctly
+    return datetime.strptime(date, "%d/%m/%Y").strftime("%Y-%m-%d")
+
+
+def write_store(path, students, class_dates, counts):
+    """
+    Writes the store atomically (temp file, then rename).
+
+    Args:
+        students (dict): roll -> name.
+        class_dates (list): Class dates as DD/MM/YYYY.
+        counts: (roll, DD/MM/YYYY date, number of check-ins) tuples; missing
+            (roll, date) pairs are stored as 0.
+    """
+    records = {(roll, _iso_date(date)): n for roll, date, n in counts}
+    classes = [(_iso_date(d), datetime.strptime(d, "%d/%m/%Y").strftime("%G-W%V")) for d in class_dates]
+    rows = [(roll, date, records.get((roll, date), 0)) for roll in sorted(students) for date, _ in classes]
+
+    tmp_path = f"{path}.tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    conn = sqlite3.connect(tmp_path)
+    try:
+        conn.executescript(SCHEMA)
+        conn.executemany("INSERT INTO students VALUES (?, ?)", students.items())
+        conn.executemany("INSERT INTO classes VALUES (?, ?)", classes)
+        conn.executemany("INSERT INTO attendance VALUES (?, ?, ?)", rows)
+        conn.executescript(AGGREGATES)
+        conn.commit()
+    finally:
+        conn.close()
+    os.replace(tmp_path, path)
+
+
+class AttendanceStore:
+    """
+    Read-only queries over a store written by write_store().
+
+    Example:
+        store = AttendanceStore('attendance.sqlite')
+        store.below(75)          # students under 75%, lowest first
+        store.student('2201CB05')
+        store.trend('week')
+    """
+
+    def __init__(self, path=DEFAULT_STORE):
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"{path} not found; run tut09.py to build it")
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        self.conn.row_factory = sqlite3.Row
+
+    def close(self):
+        self.conn.close()
+
+    def _all(self, sql, params=()):
+        return [dict(row) for row in self.conn.execute(sql, params)]
+
+    def below(self, threshold=75.0):
+        """Students whose pct is below threshold, lowest first (a range scan of the pct index)."""
+        return self._all("SELECT * FROM student_totals WHERE pct < ? ORDER BY pct, roll", (threshold,))
+
+    def student(self, roll):
+        """
+        Returns:
+            dict: The student's totals plus 'dates', a list of {date, records}
+            rows; None for an unknown roll.
+        """
+        totals = self._all("SELECT * FROM student_totals WHERE roll = ?", (roll.upper(),))
+        if not totals:
+            return None
+        dates = self._all("SELECT date, records FROM attendance WHERE roll = ? ORDER BY date", (roll.upper(),))
+        return {**totals[0], 'dates': dates}
+
+    def trend(self, by='week'):
+        """Attendance per week or per class date: present, full, partial, proxies and pct of possible marks."""
+        if by not in ('week', 'date'):
+            raise ValueError("by must be 'week' or 'date'")
+        return self._all(f"""
+            SELECT {by}, COUNT(*) AS classes, SUM(present) AS present, SUM(full) AS full,
+                   SUM(partial) AS partial, SUM(proxies) AS proxies,
+                   ROUND(100.0 * SUM(marks) / (2 * SUM(students)), 2) AS pct
+            FROM date_totals GROUP BY {by} ORDER BY {by}""")
+
+    def proxies_per_date(self):
+        return self._all("SELECT date, proxies FROM date_totals ORDER BY date")
+
+
+def _print_rows(rows, columns=None):
+    if not rows:
+        print("(no rows)")
+        return
+    columns = columns or list(rows[0])
+    widths = [max(len(str(c)), *(len(str(r[c])) for r in rows)) for c in columns]
+    print("  ".join(str(c).ljust(w) for c, w in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(w) for c, w in zip(columns, widths)))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query the attendance store written by tut09.py.")
+    parser.add_argument('--store', default=DEFAULT_STORE)
+    sub = parser.add_subparsers(dest='command', required=True)
+    below = sub.add_parser('below', help="Students below an attendance percentage")
+    below.add_argument('threshold', type=float, nargs='?', default=75.0)
+    student = sub.add_parser('student', help="One student's totals and per-date record")
+    student.add_argument('roll')
+    trend = sub.add_parser('trend', help="Attendance per week or per date")
+    trend.add_argument('--by', choices=['week', 'date'], default='week')
+    sub.add_parser('proxies', help="Proxy count per class date")
+    args = parser.parse_args()
+
+    store = AttendanceStore(args.store)
+    try:
+        if args.command == 'below':
+            _print_rows(store.below(args.threshold))
+        elif args.command == 'student':
+            record = store.student(args.roll)
+            if record is None:
+                print(f"{args.roll}: not in the store")
+                return
+            dates = record.pop('dates')
+            _print_rows([record])
+            print()
+            _print_rows(dates)
+        elif args.command == 'trend':
+            _print_rows(store.trend(args.by))
+        else:
+            _print_rows(store.proxies_per_date())
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
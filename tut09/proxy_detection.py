@@ -0,0 +1,191 @@
+"""
+Time-window proxy detection over attendance check-ins.
+
+process_attendance() in tut09.py only counts records per (roll, date), and
+more than 2 counts as a proxy. This stage looks at the time of each check-in.
+The records are sorted once by (date, time), then every check is a linear scan
+of that order:
+
+* outside_window: a check-in on a class date, but outside class_timing (with
+  some grace before and after), or on a date with no class.
+* duplicate: the same roll again within duplicate_seconds of its previous
+  check-in. The rolls are regrouped with a stable sort, so each roll's
+  check-ins stay in time order and only neighbours need comparing.
+* cluster: cluster_size or more different rolls checked in within
+  cluster_seconds of each other. A two-pointer sliding window keeps a count
+  of each roll inside the window, and overlapping windows are merged into
+  one cluster.
+
+The whole stage is O(n log n) for the sort plus O(n) for the scans.
+
+Usage:
+    python proxy_detection.py [input_attendance.csv] [--dates python_dates.txt]
+                              [--duplicate-seconds 3] [--cluster-seconds 2] [--cluster-size 6]
+                              [--out proxy_flags.csv]
+"""
+import argparse
+import re
+from collections import Counter
+
+import numpy as np
+import pandas as pd
+
+from tut09 import read_dates
+
+TIMESTAMP_FORMAT = "%d/%m/%Y %H:%M:%S"
+DEFAULT_TIMING = ("18:00", "20:00")
+
+
+def read_class_timing(dates_file):
+    """
+    Reads the 'class_timing = HH:MM - HH:MM' line of the dates file.
+
+    Returns:
+        tuple: (start, end) in seconds since midnight.
+    """
+    start, end = DEFAULT_TIMING
+    with open(dates_file, 'r') as f:
+        for line in f:
+            if "class_timing" in line:
+                match = re.search(r'(\d{1,2}:\d{2})\s*-\s*(\d{1,2}:\d{2})', line)
+                if match:
+                    start, end = match.groups()
+    return _seconds(start), _seconds(end)
+
+
+def _seconds(hh_mm):
+    hours, minutes = hh_mm.split(':')
+    return int(hours) * 3600 + int(minutes) * 60
+
+
+def load_checkins(attendance_file):
+    """
+    Check-ins sorted by time, with parsed columns: roll, date (DD/MM/YYYY) and
+    seconds (since midnight).
+    """
+    df = pd.read_csv(attendance_file)
+    stamps = pd.to_datetime(df['Timestamp'], format=TIMESTAMP_FORMAT)
+    df['roll'] = df['Roll'].str.split().str[0].str.upper()
+    df['date'] = stamps.dt.strftime("%d/%m/%Y")
+    df['seconds'] = (stamps.dt.hour * 3600 + stamps.dt.minute * 60 + stamps.dt.second).astype(np.int64)
+    df['_stamp'] = stamps
+    # The one sort everything below relies on; stable, so equal times keep file order
+    df = df.sort_values('_stamp', kind='stable').drop(columns='_stamp').reset_index(drop=True)
+    return df
+
+
+def outside_window(checkins, class_dates, timing, early_grace=15 * 60, late_grace=15 * 60):
+    """Boolean mask of check-ins on non-class dates or outside [start - early_grace, end + late_grace]."""
+    start, end = timing
+    seconds = checkins['seconds'].to_numpy()
+    on_class_date = checkins['date'].isin(class_dates).to_numpy()
+    in_window = (seconds >= start - early_grace) & (seconds <= end + late_grace)
+    return ~(on_class_date & in_window)
+
+
+def duplicates(checkins, duplicate_seconds=3):
+    """
+    Boolean mask of check-ins that repeat their roll's previous check-in (on the
+    same date) within duplicate_seconds.
+    """
+    roll_codes = pd.factorize(checkins['roll'])[0]
+    date_codes = pd.factorize(checkins['date'])[0]
+    # Stable regroup of the time-sorted records: by (date, roll), still in time order
+    order = np.lexsort((roll_codes, date_codes))
+    seconds = checkins['seconds'].to_numpy()[order]
+    same_group = (roll_codes[order][1:] == roll_codes[order][:-1]) & (date_codes[order][1:] == date_codes[order][:-1])
+    repeat = same_group & (np.diff(seconds) <= duplicate_seconds)
+    mask = np.zeros(len(checkins), dtype=bool)
+    mask[order[1:][repeat]] = True
+    return mask
+
+
+def clusters(checkins, cluster_seconds=2, cluster_size=6):
+    """
+    Bursts of at least cluster_size different rolls within cluster_seconds,
+    found with a two-pointer sliding window over the time-sorted check-ins of
+    each date.
+
+    Returns:
+        list: (first, last) row ranges (inclusive) of the merged clusters.
+    """
+    dates = checkins['date'].to_numpy()
+    seconds = checkins['seconds'].to_numpy()
+    rolls = checkins['roll'].to_numpy()
+    found = []
+    in_window = Counter()
+    left = 0
+    for right in range(len(seconds)):
+        if right and dates[right] != dates[right - 1]:
+            in_window.clear()
+            left = right
+        in_window[rolls[right]] += 1
+        while seconds[right] - seconds[left] > cluster_seconds:
+            in_window[rolls[left]] -= 1
+            if not in_window[rolls[left]]:
+                del in_window[rolls[left]]
+            left += 1
+        if len(in_window) >= cluster_size:
+            if found and left <= found[-1][1]:
+                found[-1][1] = right   # overlaps the previous window: extend that cluster
+            else:
+                found.append([left, right])
+    return [tuple(c) for c in found]
+
+
+def detect_proxies(attendance_file, dates_file, duplicate_seconds=3, cluster_seconds=2, cluster_size=6,
+                   early_grace=15 * 60, late_grace=15 * 60):
+    """
+    Runs every check over the attendance file.
+
+    Returns:
+        pd.DataFrame: One row per flagged check-in: Timestamp, Roll, roll, date,
+        and the flags that apply (outside_window, duplicate, cluster as
+        booleans; cluster_id numbers the bursts, -1 if none).
+    """
+    classes_taken_dates, _, _ = read_dates(dates_file)
+    checkins = load_checkins(attendance_file)
+    timing = read_class_timing(dates_file)
+
+    checkins['outside_window'] = outside_window(checkins, classes_taken_dates, timing, early_grace, late_grace)
+    checkins['duplicate'] = duplicates(checkins, duplicate_seconds)
+    cluster_id = np.full(len(checkins), -1, dtype=np.int64)
+    for i, (first, last) in enumerate(clusters(checkins, cluster_seconds, cluster_size)):
+        cluster_id[first:last + 1] = i
+    checkins['cluster'] = cluster_id >= 0
+    checkins['cluster_id'] = cluster_id
+
+    flagged = checkins['outside_window'] | checkins['duplicate'] | checkins['cluster']
+    return checkins[flagged].drop(columns='seconds').reset_index(drop=True)
+
+
+def summarize(flags):
+    """Flag counts per roll, most flagged first."""
+    per_roll = flags.groupby('roll')[['outside_window', 'duplicate', 'cluster']].sum()
+    per_roll['total'] = per_roll.sum(axis=1)
+    return per_roll.sort_values('total', ascending=False, kind='stable')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Flag suspicious attendance check-ins by time.")
+    parser.add_argument('attendance', nargs='?', default='input_attendance.csv')
+    parser.add_argument('--dates', default='python_dates.txt')
+    parser.add_argument('--duplicate-seconds', type=int, default=3)
+    parser.add_argument('--cluster-seconds', type=int, default=2)
+    parser.add_argument('--cluster-size', type=int, default=6)
+    parser.add_argument('--grace-minutes', type=int, default=15)
+    parser.add_argument('--out', default='proxy_flags.csv')
+    args = parser.parse_args()
+
+    grace = args.grace_minutes * 60
+    flags = detect_proxies(args.attendance, args.dates, args.duplicate_seconds, args.cluster_seconds,
+                           args.cluster_size, grace, grace)
+    flags.to_csv(args.out, index=False)
+    print(f"{len(flags)} flagged check-ins: {int(flags['outside_window'].sum())} outside the class window, "
+          f"{int(flags['duplicate'].sum())} duplicates, "
+          f"{flags.loc[flags['cluster'], 'cluster_id'].nunique()} clusters ({int(flags['cluster'].sum())} check-ins). Written to {args.out}")
+    print(summarize(flags).head(10))
+
+
+if __name__ == "__main__":
+    main()
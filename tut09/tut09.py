@@ -4,6 +4,8 @@ from openpyxl import Workbook
 from openpyxl.styles import PatternFill
 from datetime import datetime
 
+from attendance_store import DEFAULT_STORE, write_store
+
 # Function to read the dates from the file
 def read_dates(file_path):
     classes_taken_dates, classes_missed_dates, exams_dates = [], [], []
@@ -26,7 +28,7 @@ def extract_date(timestamp):
     return datetime.strptime(timestamp, "%d/%m/%Y %H:%M:%S").strftime("%d/%m/%Y")
 
 # Function to process the attendance and generate the Excel file
-def process_attendance(attendance_file, stud_list_file, dates_file):
+def process_attendance(attendance_file, stud_list_file, dates_file, store_path=DEFAULT_STORE):
     # Load attendance data and student list
     df_attendance = pd.read_csv(attendance_file)
     with open(stud_list_file, 'r') as f:
@@ -53,6 +55,9 @@ def process_attendance(attendance_file, stud_list_file, dates_file):
     # Get the total number of classes conducted
     total_classes_conducted = len(classes_taken_dates)
 
+    # (roll, date, records) for the attendance store
+    counts = []
+
     # Populate the worksheet with student data
     for roll, name in students.items():
         row = [f"{roll} {name}"]
@@ -64,6 +69,7 @@ def process_attendance(attendance_file, stud_list_file, dates_file):
             # Extract date from attendance timestamp and compare with the class date
             attendance_records = df_attendance[(df_attendance['Roll'].str.contains(roll)) & 
                                                (df_attendance['Timestamp'].apply(extract_date) == date)]
+            counts.append((roll, date, len(attendance_records)))
             if len(attendance_records) == 0:
                 row.append(0)  # Absent
             elif len(attendance_records) == 1:
@@ -107,6 +113,10 @@ def process_attendance(attendance_file, stud_list_file, dates_file):
     # Save the workbook to an Excel file
     wb.save("output_excel_updated.xlsx")
 
+    # The same counts, queryable without Excel (python attendance_store.py --help)
+    if store_path:
+        write_store(store_path, students, classes_taken_dates, counts)
+
 # Main function
 def main():
     attendance_file = 'input_attendance.csv'
@@ -114,6 +124,11 @@ def main():
     dates_file = 'python_dates.txt'  
     process_attendance(attendance_file, stud_list_file, dates_file)
 
+    # Time-based checks the per-day counts cannot see (imported here: proxy_detection imports this module)
+    from proxy_detection import detect_proxies
+    flags = detect_proxies(attendance_file, dates_file)
+    flags.to_csv("proxy_flags.csv", index=False)
+
 # main function
 if __name__ == "__main__":
     main()
@@ -0,0 +1,141 @@
+"""
+Headless batch grading for a directory of course workbooks.
+
+Every workbook is graded with the same grading core the Streamlit apps use
+(grading.process_workbook), in parallel across a process pool.
+
+Usage:
+    python batch_grade.py <input_dir> [-o OUTPUT_DIR] [-j WORKERS]
+
+Writes, into the output directory:
+    <course>_graded.xlsx       graded students, summary and grade statistics for every course
+    grade_distribution.csv     grade counts of every course, one row per course
+    batch_report.csv           per-file status, student count, timing and error
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from grading import GRADES, process_workbook
+from grading.export import grade_sheets, write_excel
+
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def find_workbooks(input_dir):
+    """Returns the sorted .xlsx paths of a directory, skipping Excel lock files."""
+    return sorted(
+        os.path.join(input_dir, name)
+        for name in os.listdir(input_dir)
+        if name.lower().endswith('.xlsx') and not name.startswith('~$')
+    )
+
+
+def grade_workbook(path, output_dir):
+    """
+    Grades one workbook and writes its output. Runs inside a worker process, so
+    every failure is caught and returned as part of the result instead of raised.
+
+    Returns:
+        dict: course, file, status, students, seconds, error and one count per grade.
+    """
+    course = os.path.splitext(os.path.basename(path))[0]
+    result = {'course': course, 'file': path, 'status': 'ok', 'students': 0, 'seconds': 0.0, 'error': ''}
+    start = time.perf_counter()
+    try:
+        df_with_grades, stats_df, summary_df = process_workbook(path)
+
+        output_file = os.path.join(output_dir, f"{course}_graded.xlsx")
+        write_excel(grade_sheets(df_with_grades, summary_df, stats_df), output_file)
+
+        counts = df_with_grades['Grade'].value_counts()
+        result['students'] = len(df_with_grades)
+        for grade in GRADES:
+            result[grade] = int(counts.get(grade, 0))
+    except Exception as e:
+        result['status'] = 'failed'
+        result['error'] = f"{type(e).__name__}: {e}"
+        result['traceback'] = traceback.format_exc()
+    result['seconds'] = round(time.perf_counter() - start, 4)
+    return result
+
+
+def run_batch(input_dir, output_dir, workers=None):
+    """
+    Grades every workbook of input_dir in a process pool. A failing workbook is
+    logged and reported but never aborts the rest of the batch.
+
+    Returns:
+        list: The per-file result dicts, in input order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    paths = find_workbooks(input_dir)
+    if not paths:
+        logger.warning("No .xlsx workbooks found in %s", input_dir)
+        return []
+
+    logger.info("Grading %d workbooks with %s workers", len(paths), workers or os.cpu_count())
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(grade_workbook, path, output_dir): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                # The worker itself died (e.g. killed or out of memory)
+                result = {'course': os.path.splitext(os.path.basename(path))[0], 'file': path,
+                          'status': 'failed', 'students': 0, 'seconds': 0.0,
+                          'error': f"{type(e).__name__}: {e}"}
+            if result['status'] == 'ok':
+                logger.info("%s: %d students graded in %.3fs", result['course'], result['students'], result['seconds'])
+            else:
+                logger.error("%s: failed after %.3fs - %s", result['course'], result['seconds'], result['error'])
+                if result.get('traceback'):
+                    logger.debug(result['traceback'])
+            results[path] = result
+
+    ordered = [results[path] for path in paths]
+    write_reports(ordered, output_dir)
+    return ordered
+
+
+def write_reports(results, output_dir):
+    """Writes the consolidated grade distribution and the per-file timing report."""
+    graded = [r for r in results if r['status'] == 'ok']
+    distribution = pd.DataFrame(graded, columns=['course', 'students'] + GRADES)
+    if not distribution.empty:
+        totals = distribution[['students'] + GRADES].sum()
+        distribution.loc[len(distribution)] = ['Total'] + totals.tolist()
+    distribution.to_csv(os.path.join(output_dir, "grade_distribution.csv"), index=False)
+
+    report = pd.DataFrame(results, columns=['course', 'file', 'status', 'students', 'seconds', 'error'])
+    report.to_csv(os.path.join(output_dir, "batch_report.csv"), index=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Grade a directory of course workbooks without the Streamlit UI.")
+    parser.add_argument("input_dir", help="Directory containing the course .xlsx workbooks")
+    parser.add_argument("-o", "--output-dir", default="graded_output", help="Where outputs and reports are written")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_batch(args.input_dir, args.output_dir, args.workers)
+    failed = [r for r in results if r['status'] != 'ok']
+    logger.info("Finished %d workbooks in %.2fs (%d failed)", len(results), time.perf_counter() - start, len(failed))
+    for r in failed:
+        logger.info("  failed: %s - %s", r['file'], r['error'])
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
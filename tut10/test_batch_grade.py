@@ -0,0 +1,36 @@
+import os
+
+import pandas as pd
+from openpyxl import load_workbook
+
+from batch_grade import find_workbooks, run_batch
+from grading import GRADES
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def test_batch_over_sample_workbooks(tmp_path):
+    results = run_batch(HERE, str(tmp_path), workers=2)
+    assert [r['file'] for r in results] == find_workbooks(HERE)
+    assert all(r['status'] == 'ok' for r in results), [r['error'] for r in results]
+    courses = {r['course'] for r in results}
+    assert {'Input Output', 'Input-1 Lab 10', 'Output-1'} <= courses
+
+    for r in results:
+        workbook = load_workbook(tmp_path / f"{r['course']}_graded.xlsx", read_only=True)
+        assert workbook.sheetnames == ['Grade_Sorted', 'Roll_Sorted', 'Summary', 'Grade_Statistics']
+        graded = list(workbook['Grade_Sorted'].values)
+        by_roll = list(workbook['Roll_Sorted'].values)
+        assert len(graded) == len(by_roll) == r['students'] + 1
+        grade_col = graded[0].index('Grade')
+        grades = [row[grade_col] for row in graded[1:]]
+        assert set(grades) <= set(GRADES)
+        assert sum(r[grade] for grade in GRADES) == r['students']
+        rolls = [row[graded[0].index('Roll')] for row in by_roll[1:]]
+        assert rolls == sorted(rolls, key=str)
+
+    distribution = pd.read_csv(tmp_path / "grade_distribution.csv")
+    assert distribution['course'].iloc[-1] == 'Total'
+    assert distribution['students'].iloc[-1] == sum(r['students'] for r in results)
+    report = pd.read_csv(tmp_path / "batch_report.csv")
+    assert (report['status'] == 'ok').all()